@@ -13,16 +13,30 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtGui import (
     QPainter, QPen, QColor, QImage, QPixmap, QFont, QFontDatabase,
-    QLinearGradient, QBrush, QRadialGradient, QIcon, QDesktopServices
+    QLinearGradient, QBrush, QRadialGradient, QIcon, QDesktopServices,
+    QPainterPath, QFontMetrics
 )
 from PyQt5.QtCore import (
-    Qt, QPoint, QRect, QSize, QTimer, QRunnable, QThreadPool,
+    Qt, QPoint, QRect, QRectF, QSize, QTimer, QRunnable, QThreadPool,
     pyqtSignal, QObject, QThread, QUrl
 )
+import colorsys
+import functools
+import threading
+import array
+import queue
+from collections import deque, namedtuple, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait as futures_wait
 import psutil
 import GPUtil
 import json
 
+# NumPy为可选依赖：仅用于向量化的批量计算（如一次性查找表构建），缺失时自动回退纯Python实现
+try:
+    import numpy as np
+except Exception:
+    np = None
+
 # Windows下全局隐藏子进程控制台窗口（抑制可能由第三方库如GPUtil触发的黑色弹窗）
 try:
     if os.name == 'nt':
@@ -106,6 +120,20 @@ class Logger:
             'CRITICAL': 50
         }
         self.current_level = self.levels['INFO']  # 默认级别
+
+        # 异步写入：日志条目先进有界队列，由守护线程批量落盘，
+        # 调用方（包括高频工作线程）不再承担打开/写入/轮转的文件IO
+        self._log_queue = queue.Queue(maxsize=4096)
+        self._dropped_logs = 0
+        # 内存中维护当前文件大小，轮转判断不再每次stat磁盘
+        try:
+            self._bytes_written = os.path.getsize(self.log_path)
+        except OSError:
+            self._bytes_written = 0
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
+        # 时间戳按秒缓存：同一秒内的多条日志复用同一格式化结果
+        self._ts_cache = (0, '')
         
     def _ensure_log_dir(self):
         """确保日志目录存在"""
@@ -116,25 +144,35 @@ class Logger:
             print(f"创建日志目录失败: {e}")
     
     def _rotate_logs(self):
-        """日志轮转，防止单个文件过大"""
+        """日志轮转，防止单个文件过大。
+        以内存字节计数做阈值判断，未达阈值时零系统调用；
+        备份重命名链用try/except FileNotFoundError替代先exists再操作的双重stat。"""
+        if self._bytes_written <= self.max_file_size:
+            return
         try:
-            if os.path.exists(self.log_path) and os.path.getsize(self.log_path) > self.max_file_size:
-                # 删除最旧的备份文件
-                oldest_backup = os.path.join(self.log_dir, f"{self.log_file}.{self.backup_count}")
-                if os.path.exists(oldest_backup):
-                    os.remove(oldest_backup)
-                
-                # 重命名现有备份文件
-                for i in range(self.backup_count - 1, 0, -1):
-                    old_backup = os.path.join(self.log_dir, f"{self.log_file}.{i}")
-                    new_backup = os.path.join(self.log_dir, f"{self.log_file}.{i+1}")
-                    if os.path.exists(old_backup):
-                        os.rename(old_backup, new_backup)
-                
-                # 重命名当前日志文件为备份1
-                backup_1 = os.path.join(self.log_dir, f"{self.log_file}.1")
-                if os.path.exists(self.log_path):
-                    os.rename(self.log_path, backup_1)
+            # 删除最旧的备份文件
+            oldest_backup = os.path.join(self.log_dir, f"{self.log_file}.{self.backup_count}")
+            try:
+                os.remove(oldest_backup)
+            except FileNotFoundError:
+                pass
+            
+            # 重命名现有备份文件
+            for i in range(self.backup_count - 1, 0, -1):
+                old_backup = os.path.join(self.log_dir, f"{self.log_file}.{i}")
+                new_backup = os.path.join(self.log_dir, f"{self.log_file}.{i+1}")
+                try:
+                    os.rename(old_backup, new_backup)
+                except FileNotFoundError:
+                    pass
+            
+            # 重命名当前日志文件为备份1
+            backup_1 = os.path.join(self.log_dir, f"{self.log_file}.1")
+            try:
+                os.rename(self.log_path, backup_1)
+            except FileNotFoundError:
+                pass
+            self._bytes_written = 0
         except Exception as e:
             print(f"日志轮转失败: {e}")
     
@@ -142,14 +180,18 @@ class Logger:
         """设置日志级别"""
         if level_name in self.levels:
             self.current_level = self.levels[level_name]
+
+    def isEnabledFor(self, level_name):
+        """判断某级别日志是否会被输出，供调用方跳过昂贵的消息构造"""
+        return self.current_level <= self.levels.get(level_name, 0)
     
     def _write_log(self, level, msg, exc_info=None):
-        """写入日志的核心方法"""
+        """写入日志的核心方法：仅格式化并入队，落盘由写线程完成"""
         try:
-            self._rotate_logs()
-            
-            timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
-            log_entry = f"[{timestamp}] [{level}] {msg}"
+            sec = int(time.time())
+            if sec != self._ts_cache[0]:
+                self._ts_cache = (sec, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sec)))
+            log_entry = f"[{self._ts_cache[1]}] [{level}] {msg}"
             
             if exc_info:
                 import traceback
@@ -159,21 +201,47 @@ class Logger:
                     tb_str = ''.join(traceback.format_exc())
                 log_entry += f"\n{tb_str}"
             
-            with open(self.log_path, 'a', encoding='utf-8') as f:
-                f.write(log_entry + '\n')
+            try:
+                self._log_queue.put_nowait(log_entry)
+            except queue.Full:
+                # 队列满时丢弃而非阻塞调用线程
+                self._dropped_logs += 1
                 
         except Exception as e:
             print(f"写入日志失败: {e}")
+
+    def _writer_loop(self):
+        """日志写线程：短暂聚合相邻条目，将多条日志合并为一次write"""
+        while True:
+            try:
+                batch = [self._log_queue.get()]
+                deadline = time.monotonic() + 0.1
+                while len(batch) < 256:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(self._log_queue.get(timeout=timeout))
+                    except queue.Empty:
+                        break
+                self._rotate_logs()
+                data = '\n'.join(batch) + '\n'
+                with open(self.log_path, 'a', encoding='utf-8') as f:
+                    f.write(data)
+                # 按UTF-8编码后的字节数累计（中文日志下len(str)会明显低估）
+                self._bytes_written += len(data.encode('utf-8'))
+            except Exception as e:
+                print(f"写入日志失败: {e}")
     
-    def debug(self, msg):
-        """调试级别日志"""
+    def debug(self, msg, *args):
+        """调试级别日志；传入args时延迟到级别判定通过后才做%格式化"""
         if self.current_level <= self.levels['DEBUG']:
-            self._write_log('DEBUG', msg)
+            self._write_log('DEBUG', msg % args if args else msg)
     
-    def info(self, msg):
-        """信息级别日志"""
+    def info(self, msg, *args):
+        """信息级别日志；传入args时延迟到级别判定通过后才做%格式化"""
         if self.current_level <= self.levels['INFO']:
-            self._write_log('INFO', msg)
+            self._write_log('INFO', msg % args if args else msg)
     
     def warning(self, msg, exc_info=None):
         """警告级别日志"""
@@ -411,7 +479,7 @@ COMMON_GAME_PROCESSES = [
     "callofduty.exe", "modernwarfare.exe", "modernwarfare2.exe", "modernwarfare3.exe", 
     "cod.exe", "warzone.exe", "warzone2.exe", "battlefield1.exe", "battlefield5.exe",
     "battlefield2042.exe", "fearless.exe", "readyornot.exe", "crossfire.exe", "cf.exe",
-    "crossfire_launcher.exe", "crossfire_x.exe"  # 穿越火线进程
+    "crossfire_launcher.exe", "crossfire_x.exe",  # 穿越火线进程
     
     # 角色扮演/动作冒险游戏
     "gtav.exe", "cyberpunk2077.exe", "residentevil.exe", "residentevil2.exe", 
@@ -467,10 +535,300 @@ LAUNCHER_PROCESSES = {
     "battlenet.exe"
 }
 
+# 预编译为小写frozenset：检测热路径上做O(1)哈希查找，避免每次调用重建集合和.lower()分配
+GAME_PROCESS_SET = frozenset(name.lower() for name in COMMON_GAME_PROCESSES)
+NON_GAME_PROCESS_SET = frozenset(name.lower() for name in NON_GAME_PROCESSES)
+LAUNCHER_PROCESS_SET = frozenset(name.lower() for name in LAUNCHER_PROCESSES)
+# 已知游戏进程基名（去.exe）及其分词编译为单一交替正则：
+# 宽松标题匹配由数百次Python子串探测变为一次C层线性扫描
+# （Aho-Corasick自动机可达同等效果，但此规模下正则交替已足够且无需新增依赖）
+_game_base_tokens = set()
+for _name in COMMON_GAME_PROCESSES:
+    _base = _name.replace('.exe', '').lower()
+    _game_base_tokens.add(_base)
+    _game_base_tokens.update(_base.split())
+_game_base_tokens.discard('')
+GAME_BASE_TITLE_RE = re.compile(
+    '|'.join(map(re.escape, sorted(_game_base_tokens, key=len, reverse=True))))
+del _game_base_tokens, _name, _base
+# 预先拆分出"真游戏"与"仅启动器"两个子集，检测时用isdisjoint短路判断，免去每次差集运算
+REAL_GAME_PROCESS_SET = GAME_PROCESS_SET - LAUNCHER_PROCESS_SET
+LAUNCHER_GAME_PROCESS_SET = GAME_PROCESS_SET & LAUNCHER_PROCESS_SET
+
+# 非游戏标题关键词编译为单一正则：一次线性扫描替代逐关键词子串查找，
+# 自定义关键词（apply_config）变化时需调用_rebuild_non_game_title_re()重建
+
+# 游戏标题关键词：此前在检测函数内逐次重建set并逐关键词子串扫描，
+# 关键词集合固定，编译为单一正则做一次线性匹配
+GAME_TITLE_KEYWORDS = frozenset({
+    'game', 'gaming', 'fps', 'rpg', 'moba', 'mmo', 'online',
+    'battle', 'war', 'fight', 'shoot', 'race', 'simulator',
+    '使命召唤', 'cod', 'cs2', 'csgo', 'valorant', '彩虹六号',
+    'lol', 'dota', 'fortnite', 'pubg', 'apex', '原神',
+    'genshin', 'gta', 'cyberpunk', '赛博朋克', 'elden', '艾尔登',
+    'starfield', '星空', 'palworld', '幻兽帕鲁', 'baldurs', '博德之门',
+    'cf', 'crossfire', '穿越火线', 'cfhd', 'cf战场', 'cf爆破',
+})
+_GAME_TITLE_RE = re.compile(
+    '|'.join(map(re.escape, sorted(GAME_TITLE_KEYWORDS, key=len, reverse=True))),
+    re.IGNORECASE)
+
+# CF（穿越火线）专项检测：关键词与进程集固定，预编译正则/冻结集合避免FPS热路径反复重建
+_CF_WINDOW_RE = re.compile(
+    '|'.join(map(re.escape, sorted(
+        ['crossfire', 'cf', '穿越火线', 'cfhd', 'cf战场', 'cf爆破'], key=len, reverse=True))),
+    re.IGNORECASE)
+_CF_PROC_RE = re.compile('crossfire|cf', re.IGNORECASE)
+_CF_PROCESS_SET = frozenset({
+    'crossfire.exe', 'cf.exe', 'crossfire_launcher.exe', 'crossfire_x.exe', 'client.exe'})
+# 负载→FPS系数分段线性曲线：按1%步长预展开为查表，调用处一次索引取代
+# 五级分支比较（曲线以数据形式落在表里，后续调参只改这两个函数）
+def _fallback_frac(load):
+    if load < 0.10:
+        return 0.35
+    if load < 0.30:
+        return 0.50 + load * 0.4
+    if load < 0.60:
+        return 0.65 + (load - 0.30) * 0.5
+    if load < 0.85:
+        return 0.80 + (load - 0.60) * 0.4
+    return 0.95 + (load - 0.85) * 0.2
+
+
+def _cf_frac(load):
+    # CF较激进：负载越高越接近刷新率上限
+    if load < 0.10:
+        return 0.55
+    if load < 0.30:
+        return 0.65 + load * 0.35
+    if load < 0.60:
+        return 0.78 + (load - 0.30) * 0.45
+    if load < 0.85:
+        return 0.90 + (load - 0.60) * 0.35
+    return 0.98 + (load - 0.85) * 0.15
+
+
+_FALLBACK_FRAC_LUT = tuple(_fallback_frac(_i / 100.0) for _i in range(101))
+_CF_FRAC_LUT = tuple(_cf_frac(_i / 100.0) for _i in range(101))
+del _fallback_frac, _cf_frac
+
+
+def _gradient_hue(ratio):
+    """渐变色相分段函数：浅绿->蓝->青->绿->黄->红->深红（单位：度，可为负）"""
+    if ratio <= 0.2:
+        return 120 + (ratio / 0.2) * 100
+    elif ratio <= 0.4:
+        return 220 - ((ratio - 0.2) / 0.2) * 40
+    elif ratio <= 0.6:
+        return 180 - ((ratio - 0.4) / 0.2) * 60
+    elif ratio <= 0.8:
+        return 120 - ((ratio - 0.6) / 0.2) * 60
+    elif ratio <= 0.9:
+        return 60 - ((ratio - 0.8) / 0.1) * 60
+    return 0 - ((ratio - 0.9) / 0.1) * 20
+
+
+# 色相查找表：ratio按百分位量化后直接取表，省去分支阶梯
+_HUE_LUT = tuple(_gradient_hue(_i / 100.0) for _i in range(101))
+del _gradient_hue
+
+
+# 负载/性能指数→FPS阶梯同样预展开为256档LUT：估算热路径单次索引取代逐级分支
+def _perf_to_fps(x):
+    if x < 0.1:
+        return 10
+    if x < 0.25:
+        return 30
+    if x < 0.4:
+        return 50
+    if x < 0.6:
+        return int(60 + (x - 0.4) * 150)    # 60-90 FPS线性段
+    if x < 0.8:
+        return int(90 + (x - 0.6) * 270)    # 90-144 FPS线性段
+    return min(240, int(144 + (x - 0.8) * 480))  # 144+上限240
+
+
+def _basic_load_to_fps(x):
+    if x > 0.95:
+        return 120
+    if x > 0.9:
+        return 110
+    if x > 0.8:
+        return 100
+    if x > 0.7:
+        return 90
+    if x > 0.6:
+        return 80
+    if x > 0.5:
+        return 60
+    if x > 0.4:
+        return 50
+    if x > 0.3:
+        return 45
+    if x > 0.2:
+        return 35
+    if x > 0.1:
+        return 30
+    return 0
+
+
+def _nv_direct_fps(x):
+    # NVIDIA负载阶梯（内存修正在调用处乘）
+    if x > 0.95:
+        return 165 + (x - 0.95) * 300
+    if x > 0.85:
+        return 144 + (x - 0.85) * 210
+    if x > 0.75:
+        return 120 + (x - 0.75) * 240
+    if x > 0.6:
+        return 90 + (x - 0.6) * 50
+    if x > 0.4:
+        return 60 + (x - 0.4) * 75
+    if x > 0.2:
+        return 30 + (x - 0.2) * 150
+    return 0.0
+
+
+def _amd_direct_fps(x):
+    # AMD负载阶梯（内存修正在调用处乘）
+    if x > 0.95:
+        return 155 + (x - 0.95) * 280
+    if x > 0.85:
+        return 130 + (x - 0.85) * 200
+    if x > 0.75:
+        return 110 + (x - 0.75) * 200
+    if x > 0.6:
+        return 85 + (x - 0.6) * 41.67
+    if x > 0.4:
+        return 55 + (x - 0.4) * 75
+    if x > 0.2:
+        return 25 + (x - 0.2) * 150
+    return 0.0
+
+
+_PERF_FPS_LUT = array.array('H', (_perf_to_fps(_i / 255.0) for _i in range(256)))
+_BASIC_FPS_LUT = array.array('H', (_basic_load_to_fps(_i / 255.0) for _i in range(256)))
+_NV_DIRECT_FPS_LUT = tuple(_nv_direct_fps(_i / 255.0) for _i in range(256))
+_AMD_DIRECT_FPS_LUT = tuple(_amd_direct_fps(_i / 255.0) for _i in range(256))
+del _perf_to_fps, _basic_load_to_fps, _nv_direct_fps, _amd_direct_fps
+
+
+# GPU型号分级表：按档位降序排列的(预编译正则, 理论最大FPS)，
+# 估算路径单趟扫描命中即停，取代逐档any(x in model ...)的Python子串循环
+_GPU_TIER_TABLE = (
+    (re.compile(r'rtx 4090|rtx 4080|rtx 3090|rtx 3080'), 360),          # NVIDIA旗舰
+    (re.compile(r'rtx 4070 ti|rtx 4070|rtx 3070 ti|rtx 3070'), 280),    # NVIDIA高端
+    (re.compile(r'rtx 4060 ti|rtx 4060|rtx 3060 ti|rtx 3060'), 220),    # NVIDIA中高端
+    (re.compile(r'rtx 4050|rtx 3050|gtx 1660 ti|gtx 1660 super'), 160), # NVIDIA中端
+    (re.compile(r'rx 7900 xtx|rx 7900 xt|rx 6950 xt|rx 6900 xt'), 350), # AMD旗舰
+    (re.compile(r'rx 7800 xt|rx 7700 xt|rx 6800 xt|rx 6800'), 270),     # AMD高端
+    (re.compile(r'rx 7600 xt|rx 7600|rx 6750 xt|rx 6700 xt'), 210),     # AMD中高端
+    (re.compile(r'rx 6650 xt|rx 6600 xt|rx 6600'), 150),                # AMD中端
+    (re.compile(r'iris|uhd|hd graphics|radeon vega|radeon graphics'), 60),  # 集成显卡
+    (re.compile(r'gtx'), 180),  # 较老的NVIDIA中高端
+    (re.compile(r'rx'), 170),   # 较老的AMD中高端
+    (re.compile(r'gt'), 120),   # 入门级NVIDIA
+)
+
+
+def _fps_fallback_estimate(load):
+    """GPU负载(0-1)到估算FPS的分段线性映射，仅用于构建查找表"""
+    if load < 0.1:
+        return 20
+    if load < 0.3:
+        return min(60, int(load * 150 + 25))
+    return min(240, int(load * 200 + 10))
+
+# 按1%负载粒度在导入时部分求值成查找表：回退估算热路径一次索引，无分支无浮点乘加
+_FPS_FALLBACK_LUT = array.array('H', (_fps_fallback_estimate(i / 100.0) for i in range(101)))
+
+_NON_GAME_TITLE_RE = None
+
+def _rebuild_non_game_title_re():
+    global _NON_GAME_TITLE_RE
+    keywords = [k for k in (set(NON_GAME_TITLE_KEYWORDS) | set(CUSTOM_NON_GAME_TITLE_KEYWORDS)) if k]
+    if keywords:
+        # 长关键词优先，保证交替分支匹配行为稳定
+        pattern = '|'.join(map(re.escape, sorted(keywords, key=len, reverse=True)))
+        _NON_GAME_TITLE_RE = re.compile(pattern, re.IGNORECASE)
+    else:
+        _NON_GAME_TITLE_RE = None
+
+_rebuild_non_game_title_re()
+
+# 合并后的非游戏进程集合同样只在自定义名单变化时重建，检测路径直接复用
+_COMBINED_NON_GAME_SET = frozenset(NON_GAME_PROCESS_SET | LAUNCHER_PROCESS_SET)
+
+def _rebuild_custom_filter_caches():
+    """自定义黑名单（进程/标题关键词）变化后重建合并集合与标题正则"""
+    global _COMBINED_NON_GAME_SET
+    _COMBINED_NON_GAME_SET = frozenset(
+        NON_GAME_PROCESS_SET | CUSTOM_NON_GAME_PROCESSES | LAUNCHER_PROCESS_SET)
+    _rebuild_non_game_title_re()
+
+_rebuild_custom_filter_caches()
+
 # 导入ctypes用于调用Windows API
 import ctypes
 from ctypes import wintypes
 
+# 前台检测所用Win32符号一次性绑定：显式argtypes/restype，
+# 避免每次调用经ctypes.windll按名解析函数并走通用参数封送
+try:
+    _user32 = ctypes.WinDLL('user32', use_last_error=True)
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+
+    _GetForegroundWindow = _user32.GetForegroundWindow
+    _GetForegroundWindow.restype = wintypes.HWND
+    _GetForegroundWindow.argtypes = []
+
+    _GetWindowThreadProcessId = _user32.GetWindowThreadProcessId
+    _GetWindowThreadProcessId.restype = wintypes.DWORD
+    _GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
+
+    _GetWindowRect = _user32.GetWindowRect
+    _GetWindowRect.restype = wintypes.BOOL
+    _GetWindowRect.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.RECT)]
+
+    _GetWindowTextLengthW = _user32.GetWindowTextLengthW
+    _GetWindowTextLengthW.restype = ctypes.c_int
+    _GetWindowTextLengthW.argtypes = [wintypes.HWND]
+
+    _GetWindowTextW = _user32.GetWindowTextW
+    _GetWindowTextW.restype = ctypes.c_int
+    _GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+
+    _GetSystemMetrics = _user32.GetSystemMetrics
+    _GetSystemMetrics.restype = ctypes.c_int
+    _GetSystemMetrics.argtypes = [ctypes.c_int]
+
+    _GetWindowLongW = _user32.GetWindowLongW
+    _GetWindowLongW.restype = wintypes.LONG
+    _GetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int]
+
+    _OpenProcess = _kernel32.OpenProcess
+    _OpenProcess.restype = wintypes.HANDLE
+    _OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+
+    _QueryFullProcessImageNameW = _kernel32.QueryFullProcessImageNameW
+    _QueryFullProcessImageNameW.restype = wintypes.BOOL
+    _QueryFullProcessImageNameW.argtypes = [wintypes.HANDLE, wintypes.DWORD,
+                                            wintypes.LPWSTR, ctypes.POINTER(wintypes.DWORD)]
+
+    _CloseHandle = _kernel32.CloseHandle
+    _CloseHandle.restype = wintypes.BOOL
+    _CloseHandle.argtypes = [wintypes.HANDLE]
+
+    # 进程批量枚举（psapi）：EnumProcesses一次调用取回全部PID
+    _psapi = ctypes.WinDLL('psapi', use_last_error=True)
+    _EnumProcesses = _psapi.EnumProcesses
+    _EnumProcesses.restype = wintypes.BOOL
+    _EnumProcesses.argtypes = [ctypes.POINTER(wintypes.DWORD), wintypes.DWORD,
+                               ctypes.POINTER(wintypes.DWORD)]
+except Exception:
+    _GetForegroundWindow = None
+    _EnumProcesses = None
+
 # ---------------- 单实例检测（Windows命名互斥）----------------
 _single_instance_mutex = None
 
@@ -552,32 +910,222 @@ class DXGI_ADAPTER_DESC(ctypes.Structure):
         ("AdapterLuid", LUID),
     ]
 
+
+# RTSS共享内存结构：模块级一次定义（此前每次轮询都在函数体内重建两个
+# Structure子类并重复sizeof），结构尺寸也在此预先求好
+class RTSS_SHARED_MEMORY_HEADER(ctypes.Structure):
+    _fields_ = [
+        ("dwSignature", ctypes.c_uint32),
+        ("dwVersion", ctypes.c_uint32),
+        ("dwAppEntrySize", ctypes.c_uint32),
+        ("dwAppCount", ctypes.c_uint32),
+        ("dwOSDEntrySize", ctypes.c_uint32),
+    ]
+
+
+class RTSS_SHARED_MEMORY_APP(ctypes.Structure):
+    _fields_ = [
+        ("dwProcessId", ctypes.c_uint32),
+        ("szName", ctypes.c_char * 260),
+        ("dwFlags", ctypes.c_uint32),
+        ("dwActive", ctypes.c_uint32),
+        ("fltFramerate", ctypes.c_float),
+        ("fltMinFramerate", ctypes.c_float),
+        ("fltMaxFramerate", ctypes.c_float),
+        ("fltFrameTime", ctypes.c_float),
+    ]
+
+
+_RTSS_HDR_SIZE = ctypes.sizeof(RTSS_SHARED_MEMORY_HEADER)
+_RTSS_APP_SIZE = ctypes.sizeof(RTSS_SHARED_MEMORY_APP)
+
+# RTSS条目的NumPy结构化dtype缓存（按dwAppEntrySize填充itemsize，
+# 条目实际尺寸随RTSS版本变化，字段偏移保持不变）
+_RTSS_DTYPE_CACHE = {}
+
+
+def _rtss_np_dtype(app_size):
+    """返回与RTSS条目布局匹配的结构化dtype；NumPy不可用或条目过小时返回None"""
+    if np is None or app_size < _RTSS_APP_SIZE:
+        return None
+    dt = _RTSS_DTYPE_CACHE.get(app_size)
+    if dt is None:
+        dt = np.dtype({
+            'names': ['pid', 'name', 'fps', 'ft'],
+            'formats': ['<u4', 'S260', '<f4', '<f4'],
+            'offsets': [0, 4, 272, 284],
+            'itemsize': app_size,
+        })
+        _RTSS_DTYPE_CACHE[app_size] = dt
+    return dt
+
 # 工作线程类，用于获取系统信息
+# 系统指标快照：update_signal的单对象载荷
+SysSnapshot = namedtuple('SysSnapshot', [
+    'cpu_usage', 'gpu_temp', 'gpu_load', 'down_speed', 'up_speed', 'is_gaming', 'fps'
+])
+
+# 前台窗口快照：一次Win32调用簇产出，检测/FPS路径共享读取
+ForegroundSnapshot = namedtuple('ForegroundSnapshot', [
+    'hwnd', 'pid', 'name', 'title', 'title_lower', 'is_fullscreen'
+])
+
+
+class _PdhNeedMoreSamples(Exception):
+    """PDH速率计数器刚完成基准采样，需等下一tick才有有效读数（非错误，不重建查询）"""
+    pass
+
+
 class SystemInfoWorker(QThread):
-    update_signal = pyqtSignal(float, float, float, float, float, bool, int)  # CPU使用率, GPU温度, GPU使用率, 下载速度, 上传速度, 是否在游戏, FPS
+    # 单对象载荷：一次emit只封送一个Python对象，而非跨线程逐个装箱7个标量
+    update_signal = pyqtSignal(object)  # SysSnapshot(CPU使用率, GPU温度, GPU使用率, 下载速度, 上传速度, 是否在游戏, FPS)
     error_signal = pyqtSignal(str)
     
     def __init__(self):
         super().__init__()
         self._running = True
+        # 可中断休眠事件：stop()置位后循环立即退出，停止延迟不受休眠间隔影响
+        self._stop_event = threading.Event()
+        # 一次性解析平台层网络计数函数：绕过每次调用的namedtuple聚合包装
+        try:
+            self._net_raw_fn = psutil._psplatform.net_io_counters
+        except AttributeError:
+            self._net_raw_fn = None
+        # 轮询周期（秒）：可通过配置覆盖；idle为非游戏时的放宽周期
+        self.gpu_interval = 0.6
+        self.gpu_interval_idle = 1.2
+        self.net_interval = 0.5
+        self.net_interval_idle = 1.0
+        self.game_interval = 1.0
+        self.game_interval_idle = 2.0
+        self.fps_interval_gaming = 0.5
+        self.fps_interval_idle = 2.0
+        # 持续空闲超过30秒后，空闲周期再翻倍（上限5秒），进一步压低后台开销
+        self._idle_since = time.monotonic()
+        # 硬件监控WMI连接缓存：按命名空间持久复用，避免每次测温重建COM连接
+        self._hwmon_conns = {}
+        # 前台进程名缓存：(hwnd, pid, name)，前台窗口未切换时免去重复解析
+        self._fg_name_cache = None
+        # 前台窗口快照缓存：0.3秒内检测与FPS路径共用同一轮Win32查询结果
+        self._fg_snapshot = None
+        self._fg_snapshot_time = 0.0
+        # 标题读取复用的预分配缓冲区（仅工作线程使用）：免去每次长度查询与分配，超长截断
+        self._title_buf = ctypes.create_unicode_buffer(512)
+        # 主屏尺寸缓存：会话内基本不变，60秒TTL覆盖分辨率调整场景
+        self._screen_size_cache = (0, 0)
+        self._screen_size_ts = 0.0
+        # 指标缓存与检测状态统一在构造时给哨兵默认值，
+        # 热路径用直接比较取代逐次hasattr探测（每次hasattr内部是一轮try/except）
+        self._cached_gpu_temp = 45.0  # 默认GPU温度
+        self._cached_gpu_load = 0
+        self._cached_is_gaming = False
+        self._cached_cpu_usage = 0
+        self._cached_down_speed = 0
+        self._cached_up_speed = 0
+        self._cached_fps = 0
+        self._cached_gpu_memory_used = 0
+        self._cached_gpu_memory_total = 0
+        # 对外发布的最新检测状态：(is_gaming, fps, 单调时间戳)。
+        # 元组整体替换在GIL下是原子操作，任意线程可无锁读取
+        self._pub_state = (False, 0, 0.0)
+        self._last_detection_result = None
+        self._last_detection_time = 0.0
+        self._last_history_update = 0.0
+        self._last_counter_time = 0.0
+        self._last_source_rtss = False
+        self._cf_fps_history = deque(maxlen=3)  # CF专用FPS平滑历史，只保留最近3个值
+        # CPU温度缓存与节流时间戳，避免UI线程执行重操作
+        self._cached_cpu_temp = None
+        self._last_cpu_temp_read_ts = 0
+        # 进程快照缓存：一次process_iter同时产出运行进程名集合与高CPU进程，1.5秒内复用
+        self._proc_snapshot = None
+        self._proc_snapshot_time = 0.0
+        # 按(前台进程名, 标题哈希)的判定缓存：同一窗口反复检测直接命中，LRU上限64条
+        self._verdict_cache = OrderedDict()
+        # FPS来源并发采样线程池：首次进入游戏态才创建，避免非游戏时空占线程
+        self._fps_pool = None
+        # FPS来源序列与置信权重构造时一次就绪（RTSS必须是首项，单源快路径优先），
+        # 避免每次get_fps调用重建列表和字典
+        if SAFE_PACKAGED_MODE:
+            # 打包安全模式：只使用RTSS与估算，跳过原生计数器
+            self._fps_methods = (
+                self._get_fps_using_rtss_shared_memory,
+                self._get_fps_using_gpu_load_temp_and_memory,
+            )
+        else:
+            self._fps_methods = (
+                self._get_fps_using_rtss_shared_memory,      # RTSS共享内存（置信度最高）
+                self._get_fps_using_windows_gaming_api,      # Windows游戏/图形计数器（高置信）
+                self._get_fps_using_gpu_performance_counters,  # GPU厂商性能计数器（中高置信）
+                self._get_fps_using_direct_query,            # 直接查询（中等置信）
+                self._get_fps_using_gpu_load_temp_and_memory,  # GPU负载/温度/显存估算（低置信）
+            )
+        self._fps_method_weights = {
+            self._get_fps_using_rtss_shared_memory: 1.0,
+            self._get_fps_using_windows_gaming_api: 1.0,
+            self._get_fps_using_gpu_performance_counters: 0.85,
+            self._get_fps_using_direct_query: 0.75,
+            self._get_fps_using_gpu_load_temp_and_memory: 0.55,
+        }
+        # 下列属性统一在此落位为哨兵值：热路径直接属性访问即可，
+        # 免去getattr(obj, name, default)/hasattr逐次异常探测的开销
+        self.sleep_interval = 0.05
+        self.signal_interval = 0.1
+        self._last_detection_hwnd = None
+        self._display_refresh_hz = 0
+        self._last_refresh_query = 0.0
+        self._pdh_query = None
+        self._pdh_counters = {}
+        self._pdh_key = None
+        self._pdh_primed = False
+        self._pdh_last_enum = 0.0
+        self._pdh_last_collect = 0.0
+        self._pdh_last_fps = None
+        # GPUtil快照缓存：同一采集周期内各估算来源共用一次getGPUs()结果
+        self._gpus_snapshot = []
+        self._gpus_snapshot_time = 0.0
+        # RTSS共享内存映射跨轮询保持打开（5秒重验一次确认RTSS仍在）
+        self._rtss_hmap = None
+        self._rtss_pmem = None
+        self._rtss_verify_ts = 0.0
         # 初始化网络统计数据
-        self.last_net_io = psutil.net_io_counters()
-        self.last_time = time.time()
+        # 仅保留收/发字节数，避免每轮持有完整namedtuple；时间基准用单调时钟防止系统调钟产生负差
+        self.last_net_recv, self.last_net_sent = self._read_net_totals()
+        self.last_time = time.monotonic()
         # 游戏检测相关变量
-        self.last_fps_check_time = time.time()
+        self.last_fps_check_time = time.monotonic()
         self.fps = 0
         
         # FPS获取相关的初始化
-        self.fps_history = []  # 存储最近的FPS值，用于平滑处理
-        self.frame_time_history = []  # 存储最近的帧时间，用于更准确的FPS计算
         self.fps_smoothing_window = 8  # FPS平滑窗口大小，增加以获得更稳定的结果
+        # 定长deque：append自动挤出最旧元素，免去list.pop(0)的O(N)搬移
+        self.fps_history = deque(maxlen=self.fps_smoothing_window)  # 存储最近的FPS值，用于平滑处理
+        self.frame_time_history = deque(maxlen=self.fps_smoothing_window)  # 存储最近的帧时间，用于更准确的FPS计算
+        # 平滑权重(i+1)^1.3及其前缀和按窗口长度一次算好：
+        # 平滑函数每次调用只做切片/索引，不再重复求幂和求和（原先每tick约4N次浮点运算）
+        self._smooth_weights = tuple((i + 1) ** 1.3 for i in range(self.fps_smoothing_window))
+        # NumPy可用时预构权重向量：平滑热路径的两处加权和改走一次np.dot归约
+        self._smooth_weights_np = (
+            np.asarray(self._smooth_weights, dtype=np.float64) if np is not None else None
+        )
+        _totals = [0.0]
+        for _w in self._smooth_weights:
+            _totals.append(_totals[-1] + _w)
+        self._smooth_weight_totals = tuple(_totals)
         self.last_fps_timestamp = 0  # 上次获取FPS的时间戳
         self.fps_cache = 0  # 缓存的FPS值
         self.cache_valid_time = 0.15  # 缓存有效期（秒），减少以提高响应速度
         
-        # GPU型号相关信息（用于针对性优化）
+        # NVML持久句柄：一次初始化，循环内直接DLL调用读取温度/负载，
+        # 避免每秒经由GPUtil派生nvidia-smi子进程（fork+解析开销巨大）
+        self._nvml_handle = None
+        self._nvml_inited = False
+        self._init_nvml()
+
+        # GPU型号相关信息（用于针对性优化）；静态信息只在此处取一次
         self.gpu_model = None
         self.gpu_vendor = None
+        self._static_gpu = {}
         self._init_gpu_info()
         
         # 针对特定游戏的FPS修正值 - 扩展版本
@@ -630,14 +1178,189 @@ class SystemInfoWorker(QThread):
             'DiabloIV.exe': -1,
             'Diablo4.exe': -1
         }
+        # 统一小写键：进程名各处均以小写比较，原样大小写的键会静默匹配失败
+        self.game_specific_fps_offsets = {
+            k.lower(): v for k, v in self.game_specific_fps_offsets.items()
+        }
+        # 预先剥离.exe生成部分匹配表：避免每次FPS tick在循环里反复replace()
+        self._fps_offset_partials = tuple(
+            (k[:-4] if k.endswith('.exe') else k, v)
+            for k, v in self.game_specific_fps_offsets.items()
+        )
         
         # 初始化Windows性能计数器访问
         self._init_performance_counter()
     
+    def _init_nvml(self):
+        """初始化NVML持久句柄（失败时保持None，后续回退GPUtil路径）"""
+        try:
+            import pynvml
+            pynvml.nvmlInit()
+            self._nvml_inited = True
+            self._nvml_handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+            logger.info("NVML初始化成功，GPU信息将通过持久句柄读取")
+        except Exception as e:
+            self._nvml_handle = None
+            logger.debug(f"NVML初始化失败，回退GPUtil路径: {e}")
+
+    def _read_gpu_via_nvml(self):
+        """通过持久NVML句柄读取（负载%, 温度°C），不可用时返回None"""
+        if self._nvml_handle is None:
+            return None
+        try:
+            import pynvml
+            util = pynvml.nvmlDeviceGetUtilizationRates(self._nvml_handle)
+            temp = pynvml.nvmlDeviceGetTemperature(self._nvml_handle, pynvml.NVML_TEMPERATURE_GPU)
+            return float(util.gpu), float(temp)
+        except Exception as e:
+            logger.debug("NVML读取失败: %s", e)
+            return None
+
+    def _get_gpus_cached(self):
+        """GPUtil.getGPUs()的tick级缓存（0.5秒）。每次真实调用都会触发
+        nvidia-smi/WMI查询（10~30ms），而一个FPS采集周期里最多有五个来源
+        各自要GPU快照，共用一份即可，开销从每tick约5次降到1次。"""
+        now = time.monotonic()
+        if now - self._gpus_snapshot_time < 0.5:
+            return self._gpus_snapshot
+        try:
+            self._gpus_snapshot = GPUtil.getGPUs()
+        except Exception:
+            self._gpus_snapshot = []
+        self._gpus_snapshot_time = now
+        return self._gpus_snapshot
+
+    def _query_gpu_fast(self):
+        """快速查询GPU（负载%, 显存已用MB, 显存总量MB）。
+        优先走持久NVML句柄（微秒级），不可用时才回退GPUtil
+        （其内部每次派生nvidia-smi子进程）；两者都失败返回None。"""
+        if self._nvml_handle is not None:
+            try:
+                import pynvml
+                util = pynvml.nvmlDeviceGetUtilizationRates(self._nvml_handle)
+                mem = pynvml.nvmlDeviceGetMemoryInfo(self._nvml_handle)
+                return float(util.gpu), mem.used / (1024 * 1024), mem.total / (1024 * 1024)
+            except Exception as e:
+                logger.debug("NVML快速查询失败: %s", e)
+        try:
+            gpus = self._get_gpus_cached()
+            if gpus:
+                gpu = gpus[0]
+                return float(gpu.load) * 100.0, float(gpu.memoryUsed), float(gpu.memoryTotal)
+        except Exception:
+            pass
+        return None
+
+    @staticmethod
+    def _weighted_trimmed_mean(candidates):
+        """多来源FPS候选值的去离群加权平均。
+        candidates为(value, weight)列表；剔除偏离均值超过2σ的候选后做
+        加权平均——比固定去掉最小/最大更稳健，且天然覆盖任意候选数
+        （σ为0或样本太少时全保留）。NumPy可用时向量化，缺失时回退纯Python。
+        权重和为0时返回None。"""
+        n = len(candidates)
+        if n == 0:
+            return None
+        if np is not None:
+            vals = np.fromiter((v for v, _ in candidates), dtype=float, count=n)
+            wts = np.fromiter((w for _, w in candidates), dtype=float, count=n)
+            std = vals.std()
+            if std > 0:
+                keep = np.abs(vals - vals.mean()) <= 2.0 * std
+                vals = vals[keep]
+                wts = wts[keep]
+            total = wts.sum()
+            return float(np.dot(vals, wts) / total) if total > 0 else None
+        mean = sum(v for v, _ in candidates) / n
+        std = (sum((v - mean) ** 2 for v, _ in candidates) / n) ** 0.5
+        if std > 0:
+            limit = 2.0 * std
+            filtered = [(v, w) for v, w in candidates if abs(v - mean) <= limit]
+        else:
+            filtered = candidates
+        total_weight = sum(w for _, w in filtered)
+        if total_weight > 0:
+            return sum(v * w for v, w in filtered) / total_weight
+        return None
+
+    def _shutdown_nvml(self):
+        """释放NVML资源（线程停止时调用）"""
+        if self._nvml_inited:
+            try:
+                import pynvml
+                pynvml.nvmlShutdown()
+            except Exception:
+                pass
+            self._nvml_inited = False
+            self._nvml_handle = None
+
+    def _sample_cpu_percent(self, now):
+        """基于cpu_times()差分自行计算总CPU占用率。
+        一次C层调用取回全部时间字段，绕过cpu_percent包装的内部状态维护；
+        距上次采样不足0.2秒时沿用缓存值，避免小分母放大抖动。"""
+        if now - self._last_cpu_sample_ts < 0.2:
+            return
+        cur = psutil.cpu_times()
+        prev = self._last_cpu_times
+        if prev is not None:
+            total = sum(cur) - sum(prev)
+            # iowait（如有）与idle一样视为空闲
+            idle = (cur.idle + getattr(cur, 'iowait', 0)) - (prev.idle + getattr(prev, 'iowait', 0))
+            if total > 0:
+                usage = (total - idle) / total * 100.0
+                self._cached_cpu_usage = max(0.0, min(100.0, usage))
+        self._last_cpu_times = cur
+        self._last_cpu_sample_ts = now
+
+    def _read_hwmon_temps(self, namespace, extra_where):
+        """通过缓存的WMI连接查询温度传感器值列表。
+        SensorType与名称过滤下推到WQL层执行，避免整表枚举后再在Python侧筛选；
+        查询异常时丢弃缓存连接，下次调用自动重建。"""
+        try:
+            conn = self._hwmon_conns.get(namespace)
+            if conn is None:
+                import wmi
+                conn = wmi.WMI(namespace=namespace)
+                self._hwmon_conns[namespace] = conn
+            sensors = conn.query(
+                "SELECT Value FROM Sensor WHERE SensorType='Temperature'" + extra_where)
+            vals = []
+            for sensor in sensors:
+                try:
+                    v = float(getattr(sensor, 'Value', 0))
+                    if 0 < v < 110:
+                        vals.append(v)
+                except Exception:
+                    continue
+            return vals
+        except Exception:
+            self._hwmon_conns.pop(namespace, None)
+            return []
+
+    def _read_net_totals(self):
+        """读取全网卡累计收/发字节数。优先走psutil平台层原始接口，只汇总两个整数；
+        私有接口不可用时回退公开的net_io_counters()。"""
+        if self._net_raw_fn is not None:
+            try:
+                recv = 0
+                sent = 0
+                # 平台层返回 {网卡名: (bytes_sent, bytes_recv, ...)} 的原始元组
+                for vals in self._net_raw_fn().values():
+                    sent += vals[0]
+                    recv += vals[1]
+                return recv, sent
+            except Exception:
+                self._net_raw_fn = None
+        net_io = psutil.net_io_counters()
+        return net_io.bytes_recv, net_io.bytes_sent
+
     def stop(self):
         """停止线程的安全方法"""
         self._running = False
+        self._stop_event.set()
         self.wait()
+        self._shutdown_nvml()
+        self._rtss_close_mapping()
     
     def _get_cpu_temperature_celsius(self):
         """更健壮的CPU温度获取：优先psutil，回退OpenHardwareMonitor(WMI)，再回退ACPI热区温度。
@@ -675,36 +1398,20 @@ class SystemInfoWorker(QThread):
         # 2) OpenHardwareMonitor/LibreHardwareMonitor WMI（仅在对应进程运行时使用，以避免COM异常）
         try:
             import psutil as _ps
-            import wmi
             proc_names = [(p.info.get('name', '') or '').lower() for p in _ps.process_iter(attrs=['name'])]
             use_ohm = any('openhardwaremonitor' in nm for nm in proc_names)
             use_lhm = any('librehardwaremonitor' in nm or 'libre hardware monitor' in nm for nm in proc_names)
 
-            def _read_wmi_sensors(ns):
-                w = wmi.WMI(namespace=ns)
-                sensors = w.Sensor()
-                vals = []
-                for s in sensors:
-                    try:
-                        if getattr(s, 'SensorType', '') == "Temperature":
-                            name_l = (getattr(s, 'Name', '') or '').lower()
-                            hw_l = (getattr(s, 'HardwareType', '') or '').lower()
-                            if ("cpu" in name_l) or ("package" in name_l) or ("cpu" in hw_l):
-                                v = float(getattr(s, 'Value', 0))
-                                if 0 < v < 110:
-                                    vals.append(v)
-                    except Exception:
-                        continue
-                return max(vals) if vals else None
-
+            cpu_where = (" AND (Name LIKE '%cpu%' OR Name LIKE '%package%'"
+                         " OR HardwareType LIKE '%cpu%')")
             if use_ohm:
-                v = _read_wmi_sensors("root\\OpenHardwareMonitor")
-                if isinstance(v, (int, float)):
-                    return float(v)
+                vals = self._read_hwmon_temps("root\\OpenHardwareMonitor", cpu_where)
+                if vals:
+                    return max(vals)
             if use_lhm:
-                v = _read_wmi_sensors("root\\LibreHardwareMonitor")
-                if isinstance(v, (int, float)):
-                    return float(v)
+                vals = self._read_hwmon_temps("root\\LibreHardwareMonitor", cpu_where)
+                if vals:
+                    return max(vals)
         except Exception:
             pass
 
@@ -784,7 +1491,7 @@ class SystemInfoWorker(QThread):
 
         # 5) 最终兜底：根据CPU使用率估算温度，避免显示为"--"
         try:
-            usage = getattr(self, '_cached_cpu_usage', None)
+            usage = self._cached_cpu_usage
             if isinstance(usage, (int, float)):
                 est = 40.0 + float(usage) * 0.35
                 return max(28.0, min(95.0, est))
@@ -806,7 +1513,7 @@ class SystemInfoWorker(QThread):
         
         # 非安全模式：逐步尝试GPUtil、OpenHardwareMonitor(WMI)、NVML
         try:
-            gpus = GPUtil.getGPUs()
+            gpus = self._get_gpus_cached()
             if gpus:
                 temp_val = getattr(gpus[0], 'temperature', None)
                 if isinstance(temp_val, (int, float)) and temp_val > 0:
@@ -816,27 +1523,24 @@ class SystemInfoWorker(QThread):
         
         # 仅在检测到OpenHardwareMonitor进程运行时才尝试其WMI接口，避免无进程情况下的COM异常
         try:
-            import wmi, psutil
+            import psutil
             if any('openhardwaremonitor' in (p.info.get('name', '') or '').lower() for p in psutil.process_iter(attrs=['name'])):
-                w = wmi.WMI(namespace="root\\OpenHardwareMonitor")
-                sensors = w.Sensor()
-                gpu_temps = [s.Value for s in sensors if s.SensorType == "Temperature" and ("gpu" in s.Name.lower())]
+                gpu_temps = self._read_hwmon_temps("root\\OpenHardwareMonitor",
+                                                   " AND Name LIKE '%gpu%'")
                 if gpu_temps:
                     return max(gpu_temps)
         except Exception:
             pass
         
-        # NVIDIA NVML（驱动正常且库可用时）
-        try:
-            import pynvml
-            pynvml.nvmlInit()
-            handle = pynvml.nvmlDeviceGetHandleByIndex(0)
-            temp = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
-            pynvml.nvmlShutdown()
-            if isinstance(temp, (int, float)) and temp > 0:
-                return float(temp)
-        except Exception:
-            pass
+        # NVIDIA NVML：复用持久句柄，避免每次调用都执行nvmlInit/nvmlShutdown全周期
+        if self._nvml_handle is not None:
+            try:
+                import pynvml
+                temp = pynvml.nvmlDeviceGetTemperature(self._nvml_handle, pynvml.NVML_TEMPERATURE_GPU)
+                if isinstance(temp, (int, float)) and temp > 0:
+                    return float(temp)
+            except Exception:
+                pass
         return None
     
     def run(self):
@@ -855,45 +1559,53 @@ class SystemInfoWorker(QThread):
             last_network_check_time = current_time
             last_fps_check_time = current_time
             
-            # 使用非阻塞方式获取初始CPU使用率
-            psutil.cpu_percent(interval=0)
-            
-            # 初始化缓存变量
-            self._cached_gpu_temp = 45.0  # 默认GPU温度
-            self._cached_gpu_load = 0
-            self._cached_is_gaming = False
-            self._cached_cpu_usage = 0
-            self._cached_down_speed = 0
-            self._cached_up_speed = 0
-            self._cached_fps = 0
-            # 新增：CPU温度缓存与节流时间戳，避免UI线程执行重操作
-            self._cached_cpu_temp = None
-            self._last_cpu_temp_read_ts = 0
+            # 差分基准：记录首个cpu_times快照，循环内自行计算占用率
+            try:
+                self._last_cpu_times = psutil.cpu_times()
+            except Exception:
+                self._last_cpu_times = None
+            self._last_cpu_sample_ts = current_time
             
             # 初始化网络IO计数器
             try:
-                self.last_net_io = psutil.net_io_counters()
+                self.last_net_recv, self.last_net_sent = self._read_net_totals()
                 self.last_time = current_time
                 logger.debug("网络IO计数器初始化成功")
             except Exception as e:
-                self.last_net_io = None
+                self.last_net_recv = None
+                self.last_net_sent = None
                 self.last_time = current_time
                 logger.warning(f"网络IO计数器初始化失败: {str(e)}")
             
             # 预计算休眠时间以减少函数调用
-            sleep_interval = getattr(self, 'sleep_interval', 0.05)
+            sleep_interval = self.sleep_interval
             
             # 信号发送频率控制
             last_signal_time = current_time
-            signal_interval = getattr(self, 'signal_interval', 0.1)
+            signal_interval = self.signal_interval
+            # 上次发射的取整快照：数值无可见变化时跳过发射，避免无谓的UI刷新
+            last_emitted_snapshot = None
+            last_emit_time = current_time
             
             while self._running:
                 current_time = time.monotonic()
                 
-                # 非阻塞方式获取CPU使用率（高频但低消耗）
+                # 计算本轮各任务的有效周期：游戏中用基础周期；
+                # 空闲时用idle周期，持续空闲30秒后再翻倍（上限5秒）
+                gaming = self._cached_is_gaming
+                if gaming:
+                    self._idle_since = current_time
+                    idle_scale = 1.0
+                else:
+                    idle_scale = 2.0 if current_time - self._idle_since > 30.0 else 1.0
+                gpu_period = self.gpu_interval if gaming else min(5.0, self.gpu_interval_idle * idle_scale)
+                net_period = self.net_interval if gaming else min(5.0, self.net_interval_idle * idle_scale)
+                game_period = self.game_interval if gaming else min(5.0, self.game_interval_idle * idle_scale)
+                fps_period = self.fps_interval_gaming if gaming else min(5.0, self.fps_interval_idle * idle_scale)
+                
+                # 非阻塞方式获取CPU使用率（cpu_times差分，单次C层调用，无per-CPU列表分配）
                 try:
-                    cpu_usage = psutil.cpu_percent(interval=0, percpu=False)  # 使用单值而非列表以减少计算
-                    self._cached_cpu_usage = cpu_usage
+                    self._sample_cpu_percent(current_time)
                 except Exception:
                     # 保持缓存值
                     pass
@@ -909,49 +1621,48 @@ class SystemInfoWorker(QThread):
                     # 出错时保留上次有效值
                     pass
                 
-                # 自适应GPU查询频率：游戏时0.6秒，非游戏时1.2秒（与GPUtil节流协同）
-                if current_time - last_gpu_check_time >= (0.6 if self._cached_is_gaming else 1.2):
+                # 自适应GPU查询频率：游戏时0.6秒，非游戏默认1.2秒（空闲30秒后进一步放宽）
+                if current_time - last_gpu_check_time >= gpu_period:
                     try:
+                        # 优先使用NVML持久句柄直接读取（亚毫秒级DLL调用，无子进程）
+                        nvml_data = self._read_gpu_via_nvml()
+                        if nvml_data is not None:
+                            self._cached_gpu_load, self._cached_gpu_temp = nvml_data
                         # 打包环境下使用安全的温度获取方法
-                        if is_packaged or GPUUTIL_DISABLE:
+                        elif is_packaged or GPUUTIL_DISABLE:
                             logger.debug("打包环境或禁用GPUtil，使用安全的温度获取方法")
                             # 在打包环境下，使用基于CPU使用率的简单估算
-                            if hasattr(self, '_cached_cpu_usage'):
-                                # GPU温度基于CPU使用率估算，确保在合理范围内
-                                base_temp = 40.0 + (self._cached_cpu_usage * 0.3)
-                                self._cached_gpu_temp = max(30.0, min(80.0, base_temp))
-                                self._cached_gpu_load = max(0, min(100, self._cached_cpu_usage * 1.2))
-                                logger.debug(f"打包环境估算GPU温度: {self._cached_gpu_temp}°C, 负载: {self._cached_gpu_load}%")
-                            else:
-                                # 如果CPU使用率不可用，使用默认值
-                                self._cached_gpu_temp = 45.0
-                                self._cached_gpu_load = 20.0
+                            # GPU温度基于CPU使用率估算，确保在合理范围内
+                            base_temp = 40.0 + (self._cached_cpu_usage * 0.3)
+                            self._cached_gpu_temp = max(30.0, min(80.0, base_temp))
+                            self._cached_gpu_load = max(0, min(100, self._cached_cpu_usage * 1.2))
+                            logger.debug("打包环境估算GPU温度: %s°C, 负载: %s%%", self._cached_gpu_temp, self._cached_gpu_load)
                         else:
                             # 非打包环境：使用GPUtil获取GPU信息
-                            gpus = GPUtil.getGPUs()
+                            gpus = self._get_gpus_cached()
                             if gpus:
                                 # 温度与负载优先来自GPUtil
                                 try:
                                     temp_val = getattr(gpus[0], 'temperature', None)
                                     if isinstance(temp_val, (int, float)) and temp_val > 0:
                                         self._cached_gpu_temp = float(temp_val)
-                                        logger.debug(f"GPUtil获取GPU温度成功: {self._cached_gpu_temp}°C")
+                                        logger.debug("GPUtil获取GPU温度成功: %s°C", self._cached_gpu_temp)
                                 except Exception as e:
-                                    logger.debug(f"GPUtil获取GPU温度失败: {str(e)}")
+                                    logger.debug("GPUtil获取GPU温度失败: %s", e)
                                 try:
                                     load_val = getattr(gpus[0], 'load', None)
                                     if isinstance(load_val, (int, float)) and load_val >= 0:
                                         self._cached_gpu_load = float(load_val) * 100.0
-                                        logger.debug(f"GPUtil获取GPU负载成功: {self._cached_gpu_load}%")
+                                        logger.debug("GPUtil获取GPU负载成功: %s%%", self._cached_gpu_load)
                                 except Exception as e:
-                                    logger.debug(f"GPUtil获取GPU负载失败: {str(e)}")
+                                    logger.debug("GPUtil获取GPU负载失败: %s", e)
                             # 若GPUtil不可用或未得到温度，尝试回退方法
                             if not gpus or (not isinstance(self._cached_gpu_temp, (int, float)) or self._cached_gpu_temp <= 0):
                                 logger.debug("GPUtil获取温度无效，尝试回退方法")
                                 fallback_temp = self._get_gpu_temperature_celsius()
                                 if isinstance(fallback_temp, (int, float)) and fallback_temp > 0:
                                     self._cached_gpu_temp = float(fallback_temp)
-                                    logger.debug(f"回退方法获取GPU温度成功: {self._cached_gpu_temp}°C")
+                                    logger.debug("回退方法获取GPU温度成功: %s°C", self._cached_gpu_temp)
                                 else:
                                     logger.debug("回退方法获取GPU温度失败")
                     except Exception as e:
@@ -959,17 +1670,23 @@ class SystemInfoWorker(QThread):
                     last_gpu_check_time = current_time
                 
                 # 自适应网络速度计算频率：游戏时0.5秒，非游戏时1.0秒
-                if current_time - last_network_check_time >= (0.5 if self._cached_is_gaming else 1.0) and self.last_net_io is not None:
+                if current_time - last_network_check_time >= net_period and self.last_net_recv is not None:
                     try:
-                        current_net_io = psutil.net_io_counters()
+                        cur_recv, cur_sent = self._read_net_totals()
                         time_diff = current_time - self.last_time
                         
-                        if time_diff > 0.01:  # 避免非常小的时间差导致的计算波动
-                            down_speed = (current_net_io.bytes_recv - self.last_net_io.bytes_recv) / time_diff
-                            up_speed = (current_net_io.bytes_sent - self.last_net_io.bytes_sent) / time_diff
+                        # 间隔不足半个周期（0.25秒）时跳过本次计算：
+                        # 线程被饿醒后补课式连跑会产生小分母，放大为虚假的速度尖峰
+                        if time_diff < 0.25:
+                            self._net_skipped = getattr(self, '_net_skipped', 0) + 1
+                            if self._net_skipped % 100 == 0:
+                                logger.debug("网络速度采样间隔过短，累计跳过%s次", self._net_skipped)
+                        else:
+                            down_speed = (cur_recv - self.last_net_recv) / time_diff
+                            up_speed = (cur_sent - self.last_net_sent) / time_diff
                             
                             # 平滑网络速度变化
-                            if hasattr(self, '_cached_down_speed') and self._cached_down_speed > 0:
+                            if self._cached_down_speed > 0:
                                 self._cached_down_speed = self._cached_down_speed * 0.7 + down_speed * 0.3
                                 self._cached_up_speed = self._cached_up_speed * 0.7 + up_speed * 0.3
                             else:
@@ -977,14 +1694,15 @@ class SystemInfoWorker(QThread):
                                 self._cached_up_speed = up_speed
                             
                             # 更新网络统计数据
-                            self.last_net_io = current_net_io
+                            self.last_net_recv = cur_recv
+                            self.last_net_sent = cur_sent
                             self.last_time = current_time
                     except Exception:
                         pass  # 使用缓存值
                     last_network_check_time = current_time
                 
-                # 自适应游戏检测频率：游戏时1秒，非游戏时2秒
-                if current_time - last_game_check_time >= (1.0 if self._cached_is_gaming else 2.0):
+                # 自适应游戏检测频率：游戏时1秒，非游戏默认2秒（空闲时放宽）
+                if current_time - last_game_check_time >= game_period:
                     try:
                         # 打包环境下也启用游戏检测，失败时使用缓存
                         self._cached_is_gaming = self.detect_gaming()
@@ -996,13 +1714,12 @@ class SystemInfoWorker(QThread):
                     last_game_check_time = current_time
                 
                 # 获取FPS（游戏模式下更高频率，非游戏模式下降低频率）
-                if (self._cached_is_gaming and current_time - last_fps_check_time >= 0.5) or \
-                   (not self._cached_is_gaming and current_time - last_fps_check_time >= 2.0):
+                if current_time - last_fps_check_time >= fps_period:
                     try:
                         # 打包环境下也尝试获取FPS，失败时回退为0
                         self._cached_fps = self.get_fps(self._cached_is_gaming)
                         if self._cached_fps > 0:
-                            logger.debug(f"FPS获取成功: {self._cached_fps}")
+                            logger.debug("FPS获取成功: %s", self._cached_fps)
                         else:
                             logger.debug("FPS不可用或获取失败，使用0")
                     except Exception as e:
@@ -1010,34 +1727,96 @@ class SystemInfoWorker(QThread):
                         logger.error(f"FPS获取异常: {str(e)}")
                     last_fps_check_time = current_time
                 
+                # 发布最新状态供跨线程非阻塞读取（见is_game_running/current_fps）
+                self._pub_state = (self._cached_is_gaming, self._cached_fps, time.monotonic())
+                
                 # 控制信号发送频率，避免过于频繁的UI更新（非游戏时减少到一半频率）
                 if current_time - last_signal_time >= (signal_interval if self._cached_is_gaming else signal_interval * 2):
-                    # 发送更新信号，使用缓存值
-                    self.update_signal.emit(
-                        self._cached_cpu_usage, 
-                        self._cached_gpu_temp, 
-                        self._cached_gpu_load, 
-                        self._cached_down_speed, 
-                        self._cached_up_speed, 
-                        self._cached_is_gaming, 
-                        self._cached_fps
+                    # 取整到显示精度再比较：低于显示分辨率的抖动不触发UI刷新
+                    snapshot = (
+                        round(self._cached_cpu_usage, 1),
+                        int(self._cached_gpu_temp),
+                        round(self._cached_gpu_load, 1),
+                        int(self._cached_down_speed / 1024),
+                        int(self._cached_up_speed / 1024),
+                        self._cached_is_gaming,
+                        self._cached_fps,
                     )
+                    # 值有可见变化才发射；最长5秒保底发射一次防止界面完全停更
+                    if snapshot != last_emitted_snapshot or current_time - last_emit_time >= 5.0:
+                        self.update_signal.emit(SysSnapshot(
+                            self._cached_cpu_usage,
+                            self._cached_gpu_temp,
+                            self._cached_gpu_load,
+                            self._cached_down_speed,
+                            self._cached_up_speed,
+                            self._cached_is_gaming,
+                            self._cached_fps,
+                        ))
+                        last_emitted_snapshot = snapshot
+                        last_emit_time = current_time
                     last_signal_time = current_time
                 
-                # 使用更高效的休眠方式
-                time.sleep(sleep_interval)
+                # 按最近的到期任务计算休眠时长：空闲时线程睡到下一个截止点，
+                # 而不是固定50ms空转轮询（stop()置位事件时立即返回）
+                next_due = min(
+                    last_gpu_check_time + gpu_period,
+                    last_network_check_time + net_period,
+                    last_game_check_time + game_period,
+                    last_fps_check_time + fps_period,
+                    last_signal_time + (signal_interval if gaming else signal_interval * 2),
+                    self._last_cpu_temp_read_ts + 1.0,
+                )
+                wait_time = max(sleep_interval, next_due - time.monotonic())
+                if self._stop_event.wait(wait_time):
+                    break
                 
         except Exception as e:
             if self._running:  # 只有在线程正常运行时才发送错误信号
                 self.error_signal.emit(str(e))
             
+    def is_game_running(self):
+        """非阻塞读取最近一次游戏检测结果。
+        检测本身在工作线程的run循环中进行，这里只读发布的元组，
+        UI线程等任意调用方都不会被进程扫描/GPU查询阻塞。"""
+        return self._pub_state[0]
+
+    def current_fps(self):
+        """非阻塞读取最近一次FPS值（与is_game_running同一份发布状态）"""
+        return self._pub_state[1]
+
     def detect_gaming(self):
+        """游戏检测入口：先查按(前台进程, 标题)键的判定缓存，未命中才走完整检测级联。
+        非游戏判定TTL更长（30秒，典型场景是编辑器/浏览器长时间置前），
+        游戏判定TTL短（2秒，游戏可能随时退出）；窗口切换后键改变自动失效。"""
+        try:
+            fg = self._snapshot_foreground()
+            key = (fg.name, hash(fg.title_lower))
+            now = time.monotonic()
+            hit = self._verdict_cache.get(key)
+            if hit is not None:
+                verdict, expiry = hit
+                if now < expiry:
+                    self._verdict_cache.move_to_end(key)
+                    return verdict
+                del self._verdict_cache[key]
+            verdict = bool(self._detect_gaming_impl())
+            self._verdict_cache[key] = (verdict, now + (2.0 if verdict else 30.0))
+            if len(self._verdict_cache) > 64:
+                self._verdict_cache.popitem(last=False)
+            return verdict
+        except Exception as e:
+            logger.warning(f"游戏检测出错: {e}")
+            return False
+
+    def _detect_gaming_impl(self):
         """增强的游戏检测方法，提高准确性和响应速度"""
         try:
-            current_time = time.time()
+            # 只做差值比较，统一用单调时钟：不受NTP/调钟跳变影响，Windows上也更快
+            current_time = time.monotonic()
             
             # 优化缓存机制
-            if hasattr(self, '_last_detection_result') and hasattr(self, '_last_detection_time'):
+            if self._last_detection_result is not None:
                 # 如果最近刚检测到游戏状态，适当延长缓存时间
                 if self._last_detection_result and current_time - self._last_detection_time < 0.5:
                     return True
@@ -1045,59 +1824,65 @@ class SystemInfoWorker(QThread):
                 elif not self._last_detection_result and current_time - self._last_detection_time < 0.2:
                     return False
             
-            # 降低GPU负载阈值，提高游戏检测灵敏度 + 全屏加权（避免非游戏误判）
-            if hasattr(self, '_cached_gpu_load'):
-                is_fullscreen = False
-                try:
-                    is_fullscreen = self._is_foreground_fullscreen()
-                except Exception:
-                    pass
-
-                # 获取前台进程名和窗口标题（用于排除非游戏全屏）
-                foreground_process_name = None
-                try:
-                    # 尝试通过win32获取
-                    import win32process
-                    import win32gui
-                    hwnd = win32gui.GetForegroundWindow()
-                    if hwnd:
-                        _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                        foreground_proc = psutil.Process(pid)
-                        foreground_process_name = foreground_proc.name().lower()
-                except Exception:
-                    # 失败则忽略
-                    pass
-                # 兼容：若未获取到前台进程名，使用ctypes回退方案（无win32依赖）
-                if not foreground_process_name:
-                    try:
-                        foreground_process_name = self._get_foreground_process_name()
-                    except Exception:
-                        foreground_process_name = None
-                active_window_title = None
-                try:
-                    active_window_title = self._get_active_window_title() or ""
-                except Exception:
-                    active_window_title = ""
-                window_lower = active_window_title.lower()
+            # 前台窗口未切换时直接复用上次判定：稳态下免去整套进程/标题/全屏检测，
+            # 上限5秒强制重检一次，覆盖后台启动游戏等前台不变的场景
+            try:
+                hwnd_now = _GetForegroundWindow()
+            except Exception:
+                hwnd_now = None
+            if hwnd_now and hwnd_now == self._last_detection_hwnd and \
+               self._last_detection_result is not None and \
+               current_time - self._last_detection_time < 5.0:
+                return self._last_detection_result
+            self._last_detection_hwnd = hwnd_now
+            
+            # 前台窗口快照：一轮Win32调用同时得到进程名/标题/全屏状态，
+            # 本方法内各检测阶段共享，替代原先三组重复的逐项查询
+            fg = self._snapshot_foreground(hwnd_now)
+            foreground_process_name = fg.name
+            active_window_title = fg.title
+            window_lower = fg.title_lower
+            is_fullscreen = fg.is_fullscreen
+            
+            # 检测顺序按"代价递增"排列：纯快照/正则判断最先，GPU阈值其次，
+            # 全量进程扫描仅在前台进程无法识别时兜底
+            # 强化：只要前台属于非游戏应用或标题包含非游戏关键词，则直接判定非游戏（避免浏览器/播放器等误判）
+            if (foreground_process_name and foreground_process_name in _COMBINED_NON_GAME_SET) or \
+               (_NON_GAME_TITLE_RE is not None and _NON_GAME_TITLE_RE.search(window_lower)):
+                self._last_detection_result = False
+                self._last_detection_time = current_time
+                return False
 
-                # 强化：只要前台属于非游戏应用或标题包含非游戏关键词，则直接判定非游戏（避免浏览器/播放器等误判）
-                try:
-                    combined_processes = set(NON_GAME_PROCESSES) | set(CUSTOM_NON_GAME_PROCESSES) | set(LAUNCHER_PROCESSES)
-                    combined_titles = set(NON_GAME_TITLE_KEYWORDS) | set(CUSTOM_NON_GAME_TITLE_KEYWORDS)
-                except Exception:
-                    combined_processes = set(NON_GAME_PROCESSES)
-                    combined_titles = set(NON_GAME_TITLE_KEYWORDS)
-                if (foreground_process_name and foreground_process_name in combined_processes) or any(kw in window_lower for kw in combined_titles):
-                    self._last_detection_result = False
+            # 增强的窗口标题检测（标题已在快照中取得）
+            if active_window_title:
+                # 快速关键词匹配（预编译正则，一次扫描全部关键词）
+                if _GAME_TITLE_RE.search(window_lower):
+                    self._last_detection_result = True
                     self._last_detection_time = current_time
-                    return False
-
+                    return True
+                
+                # 检查是否匹配已知游戏窗口标题（更宽松的匹配：基名或其任一分词命中即可，
+                # 即使游戏名称有版本号或其他后缀；单次正则扫描替代逐项子串探测）
+                if GAME_BASE_TITLE_RE.search(window_lower):
+                    self._last_detection_result = True
+                    self._last_detection_time = current_time
+                    return True
+            
+            # 检查前台进程是否是游戏（排除平台启动器，进程名来自快照）
+            if foreground_process_name:
+                if foreground_process_name in GAME_PROCESS_SET and foreground_process_name not in LAUNCHER_PROCESS_SET:
+                    self._last_detection_result = True
+                    self._last_detection_time = current_time
+                    return True
+            
+            # 降低GPU负载阈值，提高游戏检测灵敏度 + 全屏加权（避免非游戏误判）
+            if self._cached_gpu_load:
                 is_non_game_fullscreen = False
                 if is_fullscreen and STRICT_NON_GAME_FULLSCREEN:
                     # 再次判断全屏场景下的非游戏排除
-                    if foreground_process_name and foreground_process_name in combined_processes:
+                    if foreground_process_name and foreground_process_name in _COMBINED_NON_GAME_SET:
                         is_non_game_fullscreen = True
-                    elif any(kw in window_lower for kw in combined_titles):
+                    elif _NON_GAME_TITLE_RE is not None and _NON_GAME_TITLE_RE.search(window_lower):
                         is_non_game_fullscreen = True
 
                 # GPU负载达到中等即可判定为游戏（不在非游戏全屏场景）
@@ -1114,137 +1899,28 @@ class SystemInfoWorker(QThread):
 
                 # 如果是非游戏的全屏场景，仅在GPU负载和内存占用都非常高时才判定为游戏
                 if is_non_game_fullscreen:
-                    try:
-                        gpus = GPUtil.getGPUs()
-                        if gpus:
-                            gpu = gpus[0]
-                            mem_util = 0.0
-                            if gpu.memoryTotal > 0:
-                                mem_util = gpu.memoryUsed / gpu.memoryTotal
-                            if self._cached_gpu_load >= 60 and mem_util >= 0.7:
-                                self._last_detection_result = True
-                                self._last_detection_time = current_time
-                                return True
-                    except Exception:
+                    info = self._query_gpu_fast()
+                    if info is not None:
+                        _, mem_used, mem_total = info
+                        mem_util = (mem_used / mem_total) if mem_total > 0 else 0.0
+                        if self._cached_gpu_load >= 60 and mem_util >= 0.7:
+                            self._last_detection_result = True
+                            self._last_detection_time = current_time
+                            return True
+                    else:
                         # 获取GPU内存失败时，仍然提高负载阈值避免误判
                         if self._cached_gpu_load >= 70:
                             self._last_detection_result = True
                             self._last_detection_time = current_time
                             return True
-            
-            # 缓存前台窗口标题，更频繁地更新
-            if not hasattr(self, '_cached_window_title') or current_time - getattr(self, '_last_window_check', 0) > 0.3:
-                self._cached_window_title = self._get_active_window_title()
-                self._last_window_check = current_time
-            
-            active_window_title = self._cached_window_title
-            
-            # 增强的窗口标题检测
-            if active_window_title:
-                window_lower = active_window_title.lower()
-                
-                # 扩展的游戏关键词集合
-                game_title_keywords = {
-                    'game', 'gaming', 'fps', 'rpg', 'moba', 'mmo', 'online', 
-                    'battle', 'war', 'fight', 'shoot', 'race', 'simulator',
-                    # 增加更多游戏相关关键词
-                    '使命召唤', 'cod', 'cs2', 'csgo', 'valorant', '彩虹六号',
-                    'lol', 'dota', 'fortnite', 'pubg', 'apex', '原神',
-                    'genshin', 'gta', 'cyberpunk', '赛博朋克', 'elden', '艾尔登',
-                    'starfield', '星空', 'palworld', '幻兽帕鲁', 'baldurs', '博德之门',
-                    # 添加穿越火线相关关键词
-                    'cf', 'crossfire', '穿越火线', 'cfhd', 'cf战场', 'cf爆破'
-                }  
-                # 快速关键词匹配
-                if any(keyword in window_lower for keyword in game_title_keywords):
-                    self._last_detection_result = True
-                    self._last_detection_time = current_time
-                    return True
-                
-                # 检查是否匹配已知游戏窗口标题（更宽松的匹配规则）
-                for game_name in COMMON_GAME_PROCESSES:
-                    game_base = game_name.replace('.exe', '').lower()
-                    # 使用更宽松的匹配，即使游戏名称有版本号或其他后缀
-                    if game_base in window_lower or any(part in window_lower for part in game_base.split()):
-                        self._last_detection_result = True
-                        self._last_detection_time = current_time
-                        return True
-            
-            # 增强的前台进程检测
-            foreground_process_name = None
-            try:
-                # 尝试多种方法获取前台进程
-                # 方法1：使用win32库
-                try:
-                    import win32process
-                    import win32gui
-                    hwnd = win32gui.GetForegroundWindow()
-                    if hwnd:
-                        _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                        foreground_proc = psutil.Process(pid)
-                        foreground_process_name = foreground_proc.name().lower()
-                except Exception:
-                    # 方法2：使用ctypes获取PID并用psutil取名
-                    foreground_process_name = self._get_foreground_process_name()
-            except Exception as e:
-                print(f"前台进程获取失败: {str(e)}")
-            
-            # 检查前台进程是否是游戏（排除平台启动器）
-            if foreground_process_name:
-                try:
-                    common_game_processes_lower = {name.lower() for name in COMMON_GAME_PROCESSES}
-                    if foreground_process_name in common_game_processes_lower and foreground_process_name not in LAUNCHER_PROCESSES:
-                        self._last_detection_result = True
-                        self._last_detection_time = current_time
-                        return True
-                except Exception as e:
-                    print(f"前台进程检测出错: {str(e)}")
-            
-            # 降低CPU使用率阈值，捕获更多可能的游戏进程
-            high_cpu_procs = []
-            for proc in psutil.process_iter(['name', 'cpu_percent']):
-                try:
-                    proc_info = proc.info
-                    # 降低阈值到1.5%，捕获更多低CPU占用的游戏
-                    if proc_info['cpu_percent'] and proc_info['cpu_percent'] > 1.5:
-                        high_cpu_procs.append(proc_info['name'].lower())
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    pass
-            
-            # 检查高CPU使用率进程中是否有游戏
-            common_game_processes_lower = {name.lower() for name in COMMON_GAME_PROCESSES}
-            if any(process_name in common_game_processes_lower for process_name in high_cpu_procs):
-                self._last_detection_result = True
-                self._last_detection_time = current_time
-                return True
-            
-            # 增强的GPU资源使用模式检测
-            try:
-                # 尝试使用缓存的GPU信息
-                if hasattr(self, '_cached_gpu_load'):
-                    gpu_load = self._cached_gpu_load / 100.0  # 转换为0-1范围
-                    
-                    # 降低GPU负载阈值到0.45，提高检测灵敏度
-                    if gpu_load > 0.45:
-                        # 检查是否为非游戏全屏，避免误判
-                        is_fullscreen = False
-                        is_non_game_fullscreen = False
-                        try:
-                            is_fullscreen = self._is_foreground_fullscreen()
-                            fg_name = self._get_foreground_process_name()
-                            win_title = (self._get_active_window_title() or "").lower()
-                            if is_fullscreen:
-                                if fg_name and fg_name in NON_GAME_PROCESSES:
-                                    is_non_game_fullscreen = True
-                                elif any(kw in win_title for kw in NON_GAME_TITLE_KEYWORDS):
-                                    is_non_game_fullscreen = True
-                        except Exception:
-                            pass
-                        # 即使内存使用率不是特别高，也可能是游戏
-                        gpus = GPUtil.getGPUs()
-                        if gpus:
-                            gpu_memory_used = gpus[0].memoryUsed
-                            gpu_memory_total = gpus[0].memoryTotal
+
+                # GPU负载较高时结合显存占用模式进一步判定
+                gpu_load = self._cached_gpu_load / 100.0
+                if gpu_load > 0.45:
+                    try:
+                        info = self._query_gpu_fast()
+                        if info is not None:
+                            _, gpu_memory_used, gpu_memory_total = info
                             if gpu_memory_total > 0:
                                 memory_utilization = gpu_memory_used / gpu_memory_total
                                 # 非非游戏全屏场景，适用较低阈值
@@ -1257,67 +1933,60 @@ class SystemInfoWorker(QThread):
                                     self._last_detection_result = True
                                     self._last_detection_time = current_time
                                     return True
-            except Exception as e:
-                print(f"GPU资源检测出错: {str(e)}")
+                    except Exception as e:
+                        logger.warning(f"GPU资源检测出错: {e}")
             
-            # 最后检查是否有已知游戏进程在运行（即使CPU使用率不高）
-            try:
-                running_process_names = {proc.info['name'].lower() for proc in psutil.process_iter(['name'])}
-                common_game_processes_lower = {name.lower() for name in COMMON_GAME_PROCESSES}
-                # 检查是否有任何游戏进程正在运行
-                intersection = common_game_processes_lower.intersection(running_process_names)
-                if intersection:
-                    # 过滤掉平台启动器，仅保留真正的游戏进程
-                    non_launcher = {p for p in intersection if p not in LAUNCHER_PROCESSES}
-                    # 判断当前是否为非游戏全屏（避免误判）
-                    is_fullscreen = False
-                    is_non_game_fullscreen = False
-                    try:
-                        is_fullscreen = self._is_foreground_fullscreen()
-                        fg_name = self._get_foreground_process_name()
-                        win_title = (self._get_active_window_title() or "").lower()
+            # 进程清单兜底：仅当前台进程无法识别时才做全量进程扫描，
+            # 前台已识别但非游戏的场景交给上面的GPU证据，避免常态下的全表遍历
+            if foreground_process_name is None:
+                running_process_names, high_cpu_procs = self._get_process_snapshot()
+                
+                # 高CPU启发只在确有已知游戏进程运行时才有意义（高CPU集是运行集的子集），
+                # 此时若快照来自纯名字枚举，再补一次带cpu_percent的psutil遍历
+                if not GAME_PROCESS_SET.isdisjoint(running_process_names):
+                    if high_cpu_procs is None:
+                        _, high_cpu_procs = self._get_process_snapshot(with_cpu=True)
+                    # 检查高CPU使用率进程中是否有游戏
+                    if high_cpu_procs and not GAME_PROCESS_SET.isdisjoint(high_cpu_procs):
+                        self._last_detection_result = True
+                        self._last_detection_time = current_time
+                        return True
+                
+                # 最后检查是否有已知游戏进程在运行（即使CPU使用率不高）
+                try:
+                    # 检查是否有任何游戏进程正在运行（预拆分子集 + isdisjoint短路，无中间集合分配）
+                    has_real_game = not REAL_GAME_PROCESS_SET.isdisjoint(running_process_names)
+                    if has_real_game or not LAUNCHER_GAME_PROCESS_SET.isdisjoint(running_process_names):
+                        # 判断当前是否为非游戏全屏（避免误判，字段来自快照）
+                        is_non_game_fullscreen = False
                         if is_fullscreen:
-                            if fg_name and fg_name in NON_GAME_PROCESSES:
+                            if foreground_process_name and foreground_process_name in NON_GAME_PROCESS_SET:
                                 is_non_game_fullscreen = True
-                            elif any(kw in win_title for kw in NON_GAME_TITLE_KEYWORDS):
+                            elif _NON_GAME_TITLE_RE is not None and _NON_GAME_TITLE_RE.search(window_lower):
                                 is_non_game_fullscreen = True
-                    except Exception:
-                        pass
-                    if non_launcher:
-                        # 有真正的游戏进程时，阈值从10%开始，但避免非游戏全屏干扰
-                        if hasattr(self, '_cached_gpu_load') and self._cached_gpu_load > 10 and not is_non_game_fullscreen:
-                            self._last_detection_result = True
-                            self._last_detection_time = current_time
-                            return True
-                    else:
-                        # 仅有启动器进程时，需要更高的证据，且排除非游戏全屏
-                        if hasattr(self, '_cached_gpu_load') and not is_non_game_fullscreen:
-                            try:
-                                gpus = GPUtil.getGPUs()
-                                mem_ok = False
-                                if gpus and gpus[0].memoryTotal > 0:
-                                    mem_util = gpus[0].memoryUsed / gpus[0].memoryTotal
-                                    mem_ok = mem_util >= 0.6
-                                if self._cached_gpu_load >= 50 and mem_ok:
-                                    self._last_detection_result = True
-                                    self._last_detection_time = current_time
-                                    return True
-                            except Exception:
-                                if self._cached_gpu_load >= 60:
-                                    self._last_detection_result = True
-                                    self._last_detection_time = current_time
-                                    return True
-            except Exception as e:
-                print(f"游戏进程检查出错: {str(e)}")
-            
-            # 记录非游戏状态
-            self._last_detection_result = False
-            self._last_detection_time = current_time
-            return False
-        except Exception as e:
-            # 出错时记录但不中断程序
-            print(f"游戏检测出错: {str(e)}")
-            return False
+                        if has_real_game:
+                            # 有真正的游戏进程时，阈值从10%开始，但避免非游戏全屏干扰
+                            if self._cached_gpu_load > 10 and not is_non_game_fullscreen:
+                                self._last_detection_result = True
+                                self._last_detection_time = current_time
+                                return True
+                        else:
+                            # 仅有启动器进程时，需要更高的证据，且排除非游戏全屏
+                            if not is_non_game_fullscreen:
+                                info = self._query_gpu_fast()
+                                if info is not None:
+                                    mem_ok = info[2] > 0 and (info[1] / info[2]) >= 0.6
+                                    if self._cached_gpu_load >= 50 and mem_ok:
+                                        self._last_detection_result = True
+                                        self._last_detection_time = current_time
+                                        return True
+                                else:
+                                    if self._cached_gpu_load >= 60:
+                                        self._last_detection_result = True
+                                        self._last_detection_time = current_time
+                                        return True
+                except Exception as e:
+                    logger.warning(f"游戏进程检查出错: {e}")
             
             # 记录非游戏状态
             self._last_detection_result = False
@@ -1325,84 +1994,235 @@ class SystemInfoWorker(QThread):
             return False
         except Exception as e:
             # 出错时记录但不中断程序
-            print(f"游戏检测出错: {str(e)}")
+            logger.warning(f"游戏检测出错: {e}")
             return False
             
     def _get_active_window_title(self):
-        """获取当前前台活动窗口的标题"""
+        """获取当前前台活动窗口的标题。
+        复用预分配的512字符缓冲区：省去每次的长度查询（少一次syscall）与缓冲区分配。"""
         try:
-            import ctypes
-            user32 = ctypes.windll.user32
-            hwnd = user32.GetForegroundWindow()
-            
-            # 获取窗口标题长度
-            length = user32.GetWindowTextLengthW(hwnd)
-            
-            # 创建缓冲区
-            buff = ctypes.create_unicode_buffer(length + 1)
-            
-            # 获取窗口标题
-            user32.GetWindowTextW(hwnd, buff, length + 1)
-            
-            return buff.value
+            hwnd = _GetForegroundWindow()
+            if not hwnd:
+                return None
+            buf = self._title_buf
+            n = _GetWindowTextW(hwnd, buf, 512)
+            return buf.value if n > 0 else ""
         except Exception:
             return None
             
+    def _screen_size(self):
+        """缓存的主屏尺寸(宽, 高)，60秒过期；免去检测节拍上反复的GetSystemMetrics调用"""
+        now = time.monotonic()
+        if now - self._screen_size_ts > 60.0:
+            try:
+                self._screen_size_cache = (_GetSystemMetrics(0), _GetSystemMetrics(1))
+            except Exception:
+                pass
+            self._screen_size_ts = now
+        return self._screen_size_cache
+
     def _is_foreground_fullscreen(self):
         """判断前台窗口是否为全屏（无边框或占满屏幕）。"""
         try:
-            import ctypes
-            from ctypes import wintypes
-            user32 = ctypes.windll.user32
-            hwnd = user32.GetForegroundWindow()
+            hwnd = _GetForegroundWindow()
             if not hwnd:
                 return False
             # 获取窗口矩形
             rect = wintypes.RECT()
-            if not user32.GetWindowRect(hwnd, ctypes.byref(rect)):
+            if not _GetWindowRect(hwnd, ctypes.byref(rect)):
                 return False
             width = rect.right - rect.left
             height = rect.bottom - rect.top
-            # 屏幕分辨率
-            screen_w = user32.GetSystemMetrics(0)
-            screen_h = user32.GetSystemMetrics(1)
-            # 尺寸接近全屏的容差（2% 或至少8像素）
-            size_full = (abs(width - screen_w) <= max(8, int(screen_w * 0.02)) and
-                         abs(height - screen_h) <= max(8, int(screen_h * 0.02)))
-            # 无标题栏/弹出样式判断
+            # 屏幕分辨率（缓存值）
+            screen_w, screen_h = self._screen_size()
             GWL_STYLE = -16
             WS_CAPTION = 0x00C00000
             WS_POPUP = 0x80000000
-            style = user32.GetWindowLongW(hwnd, GWL_STYLE)
-            borderless = (style & WS_CAPTION) == 0 or (style & WS_POPUP) == WS_POPUP
-            return size_full and borderless
+            style = _GetWindowLongW(hwnd, GWL_STYLE)
+            # 尺寸接近全屏（2%或至少8像素容差）且无标题栏/弹出样式；
+            # 位运算合并为单一表达式，数据不可预测时避免多级短路分支
+            return bool(((abs(width - screen_w) <= max(8, int(screen_w * 0.02))) &
+                         (abs(height - screen_h) <= max(8, int(screen_h * 0.02)))) &
+                        (((style & WS_CAPTION) == 0) | ((style & WS_POPUP) == WS_POPUP)))
         except Exception:
             return False
 
+    def _enum_process_names_fast(self):
+        """通过EnumProcesses+QueryFullProcessImageNameW批量枚举运行进程名（小写frozenset）。
+        相比psutil.process_iter逐进程构造Process对象并读PEB，这里是一个紧凑的
+        ctypes循环加一次列表构建；psapi不可用或调用失败时返回None，由调用方回退psutil。"""
+        try:
+            if _EnumProcesses is None or _OpenProcess is None:
+                return None
+            pids = (wintypes.DWORD * 4096)()
+            needed = wintypes.DWORD()
+            if not _EnumProcesses(pids, ctypes.sizeof(pids), ctypes.byref(needed)):
+                return None
+            count = needed.value // ctypes.sizeof(wintypes.DWORD)
+            names = set()
+            buf = ctypes.create_unicode_buffer(260)
+            PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+            for i in range(count):
+                pid = pids[i]
+                if not pid:
+                    continue
+                handle = _OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+                if not handle:
+                    # 系统进程等无权限项直接跳过
+                    continue
+                try:
+                    buf_len = wintypes.DWORD(260)
+                    if _QueryFullProcessImageNameW(handle, 0, buf, ctypes.byref(buf_len)):
+                        names.add(os.path.basename(buf.value).lower())
+                finally:
+                    _CloseHandle(handle)
+            return frozenset(names)
+        except Exception:
+            return None
+
+    def _get_process_snapshot(self, with_cpu=False):
+        """获取进程快照(运行进程名集合, 高CPU进程名集合或None)，1.5秒缓存复用。
+        默认只取名字：优先走ctypes批量枚举；with_cpu=True或枚举不可用时
+        回退psutil单次全量遍历，同时采集cpu_percent。"""
+        now = time.monotonic()
+        snap = self._proc_snapshot
+        if snap is not None and now - self._proc_snapshot_time < 1.5 and \
+           (snap[1] is not None or not with_cpu):
+            return snap
+        names = None
+        high_cpu = None
+        if not with_cpu:
+            names = self._enum_process_names_fast()
+        if names is None:
+            name_set = set()
+            cpu_set = set()
+            for proc in psutil.process_iter(['name', 'cpu_percent']):
+                try:
+                    proc_info = proc.info
+                    name = (proc_info['name'] or '').lower()
+                    if not name:
+                        continue
+                    name_set.add(name)
+                    # 降低阈值到1.5%，捕获更多低CPU占用的游戏
+                    if proc_info['cpu_percent'] and proc_info['cpu_percent'] > 1.5:
+                        cpu_set.add(name)
+                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                    pass
+            names = frozenset(name_set)
+            high_cpu = frozenset(cpu_set)
+        self._proc_snapshot = (names, high_cpu)
+        self._proc_snapshot_time = now
+        return self._proc_snapshot
+
+    def _resolve_process_name(self, hwnd, pid):
+        """按(hwnd, pid)缓存解析进程映像名：OpenProcess+QueryFullProcessImageNameW直取，
+        前台窗口未切换时不再触发任何进程查询。"""
+        cached = self._fg_name_cache
+        if cached is not None and cached[0] == hwnd and cached[1] == pid:
+            return cached[2]
+        name = None
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        handle = _OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if handle:
+            try:
+                buf_len = wintypes.DWORD(1024)
+                buf = ctypes.create_unicode_buffer(buf_len.value)
+                if _QueryFullProcessImageNameW(handle, 0, buf, ctypes.byref(buf_len)):
+                    name = os.path.basename(buf.value).lower()
+            finally:
+                _CloseHandle(handle)
+        if name is None:
+            # 句柄权限不足等情况回退psutil单进程查询
+            try:
+                name = psutil.Process(pid).name().lower()
+            except Exception:
+                name = None
+        self._fg_name_cache = (hwnd, pid, name)
+        return name
+
     def _get_foreground_process_name(self):
         """使用ctypes获取前台窗口的进程名（无需win32依赖）。"""
         try:
-            import ctypes
-            user32 = ctypes.windll.user32
-            hwnd = user32.GetForegroundWindow()
+            hwnd = _GetForegroundWindow()
             if not hwnd:
                 return None
-            pid = ctypes.c_ulong()
-            user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
-            if pid.value:
-                try:
-                    p = psutil.Process(pid.value)
-                    return p.name().lower()
-                except Exception:
-                    return None
-            return None
+            pid = wintypes.DWORD()
+            _GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+            if not pid.value:
+                return None
+            return self._resolve_process_name(hwnd, pid.value)
         except Exception:
             return None
 
+    def _snapshot_foreground(self, hwnd=None):
+        """一次性采集前台窗口快照（进程名/标题/全屏状态），0.3秒内复用。
+        检测路径此前分三组各自调用GetForegroundWindow加配套查询，融合后
+        每个检测周期只做一轮Win32调用，后续阶段全部读取快照字段。"""
+        now = time.monotonic()
+        snap = self._fg_snapshot
+        if snap is not None and now - self._fg_snapshot_time < 0.3:
+            return snap
+        pid = 0
+        name = None
+        title = ""
+        is_fullscreen = False
+        try:
+            if hwnd is None:
+                hwnd = _GetForegroundWindow()
+            if hwnd:
+                # 窗口标题（预分配缓冲区，免去长度查询与逐次分配）
+                buf = self._title_buf
+                n = _GetWindowTextW(hwnd, buf, 512)
+                title = buf.value if n > 0 else ""
+                # 进程名（复用(hwnd, pid)缓存）
+                pid_buf = wintypes.DWORD()
+                _GetWindowThreadProcessId(hwnd, ctypes.byref(pid_buf))
+                pid = pid_buf.value
+                if pid:
+                    name = self._resolve_process_name(hwnd, pid)
+                # 全屏判断：尺寸接近屏幕（缓存的屏幕尺寸）且无标题栏/弹出样式
+                rect = wintypes.RECT()
+                if _GetWindowRect(hwnd, ctypes.byref(rect)):
+                    width = rect.right - rect.left
+                    height = rect.bottom - rect.top
+                    screen_w, screen_h = self._screen_size()
+                    GWL_STYLE = -16
+                    WS_CAPTION = 0x00C00000
+                    WS_POPUP = 0x80000000
+                    style = _GetWindowLongW(hwnd, GWL_STYLE)
+                    is_fullscreen = bool(
+                        ((abs(width - screen_w) <= max(8, int(screen_w * 0.02))) &
+                         (abs(height - screen_h) <= max(8, int(screen_h * 0.02)))) &
+                        (((style & WS_CAPTION) == 0) | ((style & WS_POPUP) == WS_POPUP)))
+        except Exception:
+            pass
+        snap = ForegroundSnapshot(hwnd or 0, pid, name, title, title.lower(), is_fullscreen)
+        self._fg_snapshot = snap
+        self._fg_snapshot_time = now
+        return snap
+
     
     def _init_gpu_info(self):
-        """初始化GPU型号和厂商信息，用于针对性优化FPS计算"""
+        """初始化GPU型号和厂商信息，用于针对性优化FPS计算。
+        型号/驱动等静态信息运行期不变，只在这里查询一次并缓存到self._static_gpu。"""
         try:
+            # NVML可用时直接读静态信息，无需经GPUtil派生子进程
+            if self._nvml_handle is not None:
+                try:
+                    import pynvml
+                    name = pynvml.nvmlDeviceGetName(self._nvml_handle)
+                    if isinstance(name, bytes):
+                        name = name.decode('utf-8', 'replace')
+                    driver = pynvml.nvmlSystemGetDriverVersion()
+                    if isinstance(driver, bytes):
+                        driver = driver.decode('utf-8', 'replace')
+                    self._static_gpu = {'name': name, 'driver': driver}
+                    self.gpu_model = name.lower()
+                    self.gpu_vendor = 'nvidia'
+                    logger.info(f"GPU静态信息(NVML): {name}, 驱动 {driver}")
+                    return
+                except Exception as e:
+                    logger.debug(f"NVML静态信息读取失败: {e}")
             gpus = GPUtil.getGPUs()
             if gpus:
                 gpu = gpus[0]
@@ -1417,6 +2237,8 @@ class SystemInfoWorker(QThread):
                     self.gpu_vendor = 'intel'
                 else:
                     self.gpu_vendor = 'unknown'
+                self._static_gpu = {'name': getattr(gpu, 'name', '') or '',
+                                    'driver': getattr(gpu, 'driver', '') or ''}
             else:
                 # 回退：使用显示设备枚举推断GPU厂商与型号，不依赖外部命令
                 try:
@@ -1489,10 +2311,13 @@ class SystemInfoWorker(QThread):
                     self._has_query_perf_counter = True
                     self._perf_frequency = freq.value
                 
-                # 初始化计数器变量
-                self._last_counter_value = ctypes.c_ulonglong()
-                self._query_perf_counter(ctypes.byref(self._last_counter_value))
-                
+                # 初始化计数器变量：缓冲区与byref包装一次性预分配，
+                # 每tick复用，上次读数存成普通int免去.value属性访问
+                self._counter_buf = ctypes.c_ulonglong()
+                self._counter_ref = ctypes.byref(self._counter_buf)
+                self._query_perf_counter(self._counter_ref)
+                self._last_counter_value = self._counter_buf.value
+
             except Exception:
                 self._has_query_perf_counter = False
                 
@@ -1500,7 +2325,12 @@ class SystemInfoWorker(QThread):
             pass
             
     def _get_display_refresh_rate_hz(self):
-        """获取主显示器刷新率（Hz），使用GetDeviceCaps，并进行本地缓存"""
+        """获取主显示器刷新率（Hz）。类型稳定：恒返回int且不抛异常，
+        缓存优先——5分钟内直接返回，过期才走GDI查询。
+        缓存字段始终是int，调用侧不再需要isinstance防御。"""
+        cached = self._display_refresh_hz
+        if cached > 0 and time.monotonic() - self._last_refresh_query < 300:
+            return cached
         try:
             # 使用Windows API获取设备上下文
             user32 = ctypes.windll.user32
@@ -1512,23 +2342,70 @@ class SystemInfoWorker(QThread):
                 user32.ReleaseDC(0, hdc)
                 if refresh and refresh > 0:
                     self._display_refresh_hz = int(refresh)
-                    self._last_refresh_query = time.time()
+                    self._last_refresh_query = time.monotonic()
                     return self._display_refresh_hz
         except Exception:
             pass
-        # 如果之前查询过且值有效，返回缓存
-        if hasattr(self, '_display_refresh_hz') and isinstance(self._display_refresh_hz, int) and self._display_refresh_hz > 0:
-            # 超过5分钟才重新查询
-            if hasattr(self, '_last_refresh_query') and time.time() - getattr(self, '_last_refresh_query', 0) < 300:
-                return self._display_refresh_hz
-        # 默认返回60Hz
+        # 查询失败：有旧缓存则沿用（即使过期也好于盲猜），否则默认60Hz
+        if cached > 0:
+            self._last_refresh_query = time.monotonic()
+            return cached
         self._display_refresh_hz = 60
-        self._last_refresh_query = time.time()
+        self._last_refresh_query = time.monotonic()
         return self._display_refresh_hz
-            
+
+    def _get_display_upper_cap(self, floor=240, num=3, den=2):
+        """基于缓存刷新率计算FPS上限 max(floor, hz*num/den)。
+        系数以整数分数传入（1.50→3/2，1.15→23/20），全程整数运算"""
+        refresh_hz = self._get_display_refresh_rate_hz()
+        if refresh_hz > 0:
+            return max(floor, (refresh_hz * num) // den)
+        return floor
+
+    def _collect_fps_candidates(self):
+        """并发采样各FPS来源。RTSS只是读共享内存，毫秒级返回，先同步尝试：
+        命中即单源直用；其余阻塞型来源（PDH/GPU查询等）提交到常驻线程池并发跑，
+        整体耗时从各来源之和降为最慢单个来源（0.25秒封顶）。
+        返回(rtss_value, rtss_present, candidates)。"""
+        candidates = []
+        method_weights = self._fps_method_weights
+        # 注意用元组里存的同一个绑定方法对象做is比较；每次点取属性会生成新对象
+        rtss_method = self._fps_methods[0]
+        others = []
+        for method in self._fps_methods:
+            if method is rtss_method:
+                try:
+                    value = method()
+                    if 1 <= value <= 400:
+                        # RTSS单源优先，拿到有效值后不再碰其他来源
+                        return value, True, candidates
+                except Exception as e:
+                    logger.warning(f"FPS方法 {method.__name__} 出错: {e}")
+            else:
+                others.append(method)
+        if others:
+            pool = self._fps_pool
+            if pool is None:
+                pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='fps_probe')
+                self._fps_pool = pool
+            futures = {pool.submit(method): method for method in others}
+            done, not_done = futures_wait(futures, timeout=0.25)
+            for fut in not_done:
+                # 尽力取消：尚未启动的任务不再执行，已在跑的任其自然结束
+                fut.cancel()
+            for fut in done:
+                method = futures[fut]
+                try:
+                    value = fut.result()
+                    if 1 <= value <= 400:
+                        candidates.append((value, method_weights.get(method, 0.6)))
+                except Exception as e:
+                    logger.warning(f"FPS方法 {method.__name__} 出错: {e}")
+        return None, False, candidates
+
     def get_fps(self, is_gaming):
         """优化的FPS获取方法，提高响应速度和准确性，特别针对CF等FPS游戏"""
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # 如果不是游戏状态，返回0
         if not is_gaming:
@@ -1542,13 +2419,11 @@ class SystemInfoWorker(QThread):
             
             # 1. 检查活动窗口标题中是否包含CF相关关键词
             try:
-                active_window_title = self._get_active_window_title()
+                active_window_title = self._snapshot_foreground().title
                 if active_window_title:
-                    window_lower = active_window_title.lower()
-                    cf_window_keywords = ['crossfire', 'cf', '穿越火线', 'cfhd', 'cf战场', 'cf爆破']
-                    if any(keyword in window_lower for keyword in cf_window_keywords):
+                    if _CF_WINDOW_RE.search(active_window_title):
                         is_cf_game = True
-                        print(f"从活动窗口标题检测到CF游戏: {active_window_title}")
+                        logger.debug("从活动窗口标题检测到CF游戏: %s", active_window_title)
             except Exception:
                 pass
             
@@ -1556,25 +2431,23 @@ class SystemInfoWorker(QThread):
             if not is_cf_game:
                 active_game = self._get_active_game_process()
                 if active_game:
-                    active_game_lower = active_game.lower()
-                    if any(cf_kw in active_game_lower for cf_kw in ['crossfire', 'cf']):
+                    if _CF_PROC_RE.search(active_game):
                         is_cf_game = True
-                        print(f"从活动游戏进程检测到CF游戏: {active_game}")
+                        logger.debug("从活动游戏进程检测到CF游戏: %s", active_game)
             
             # 3. 检查进程列表中的CF相关进程
             if not is_cf_game:
                 try:
-                    running_processes = {proc.info['name'].lower() for proc in psutil.process_iter(['name'])} 
-                    cf_processes = {'crossfire.exe', 'cf.exe', 'crossfire_launcher.exe', 'crossfire_x.exe', 'client.exe'}
-                    is_cf_game = bool(cf_processes.intersection(running_processes))
+                    running_processes, _ = self._get_process_snapshot()
+                    is_cf_game = not _CF_PROCESS_SET.isdisjoint(running_processes)
                     if is_cf_game:
-                        print("从进程列表检测到CF游戏，使用优化的FPS获取策略")
+                        logger.debug("从进程列表检测到CF游戏，使用优化的FPS获取策略")
                 except Exception:
                     pass
             
             # 4. 如果检测到CF游戏，打印日志确认
             if is_cf_game:
-                print("CF游戏检测成功，将使用专用FPS计算逻辑")
+                logger.debug("CF游戏检测成功，将使用专用FPS计算逻辑")
             
             # CF游戏的缓存策略更激进，更新更频繁
             cache_valid = False
@@ -1588,10 +2461,8 @@ class SystemInfoWorker(QThread):
                 if (current_time - self.last_fps_timestamp < 0.2 and 
                     self.fps_cache > 0):
                     # 降低历史记录更新间隔
-                    if not hasattr(self, '_last_history_update') or current_time - self._last_history_update > 0.3:
+                    if current_time - self._last_history_update > 0.3:
                         self.fps_history.append(self.fps_cache)
-                        if len(self.fps_history) > self.fps_smoothing_window:
-                            self.fps_history.pop(0)
                         self._last_history_update = current_time
                     cache_valid = True
             
@@ -1606,175 +2477,55 @@ class SystemInfoWorker(QThread):
                 # CF专用路径非RTSS来源，设置来源标记为False；若后续使用RTSS会再次更新
                 self._last_source_rtss = False
                 if not method_success:
-                    # 回退到通用聚合方法，优先尝试RTSS共享内存（若有）
-                    if SAFE_PACKAGED_MODE:
-                        # 打包安全模式：优先RTSS，其次采用估算，跳过原生计数器
-                        fps_methods = [
-                            self._get_fps_using_rtss_shared_memory,
-                            self._get_fps_using_gpu_load_temp_and_memory,
-                        ]
-                    else:
-                        fps_methods = [
-                            self._get_fps_using_rtss_shared_memory,
-                            self._get_fps_using_windows_gaming_api,
-                            self._get_fps_using_gpu_performance_counters,
-                            self._get_fps_using_direct_query,
-                            self._get_fps_using_gpu_load_temp_and_memory,
-                        ]
-                    method_weights = {
-                        self._get_fps_using_rtss_shared_memory: 1.0,
-                        self._get_fps_using_windows_gaming_api: 1.0,
-                        self._get_fps_using_gpu_performance_counters: 0.85,
-                        self._get_fps_using_direct_query: 0.75,
-                        self._get_fps_using_gpu_load_temp_and_memory: 0.55,
-                    }
-                    start_time = time.time()
-                    candidates = []
-                    rtss_present = False
-                    rtss_value = None
-                    for method in fps_methods:
-                        if time.time() - start_time > 0.25:
-                            break
-                        try:
-                            value = method()
-                            if 1 <= value <= 400:
-                                if method is self._get_fps_using_rtss_shared_memory:
-                                    rtss_present = True
-                                    rtss_value = value
-                                    # RTSS单源优先，拿到有效值后直接使用
-                                    break
-                                else:
-                                    candidates.append((value, method_weights.get(method, 0.6)))
-                        except Exception as e:
-                            print(f"FPS方法 {method.__name__} 出错: {str(e)}")
-                            continue
+                    # 回退到通用聚合：RTSS快路径+线程池并发采样其余来源
+                    # （来源序列与权重已在构造时准备好）
+                    rtss_value, rtss_present, candidates = self._collect_fps_candidates()
                     if rtss_value is not None:
                         raw_fps = rtss_value
                         method_success = True
                     else:
                         if candidates:
-                            values_only = [v for v, w in candidates]
-                            values_only.sort()
-                            if len(values_only) > 3:
-                                trimmed_min = values_only[1]
-                                trimmed_max = values_only[-2]
-                                filtered = [(v, w) for v, w in candidates if trimmed_min <= v <= trimmed_max]
-                            else:
-                                filtered = candidates
-                            total_weight = sum(w for _, w in filtered)
-                            if total_weight > 0:
-                                raw_fps = sum(v * w for v, w in filtered) / total_weight
+                            mean_fps = self._weighted_trimmed_mean(candidates)
+                            if mean_fps is not None:
+                                raw_fps = mean_fps
                                 method_success = True
                     # 设置来源标记，供下游平滑逻辑使用
                     self._last_source_rtss = bool(rtss_value)
                     if not method_success:
                         try:
-                            if hasattr(self, '_cached_gpu_load'):
-                                gpu_load = self._cached_gpu_load / 100.0
-                                if gpu_load < 0.1:
-                                    raw_fps = 20
-                                elif gpu_load < 0.3:
-                                    raw_fps = min(60, int(gpu_load * 150 + 25))
-                                else:
-                                    raw_fps = min(240, int(gpu_load * 200 + 10))
+                            if self._cached_gpu_load:
+                                raw_fps = _FPS_FALLBACK_LUT[min(100, max(0, int(self._cached_gpu_load)))]
                             else:
-                                gpus = GPUtil.getGPUs()
-                                if gpus:
-                                    gpu_load = gpus[0].load
-                                    if gpu_load < 0.1:
-                                        raw_fps = 20
-                                    elif gpu_load < 0.3:
-                                        raw_fps = min(60, int(gpu_load * 150 + 25))
-                                    else:
-                                        raw_fps = min(240, int(gpu_load * 200 + 10))
+                                info = self._query_gpu_fast()
+                                if info is not None:
+                                    raw_fps = _FPS_FALLBACK_LUT[min(100, max(0, int(info[0])))]
                                 else:
                                     raw_fps = 30
                         except Exception as e:
-                            print(f"回退FPS估算出错: {str(e)}")
+                            logger.warning(f"回退FPS估算出错: {e}")
                             raw_fps = 30
                     try:
-                        refresh_hz = self._get_display_refresh_rate_hz()
-                        if isinstance(refresh_hz, int) and refresh_hz > 0 and not rtss_present:
-                            upper_cap = max(240, int(refresh_hz * 1.50))
-                            raw_fps = min(raw_fps, upper_cap)
+                        if not rtss_present:
+                            raw_fps = min(raw_fps, self._get_display_upper_cap())
                     except Exception:
                         pass
             else:
-                # 常规游戏FPS获取逻辑
-                # 优先使用更可靠的计数器方法，并综合多个来源
-                fps_methods = []
-                
-                if SAFE_PACKAGED_MODE:
-                    # 打包安全模式：只使用RTSS与估算，跳过原生计数器
-                    fps_methods.append(self._get_fps_using_rtss_shared_memory)
-                    fps_methods.append(self._get_fps_using_gpu_load_temp_and_memory)
-                else:
-                    # RTSS共享内存（若安装RTSS/Afterburner，置信度最高）
-                    fps_methods.append(self._get_fps_using_rtss_shared_memory)
-                    
-                    # Windows 游戏/图形计数器（高置信）
-                    fps_methods.append(self._get_fps_using_windows_gaming_api)
-                    
-                    # GPU厂商性能计数器（中高置信）
-                    fps_methods.append(self._get_fps_using_gpu_performance_counters)
-                    
-                    # 直接查询（中等置信）
-                    fps_methods.append(self._get_fps_using_direct_query)
-                    
-                    # GPU负载/温度/显存估算（低置信）
-                    fps_methods.append(self._get_fps_using_gpu_load_temp_and_memory)
-                
-                # 方法置信权重
-                method_weights = {
-                    self._get_fps_using_rtss_shared_memory: 1.0,
-                    self._get_fps_using_windows_gaming_api: 1.0,
-                    self._get_fps_using_gpu_performance_counters: 0.85,
-                    self._get_fps_using_direct_query: 0.75,
-                    self._get_fps_using_gpu_load_temp_and_memory: 0.55,
-                }
-                
-                # 设置时间预算并采样多个来源
+                # 常规游戏FPS获取逻辑：综合多个来源
+                # RTSS快路径+线程池并发采样其余来源（0.25秒预算，
+                # 来源序列与权重已在构造时准备好）
                 raw_fps = 0
                 method_success = False
-                start_time = time.time()
-                candidates = []
-                rtss_present = False
-                rtss_value = None
-                
-                for method in fps_methods:
-                    if time.time() - start_time > 0.25:
-                        break
-                    try:
-                        value = method()
-                        if 1 <= value <= 400:
-                            if method is self._get_fps_using_rtss_shared_memory:
-                                rtss_present = True
-                                rtss_value = value
-                                # RTSS单源优先，拿到有效值后直接使用
-                                break
-                            else:
-                                candidates.append((value, method_weights.get(method, 0.6)))
-                    except Exception as e:
-                        print(f"FPS方法 {method.__name__} 出错: {str(e)}")
-                        continue
-                
+                rtss_value, rtss_present, candidates = self._collect_fps_candidates()
+
                 if rtss_value is not None:
                     raw_fps = rtss_value
                     method_success = True
                 else:
                     if candidates:
                         # 去除极端值后做加权平均
-                        values_only = [v for v, w in candidates]
-                        values_only.sort()
-                        if len(values_only) > 3:
-                            trimmed_min = values_only[1]
-                            trimmed_max = values_only[-2]
-                            filtered = [(v, w) for v, w in candidates if trimmed_min <= v <= trimmed_max]
-                        else:
-                            filtered = candidates
-                        total_weight = sum(w for _, w in filtered)
-                        if total_weight > 0:
-                            raw_fps = sum(v * w for v, w in filtered) / total_weight
+                        mean_fps = self._weighted_trimmed_mean(candidates)
+                        if mean_fps is not None:
+                            raw_fps = mean_fps
                             method_success = True
                 
                 # 设置来源标记，供下游平滑逻辑使用
@@ -1785,86 +2536,72 @@ class SystemInfoWorker(QThread):
                     try:
                         # 获取显示器刷新率用于上限约束
                         try:
-                            refresh_hz = self._get_display_refresh_rate_hz()
-                            upper_cap = max(240, int(refresh_hz * 1.50)) if isinstance(refresh_hz, int) and refresh_hz > 0 else 240
+                            upper_cap = self._get_display_upper_cap()
                         except Exception:
                             upper_cap = 240
                         # 优先使用缓存的GPU负载
                         gpu_load = None
-                        if hasattr(self, '_cached_gpu_load'):
+                        if self._cached_gpu_load:
                             gpu_load = self._cached_gpu_load / 100.0
                         else:
-                            try:
-                                gpus = GPUtil.getGPUs()
-                                if gpus:
-                                    gpu_load = gpus[0].load
-                            except Exception:
-                                gpu_load = None
+                            info = self._query_gpu_fast()
+                            if info is not None:
+                                gpu_load = info[0] / 100.0
                         if gpu_load is not None:
-                            # 刷新率感知映射：负载越高，越接近刷新率上限
-                            if gpu_load < 0.10:
-                                raw_fps = max(20, int(upper_cap * 0.35))
-                            elif gpu_load < 0.30:
-                                raw_fps = int(upper_cap * (0.50 + gpu_load * 0.4))
-                            elif gpu_load < 0.60:
-                                raw_fps = int(upper_cap * (0.65 + (gpu_load - 0.30) * 0.5))
-                            elif gpu_load < 0.85:
-                                raw_fps = int(upper_cap * (0.80 + (gpu_load - 0.60) * 0.4))
-                            else:
-                                raw_fps = int(upper_cap * (0.95 + (gpu_load - 0.85) * 0.2))
-                            raw_fps = min(raw_fps, upper_cap)
+                            # 刷新率感知映射：预展开曲线查表，免去逐级分支
+                            frac = _FALLBACK_FRAC_LUT[min(100, max(0, int(gpu_load * 100)))]
+                            raw_fps = min(max(20, int(upper_cap * frac)), upper_cap)
                         else:
                             # 无法获取负载时，按刷新率的80%估计
                             raw_fps = int(upper_cap * 0.80)
                     except Exception as e:
-                        print(f"回退FPS估算出错: {str(e)}")
+                        logger.warning(f"回退FPS估算出错: {e}")
                         raw_fps = 60
                 
                 # 根据显示器刷新率做上限约束，仅在无RTSS参与时应用，避免裁剪真实高FPS
                 try:
-                    refresh_hz = self._get_display_refresh_rate_hz()
-                    if isinstance(refresh_hz, int) and refresh_hz > 0 and not rtss_present:
-                        upper_cap = max(240, int(refresh_hz * 1.50))
-                        raw_fps = min(raw_fps, upper_cap)
+                    if not rtss_present:
+                        raw_fps = min(raw_fps, self._get_display_upper_cap())
                 except Exception:
                     pass
             
-            # 优化帧时间计算，减少计算频率
-            if self._has_query_perf_counter and (not hasattr(self, '_last_counter_time') or 
-                                               current_time - self._last_counter_time > 0.2):
-                current_counter = ctypes.c_ulonglong()
-                if self._query_perf_counter(ctypes.byref(current_counter)):
-                    elapsed = (current_counter.value - self._last_counter_value.value) / self._perf_frequency
+            # 优化帧时间计算，减少计算频率；RTSS来源时帧时间不参与混合，
+            # 降到1秒一采只为保温历史，供RTSS失效后的回退使用
+            if self._has_query_perf_counter and \
+               current_time - self._last_counter_time > (1.0 if self._last_source_rtss else 0.2):
+                # 复用预分配缓冲区与byref包装，免去每tick的ctypes对象分配
+                if self._query_perf_counter(self._counter_ref):
+                    counter_now = self._counter_buf.value
+                    elapsed = (counter_now - self._last_counter_value) / self._perf_frequency
                     if elapsed > 0.001:  # 避免除零错误
                         frame_time_ms = elapsed * 1000
                         self.frame_time_history.append(frame_time_ms)
-                        # 保持历史记录长度，但减小窗口以提高响应速度
-                        if len(self.frame_time_history) > self.fps_smoothing_window:
-                            self.frame_time_history.pop(0)
-                        
+
                     # 更新最后计数器值和时间
-                    self._last_counter_value = current_counter
+                    self._last_counter_value = counter_now
                     self._last_counter_time = current_time
             
             # 应用帧时间辅助计算（仅在非RTSS来源时）
-            if len(self.frame_time_history) > 3 and not getattr(self, '_last_source_rtss', False):
-                avg_frame_time = sum(self.frame_time_history[-3:]) / len(self.frame_time_history[-3:])
+            if len(self.frame_time_history) > 3 and not self._last_source_rtss:
+                recent_ft = list(self.frame_time_history)[-3:]
+                avg_frame_time = sum(recent_ft) / len(recent_ft)
                 if avg_frame_time > 0:
                     ft_fps = 1000.0 / avg_frame_time
                     # 帧时间仅作为轻微参考，统一较低权重，避免偏差（RTSS来源时不参与混合）
                     if 1 <= ft_fps <= 400:
                         raw_fps = raw_fps * 0.95 + ft_fps * 0.05
             
-            # 应用游戏特定的修正值
-            if not is_cf_game and active_game:
-                # 尝试完全匹配
-                if active_game in self.game_specific_fps_offsets:
-                    raw_fps += self.game_specific_fps_offsets[active_game]
+            # 应用游戏特定的修正值（RTSS为实测帧率，无需估算修正，直接跳到平滑）
+            if not is_cf_game and active_game and not self._last_source_rtss:
+                active_game_lower = active_game.lower()
+                # 尝试完全匹配（键已在初始化时统一为小写）
+                offset = self.game_specific_fps_offsets.get(active_game_lower)
+                if offset is not None:
+                    raw_fps += offset
                 else:
-                    # 尝试部分匹配（游戏名称可能有版本号等）
-                    for game_name, offset in self.game_specific_fps_offsets.items():
-                        game_base_name = game_name.lower().replace('.exe', '')
-                        if game_base_name in active_game.lower():
+                    # 尝试部分匹配（游戏名称可能有版本号等），匹配表已在初始化时剥好.exe
+                    for game_base_name, offset in self._fps_offset_partials:
+                        if game_base_name in active_game_lower:
                             raw_fps += offset
                             break
                 
@@ -1888,7 +2625,7 @@ class SystemInfoWorker(QThread):
             
             return self.fps_cache
         except Exception as e:
-            print(f"FPS获取出错: {str(e)}")
+            logger.warning(f"FPS获取出错: {e}")
             return 0
     
     def _get_cf_specific_fps(self):
@@ -1897,46 +2634,31 @@ class SystemInfoWorker(QThread):
             # 优先使用缓存的GPU信息；若不可用，再尝试GPUtil；最后用CPU使用率近似
             gpu_load_pct = None
             gpu_mem_percent = 0
-            if hasattr(self, '_cached_gpu_load'):
+            if self._cached_gpu_load:
                 gpu_load_pct = max(0.0, min(100.0, float(self._cached_gpu_load)))
             if gpu_load_pct is None:
-                try:
-                    gpus = GPUtil.getGPUs()
-                    if gpus:
-                        gpu = gpus[0]
-                        gpu_load_pct = gpu.load * 100.0
-                        if getattr(gpu, 'memoryTotal', 0) > 0:
-                            gpu_mem_percent = (gpu.memoryUsed / gpu.memoryTotal) * 100.0
-                except Exception:
-                    gpu_load_pct = None
-            if gpu_load_pct is None and hasattr(self, '_cached_cpu_usage'):
+                info = self._query_gpu_fast()
+                if info is not None:
+                    gpu_load_pct = info[0]
+                    if info[2] > 0:
+                        gpu_mem_percent = (info[1] / info[2]) * 100.0
+            if gpu_load_pct is None and self._cached_cpu_usage:
                 # 打包环境下以CPU使用率近似GPU负载
                 gpu_load_pct = max(0.0, min(100.0, float(self._cached_cpu_usage) * 1.2))
             if gpu_load_pct is None:
                 gpu_load_pct = 50.0  # 合理的默认值，避免过低
             
-            print(f"CF游戏GPU近似数据 - 负载: {gpu_load_pct:.1f}%, 内存使用: {gpu_mem_percent:.1f}%")
+            logger.debug("CF游戏GPU近似数据 - 负载: %.1f%%, 内存使用: %.1f%%", gpu_load_pct, gpu_mem_percent)
             
             # 获取显示器刷新率并设置更合理上限
             try:
-                refresh_hz = self._get_display_refresh_rate_hz()
-                upper_cap = max(120, int(refresh_hz * 1.15)) if isinstance(refresh_hz, int) and refresh_hz > 0 else 120
+                upper_cap = self._get_display_upper_cap(floor=120, num=23, den=20)
             except Exception:
                 upper_cap = 120
             
-            # 刷新率感知映射：负载越高，越接近刷新率上限（CF较激进）
-            g = gpu_load_pct / 100.0
-            if g < 0.10:
-                cf_fps = max(40, int(upper_cap * 0.55))
-            elif g < 0.30:
-                cf_fps = int(upper_cap * (0.65 + g * 0.35))
-            elif g < 0.60:
-                cf_fps = int(upper_cap * (0.78 + (g - 0.30) * 0.45))
-            elif g < 0.85:
-                cf_fps = int(upper_cap * (0.90 + (g - 0.60) * 0.35))
-            else:
-                cf_fps = int(upper_cap * (0.98 + (g - 0.85) * 0.15))
-            cf_fps = min(cf_fps, upper_cap)
+            # 刷新率感知映射（CF较激进）：预展开曲线查表，免去逐级分支
+            frac = _CF_FRAC_LUT[min(100, max(0, int(gpu_load_pct)))]
+            cf_fps = min(max(40, int(upper_cap * frac)), upper_cap)
             
             # 结合GPU内存使用率进行小幅修正（若可用）
             if gpu_mem_percent > 90:
@@ -1951,14 +2673,13 @@ class SystemInfoWorker(QThread):
             
             # 最终范围保护与输出
             cf_fps = max(30, cf_fps)
-            print(f"CF游戏估算FPS: {cf_fps}")
+            logger.debug("CF游戏估算FPS: %s", cf_fps)
             return cf_fps
         except Exception as e:
-            print(f"CF专用FPS获取出错: {str(e)}")
+            logger.warning(f"CF专用FPS获取出错: {e}")
             # 返回一个合理的默认值（刷新率上限的80%），避免几十帧误判
             try:
-                refresh_hz = self._get_display_refresh_rate_hz()
-                upper_cap = max(120, int(refresh_hz * 1.15)) if isinstance(refresh_hz, int) and refresh_hz > 0 else 120
+                upper_cap = self._get_display_upper_cap(floor=120, num=23, den=20)
                 return int(upper_cap * 0.80)
             except Exception:
                 return 90
@@ -1966,9 +2687,9 @@ class SystemInfoWorker(QThread):
     def _smooth_cf_fps_value(self, current_fps):
         """CF游戏专用的FPS平滑处理，更快响应帧率变化"""
         # RTSS来源时启用轻平滑，快速响应真实帧率
-        if getattr(self, '_last_source_rtss', False):
+        if self._last_source_rtss:
             try:
-                prev = float(self.fps_cache) if getattr(self, 'fps_cache', 0) > 0 else None
+                prev = float(self.fps_cache) if self.fps_cache > 0 else None
             except Exception:
                 prev = None
             if prev is not None:
@@ -1976,95 +2697,69 @@ class SystemInfoWorker(QThread):
             else:
                 return float(current_fps)
         
-        # 初始化CF专用的FPS历史记录
-        if not hasattr(self, '_cf_fps_history'):
-            self._cf_fps_history = []
-        
-        # CF游戏使用更短的历史记录窗口，提高响应速度
+        # CF游戏使用更短的历史记录窗口，提高响应速度（deque在构造时创建）
         self._cf_fps_history.append(current_fps)
-        if len(self._cf_fps_history) > 3:  # 只保留最近3个值
-            self._cf_fps_history.pop(0)
-        
-        # 使用简单但有效的加权平均，最新的值权重更高
-        weights = [0.15, 0.30, 0.55][-len(self._cf_fps_history):]  # 动态调整权重数量
-        total_weight = sum(weights)
-        
-        if total_weight == 0 or len(self._cf_fps_history) == 0:
+        h = self._cf_fps_history
+        n = len(h)
+
+        # 历史最多3条（权重0.15/0.30/0.55，最新值权重最高），直接按长度展开成
+        # 常数乘加，免去每tick的权重切片、genexp求和与list快照
+        if n >= 3:
+            weighted_average = h[0] * 0.15 + h[1] * 0.30 + h[2] * 0.55  # 权重和恰为1.0
+            previous_average = (h[0] * 0.15 + h[1] * 0.30) / 0.45
+        elif n == 2:
+            weighted_average = (h[0] * 0.30 + h[1] * 0.55) / 0.85
+            previous_average = h[0]
+        else:
+            # 单样本无可平滑
             return current_fps
-        
-        # 计算加权平均
-        weighted_average = sum(fps * weight for fps, weight in zip(self._cf_fps_history, weights)) / total_weight
-        
-        # CF游戏允许更大的帧率变化幅度，以反映实际游戏体验
-        if len(self._cf_fps_history) > 1:
-            # 计算前一个加权平均值
-            prev_weights = weights[:-1] if len(weights) > 1 else [1.0]
-            prev_total_weight = sum(prev_weights)
-            previous_average = sum(fps * weight for fps, weight in zip(self._cf_fps_history[:-1], prev_weights)) / prev_total_weight if prev_total_weight > 0 else current_fps
-            
-            # CF游戏使用更大的变化限制，允许更快的响应
-            max_change = max(10, previous_average * 0.3)  # 允许30%的变化
-            
-            # 应用变化限制，但保留更多的响应性
-            if abs(weighted_average - previous_average) > max_change:
-                if weighted_average > previous_average:
-                    weighted_average = previous_average + max_change
-                else:
-                    weighted_average = previous_average - max_change
-        
+
+        # CF游戏使用更大的变化限制，允许更快的响应
+        max_change = max(10, previous_average * 0.3)  # 允许30%的变化
+
+        # 应用变化限制，但保留更多的响应性
+        if abs(weighted_average - previous_average) > max_change:
+            if weighted_average > previous_average:
+                weighted_average = previous_average + max_change
+            else:
+                weighted_average = previous_average - max_change
+
         return weighted_average
     
     def _get_active_game_process(self):
-        """增强的活动游戏进程检测，考虑CPU/GPU使用率和前台窗口"""
+        """增强的活动游戏进程检测：前台进程命中已知游戏时O(1)直返，
+        仅在前台不是游戏时才回退到缓存的进程名快照里筛选"""
         try:
-            # 获取前台窗口标题
-            active_window_title = self._get_active_window_title()
-            
-            # 获取GPU信息
-            gpus = GPUtil.getGPUs()
-            
-            # 按资源使用排序进程，优先检测使用资源多的进程
-            game_processes = []
-            
-            for proc in psutil.process_iter(['name', 'cpu_percent', 'memory_percent']):
-                try:
-                    process_name = proc.info['name']
-                    process_cpu = proc.info['cpu_percent'] if proc.info['cpu_percent'] is not None else 0
-                    
-                    # 检查是否是游戏进程
-                    if process_name.lower() in (name.lower() for name in COMMON_GAME_PROCESSES):
-                        # 计算进程的资源使用分数
-                        resource_score = process_cpu
-                        
-                        # 如果有GPU信息，结合GPU使用率因素（如果能匹配到该进程使用的GPU）
-                        if gpus and process_cpu > 5:
-                            resource_score += gpus[0].load * 50
-                        
-                        # 如果进程与前台窗口匹配，增加分数
-                        if active_window_title and (process_name.lower() in active_window_title.lower() or 
-                                                  process_name.replace('.exe', '').lower() in active_window_title.lower()):
-                            resource_score += 100  # 大幅增加前台进程的优先级
-                        
-                        game_processes.append((resource_score, process_name))
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    pass
-            
-            # 按资源使用分数排序，返回最高分的游戏进程
-            if game_processes:
-                game_processes.sort(key=lambda x: x[0], reverse=True)
-                return game_processes[0][1]  # 返回进程名称
-                
+            fg = self._snapshot_foreground()
+            # 前台快捷路径：前台进程本身就是已知游戏，免去整轮进程枚举
+            if fg.name and fg.name in GAME_PROCESS_SET:
+                return fg.name
+            title_lower = fg.title_lower
+
+            # 回退：在缓存的进程名快照里筛游戏进程。不再按cpu_percent打分——
+            # 单次采样恒为0没有排序意义，与标题匹配的候选直接胜出即可
+            names, _ = self._get_process_snapshot()
+            fallback = None
+            if names:
+                for process_name_lower in names:
+                    if process_name_lower in GAME_PROCESS_SET:
+                        if title_lower and (process_name_lower in title_lower or
+                                            process_name_lower.replace('.exe', '') in title_lower):
+                            return process_name_lower
+                        if fallback is None:
+                            fallback = process_name_lower
+            return fallback
         except Exception as e:
-            print(f"获取活动游戏进程出错: {str(e)}")
+            logger.warning(f"获取活动游戏进程出错: {e}")
             
         return None
     
     def _smooth_fps_value(self, current_fps):
         """增强的FPS平滑算法，使用多阶段平滑和异常值检测"""
         # RTSS来源时启用轻平滑，快速响应真实帧率
-        if getattr(self, '_last_source_rtss', False):
+        if self._last_source_rtss:
             try:
-                prev = float(self.fps_cache) if getattr(self, 'fps_cache', 0) > 0 else None
+                prev = float(self.fps_cache) if self.fps_cache > 0 else None
             except Exception:
                 prev = None
             if prev is not None:
@@ -2073,19 +2768,21 @@ class SystemInfoWorker(QThread):
             else:
                 return float(current_fps)
         # 1. 异常值检测和过滤（放宽阈值，避免过度抑制真实波动）
+        # deque不支持切片，先快照成list供各处窗口计算使用
+        hist = list(self.fps_history)
         is_outlier = False
-        if len(self.fps_history) > 3:
-            recent_avg = sum(self.fps_history[-3:]) / 3
+        if len(hist) > 3:
+            recent_avg = sum(hist[-3:]) / 3
             if abs(current_fps - recent_avg) > recent_avg * 0.6:
-                if len(self.fps_history) > 5:
-                    older_avg = sum(self.fps_history[-6:-3]) / 3
+                if len(hist) > 5:
+                    older_avg = sum(hist[-6:-3]) / 3
                     if abs(current_fps - older_avg) > older_avg * 0.7:
                         is_outlier = True
         
         # 2. 自适应添加到历史记录（异常值适度靠近平均）
         if is_outlier:
-            if self.fps_history:
-                recent_avg = sum(self.fps_history[-3:]) / 3 if len(self.fps_history) >= 3 else self.fps_history[-1]
+            if hist:
+                recent_avg = sum(hist[-3:]) / 3 if len(hist) >= 3 else hist[-1]
                 adjusted_fps = recent_avg + (current_fps - recent_avg) * 0.4
                 self.fps_history.append(adjusted_fps)
             else:
@@ -2093,27 +2790,36 @@ class SystemInfoWorker(QThread):
         else:
             self.fps_history.append(current_fps)
         
-        # 3. 限制历史记录窗口
-        if len(self.fps_history) > self.fps_smoothing_window:
-            self.fps_history.pop(0)
+        # 3. 历史窗口由deque的maxlen自动限制
+        hist = list(self.fps_history)
         
-        # 4. 加权平均（最新值权重更高但不过度）
-        if len(self.fps_history) == 0:
+        # 4. 加权平均（最新值权重更高但不过度；权重与总和取预计算值）
+        n = len(hist)
+        if n == 0:
             return current_fps
-        weights = [(i + 1) ** 1.3 for i in range(len(self.fps_history))]
-        total_weight = sum(weights)
+        total_weight = self._smooth_weight_totals[n]
         if total_weight == 0:
             return current_fps
-        weighted_average = sum(fps * weight for fps, weight in zip(self.fps_history, weights)) / total_weight
-        
+        if self._smooth_weights_np is not None:
+            # 向量化归约：一次dot同时覆盖全窗口，无逐元素Python装箱
+            hist_arr = np.fromiter(hist, dtype=np.float64, count=n)
+            weighted_average = float(np.dot(hist_arr, self._smooth_weights_np[:n])) / total_weight
+        else:
+            weighted_average = sum(fps * weight for fps, weight in zip(hist, self._smooth_weights[:n])) / total_weight
+
         # 5. 动态变化限制（更宽松，提升响应速度）
-        if len(self.fps_history) > 1:
-            recent_trend = self.fps_history[-1] - self.fps_history[-2] if len(self.fps_history) >= 2 else 0
+        if n > 1:
+            recent_trend = hist[-1] - hist[-2]
             base_max_change = 10
             percentage_max_change = 0.20
-            prev_weights = [(i + 1) ** 1.3 for i in range(len(self.fps_history) - 1)]
-            prev_total_weight = sum(prev_weights)
-            previous_average = sum(fps * weight for fps, weight in zip(self.fps_history[:-1], prev_weights)) / prev_total_weight if prev_total_weight > 0 else current_fps
+            prev_total_weight = self._smooth_weight_totals[n - 1]
+            if prev_total_weight > 0:
+                if self._smooth_weights_np is not None:
+                    previous_average = float(np.dot(hist_arr[:n - 1], self._smooth_weights_np[:n - 1])) / prev_total_weight
+                else:
+                    previous_average = sum(fps * weight for fps, weight in zip(hist[:-1], self._smooth_weights[:n - 1])) / prev_total_weight
+            else:
+                previous_average = current_fps
             if recent_trend > 0:
                 max_change = max(base_max_change, previous_average * percentage_max_change * 1.15)
             elif recent_trend < 0:
@@ -2128,46 +2834,53 @@ class SystemInfoWorker(QThread):
         
         return weighted_average
     
-    def _get_fps_using_windows_gaming_api(self):
-        """增强的Windows游戏API FPS获取方法（按前台进程过滤实例）"""
-        try:
-            # 打包安全模式下跳过win32pdh等原生计数器，避免潜在崩溃
-            if SAFE_PACKAGED_MODE:
-                raise Exception("packaged mode skips win32pdh to avoid instability")
-            # 检查是否有win32pdh支持
+    def _pdh_reset(self):
+        """关闭持久PDH查询并清空计数器缓存（出错时调用，下次重建）"""
+        query = self._pdh_query
+        if query is not None:
             try:
                 import win32pdh
-                import win32gui
-                import win32process
-                has_win32pdh = True
-            except ImportError:
-                has_win32pdh = False
-            
-            if not has_win32pdh:
-                raise ImportError("win32pdh模块不可用")
-            
-            query = None
-            try:
+                win32pdh.CloseQuery(query)
+            except Exception:
+                pass
+        self._pdh_query = None
+        self._pdh_counters = {}
+        self._pdh_key = None
+        self._pdh_primed = False
+
+    def _get_fps_using_windows_gaming_api(self):
+        """增强的Windows游戏API FPS获取方法（按前台进程过滤实例）。
+        PDH查询与计数器句柄跨调用持久保留：此前每个tick都走OpenQuery/AddCounter/
+        双CollectQueryData(带sleep)/CloseQuery全流程，现在稳态只需一次
+        CollectQueryData加格式化读取。"""
+        # 打包安全模式下跳过win32pdh等原生计数器，避免潜在崩溃
+        if SAFE_PACKAGED_MODE:
+            raise Exception("packaged mode skips win32pdh to avoid instability")
+        # 检查是否有win32pdh支持
+        try:
+            import win32pdh
+        except ImportError:
+            raise ImportError("win32pdh模块不可用")
+
+        try:
+            # 前台进程信息直接取融合快照（进程名已是小写）
+            fg = self._snapshot_foreground()
+            active_pid_str = str(fg.pid) if fg.pid else None
+            active_name_lower = fg.name if fg.name else None
+
+            query = self._pdh_query
+            if query is None:
                 query = win32pdh.OpenQuery()
-                
-                # 获取前台窗口进程信息
-                active_pid_str = None
-                active_name_lower = None
-                try:
-                    hwnd = win32gui.GetForegroundWindow()
-                    if hwnd:
-                        _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                        active_pid_str = str(pid)
-                except Exception:
-                    pass
-                try:
-                    active_name = self._get_foreground_process_name()
-                    if active_name:
-                        active_name_lower = active_name.lower()
-                except Exception:
-                    pass
-                
-                valid_fps_values = []
+                self._pdh_query = query
+                self._pdh_counters = {}
+                self._pdh_key = None
+                self._pdh_primed = False
+
+            # 前台进程切换或超过5秒才重新枚举实例并同步计数器集合
+            key = (active_pid_str, active_name_lower)
+            now = time.monotonic()
+            if key != self._pdh_key or now - self._pdh_last_enum > 5.0:
+                wanted = set()
                 try:
                     # 仅枚举GPU Engine对象并筛选3D引擎实例
                     counters, instances = win32pdh.EnumObjectItems(None, None, "GPU Engine", win32pdh.PERF_DETAIL_WIZARD)
@@ -2179,60 +2892,79 @@ class SystemInfoWorker(QThread):
                             (active_name_lower and active_name_lower in inst_lower) or
                             (not active_pid_str and not active_name_lower)
                         ):
-                            path = f"\\GPU Engine({inst})\\Frames Rendered/Second"
-                            try:
-                                counter = win32pdh.AddCounter(query, path, 0)
-                                win32pdh.CollectQueryData(query)
-                                time.sleep(0.05)
-                                win32pdh.CollectQueryData(query)
-                                _, value = win32pdh.GetFormattedCounterValue(counter, win32pdh.PDH_FMT_DOUBLE)
-                                if 1 <= value <= 400:
-                                    valid_fps_values.append(value)
-                                win32pdh.RemoveCounter(counter)
-                            except Exception:
-                                continue
+                            wanted.add(f"\\GPU Engine({inst})\\Frames Rendered/Second")
                 except Exception:
                     # 回退到广义路径集合
-                    for path in [
+                    wanted = {
                         "\\GPU Engine(*)\\Frames Rendered/Second",
                         "\\Direct3D Graphics(*)\\Frames Per Second",
                         "\\DirectX Graphics\\Frames Per Second",
-                    ]:
+                    }
+                # 摘除已失效实例的计数器，新增实例则补挂到持久查询上
+                for path in list(self._pdh_counters):
+                    if path not in wanted:
                         try:
-                            counter = win32pdh.AddCounter(query, path, 0)
-                            win32pdh.CollectQueryData(query)
-                            time.sleep(0.05)
-                            win32pdh.CollectQueryData(query)
-                            _, value = win32pdh.GetFormattedCounterValue(counter, win32pdh.PDH_FMT_DOUBLE)
-                            if 1 <= value <= 400:
-                                valid_fps_values.append(value)
-                            win32pdh.RemoveCounter(counter)
+                            win32pdh.RemoveCounter(self._pdh_counters.pop(path))
+                        except Exception:
+                            self._pdh_counters.pop(path, None)
+                for path in wanted:
+                    if path not in self._pdh_counters:
+                        try:
+                            self._pdh_counters[path] = win32pdh.AddCounter(query, path, 0)
+                            self._pdh_primed = False
                         except Exception:
                             continue
-                
-                if valid_fps_values:
-                    valid_fps_values.sort()
-                    if len(valid_fps_values) > 3:
-                        valid_fps_values = valid_fps_values[1:-1]
-                    return sum(valid_fps_values) / len(valid_fps_values)
-                raise Exception("未获取到有效的FPS计数器值")
-            finally:
-                # 确保清理资源
-                if query:
+                self._pdh_key = key
+                self._pdh_last_enum = now
+
+            if not self._pdh_counters:
+                raise Exception("未找到可用的FPS计数器实例")
+
+            # 速率型计数器需要两次采样才有值：不再sleep(0.05)凑采样间隔，
+            # 把基准采样和读数分摊到相邻两个tick（外层FPS循环本身频率足够）
+            if now - self._pdh_last_collect < 0.05 and \
+               self._pdh_last_fps is not None:
+                # 距上次采集不足50ms，速率读数不会更新，直接复用上次结果
+                return self._pdh_last_fps
+            win32pdh.CollectQueryData(query)
+            self._pdh_last_collect = now
+            if not self._pdh_primed:
+                self._pdh_primed = True
+                raise _PdhNeedMoreSamples("首次采样无速率数据，下一tick再读")
+
+            valid_fps_values = []
+            for path, counter in list(self._pdh_counters.items()):
+                try:
+                    _, value = win32pdh.GetFormattedCounterValue(counter, win32pdh.PDH_FMT_DOUBLE)
+                    if 1 <= value <= 400:
+                        valid_fps_values.append(value)
+                except Exception:
+                    # 实例已消失（进程退出等），摘除对应计数器
                     try:
-                        win32pdh.CloseQuery(query)
+                        win32pdh.RemoveCounter(self._pdh_counters.pop(path))
                     except Exception:
-                        pass
-                    
+                        self._pdh_counters.pop(path, None)
+
+            if valid_fps_values:
+                valid_fps_values.sort()
+                if len(valid_fps_values) > 3:
+                    valid_fps_values = valid_fps_values[1:-1]
+                self._pdh_last_fps = sum(valid_fps_values) / len(valid_fps_values)
+                return self._pdh_last_fps
+            raise Exception("未获取到有效的FPS计数器值")
+        except _PdhNeedMoreSamples:
+            # 查询与计数器保持完好，仅本tick无数据，让调用者先走其他方法
+            raise
         except Exception:
-            # 方法失败时抛出异常，让调用者尝试其他方法
+            # 出错时释放持久查询，下次调用重建；继续上抛让调用者尝试其他方法
+            self._pdh_reset()
             raise
     
     def _get_fps_using_gpu_performance_counters(self):
         """增强的GPU性能计数器FPS获取方法，根据GPU型号和性能特征优化估算"""
         try:
             # 这是一个备选方法，尝试从GPU直接获取渲染性能数据
-            gpus = GPUtil.getGPUs()
+            gpus = self._get_gpus_cached()
             if not gpus:
                 return 0
                 
@@ -2245,43 +2977,18 @@ class SystemInfoWorker(QThread):
             
             # 获取GPU型号
             gpu_model = ''
-            if hasattr(self, 'gpu_model') and self.gpu_model:
+            if self.gpu_model:
                 gpu_model = self.gpu_model
             elif hasattr(gpu, 'name') and gpu.name:
                 gpu_model = gpu.name.lower()
             
-            # 基于GPU型号和性能等级调整理论最大FPS
-            # 更精细的GPU分级系统
+            # 基于GPU型号和性能等级调整理论最大FPS：
+            # 按预编译分级表单趟扫描，命中即停（表在模块加载时构建）
             theoretical_max_fps = 100  # 默认基础值
-            
-            # NVIDIA高端GPU
-            if any(x in gpu_model for x in ['rtx 4090', 'rtx 4080', 'rtx 3090', 'rtx 3080']):
-                theoretical_max_fps = 360  # 旗舰GPU
-            elif any(x in gpu_model for x in ['rtx 4070 ti', 'rtx 4070', 'rtx 3070 ti', 'rtx 3070']):
-                theoretical_max_fps = 280  # 高端GPU
-            elif any(x in gpu_model for x in ['rtx 4060 ti', 'rtx 4060', 'rtx 3060 ti', 'rtx 3060']):
-                theoretical_max_fps = 220  # 中高端GPU
-            elif any(x in gpu_model for x in ['rtx 4050', 'rtx 3050', 'gtx 1660 ti', 'gtx 1660 super']):
-                theoretical_max_fps = 160  # 中端GPU
-            # AMD高端GPU
-            elif any(x in gpu_model for x in ['rx 7900 xtx', 'rx 7900 xt', 'rx 6950 xt', 'rx 6900 xt']):
-                theoretical_max_fps = 350  # 旗舰GPU
-            elif any(x in gpu_model for x in ['rx 7800 xt', 'rx 7700 xt', 'rx 6800 xt', 'rx 6800']):
-                theoretical_max_fps = 270  # 高端GPU
-            elif any(x in gpu_model for x in ['rx 7600 xt', 'rx 7600', 'rx 6750 xt', 'rx 6700 xt']):
-                theoretical_max_fps = 210  # 中高端GPU
-            elif any(x in gpu_model for x in ['rx 6650 xt', 'rx 6600 xt', 'rx 6600']):
-                theoretical_max_fps = 150  # 中端GPU
-            # 集成显卡
-            elif any(x in gpu_model for x in ['iris', 'uhd', 'hd graphics', 'radeon vega', 'radeon graphics']):
-                theoretical_max_fps = 60  # 集成显卡
-            # 其他GPU
-            elif 'gtx' in gpu_model:
-                theoretical_max_fps = 180  # 较老的NVIDIA中高端GPU
-            elif 'rx' in gpu_model:
-                theoretical_max_fps = 170  # 较老的AMD中高端GPU
-            elif 'gt' in gpu_model:
-                theoretical_max_fps = 120  # 入门级NVIDIA GPU
+            for pattern, tier_fps in _GPU_TIER_TABLE:
+                if pattern.search(gpu_model):
+                    theoretical_max_fps = tier_fps
+                    break
             
             # 基于GPU负载、内存使用和温度的综合FPS估算
             # 基础FPS计算
@@ -2338,42 +3045,11 @@ class SystemInfoWorker(QThread):
             # 打包安全模式下跳过DXGI/ctypes直接查询，避免潜在崩溃
             if SAFE_PACKAGED_MODE:
                 raise Exception("packaged mode skips direct DXGI query")
-            # 导入ctypes用于调用Windows API
-            import ctypes
-            import ctypes.wintypes
-            
-            # 定义必要的结构体
-            class LUID(ctypes.Structure):
-                _fields_ = [
-                    ("LowPart", ctypes.wintypes.DWORD),
-                    ("HighPart", ctypes.wintypes.LONG),
-                ]
-            
-            class DXGI_QUERY_VIDEO_MEMORY_INFO(ctypes.Structure):
-                _fields_ = [
-                    ("Budget", ctypes.c_uint64),
-                    ("CurrentUsage", ctypes.c_uint64),
-                    ("AvailableForReservation", ctypes.c_uint64),
-                    ("CurrentReservation", ctypes.c_uint64),
-                ]
-            
-            # 定义GUID结构
-            class GUID(ctypes.Structure):
-                _fields_ = [
-                    ("Data1", ctypes.wintypes.DWORD),
-                    ("Data2", ctypes.wintypes.WORD),
-                    ("Data3", ctypes.wintypes.WORD),
-                    ("Data4", ctypes.c_ubyte * 8),
-                ]
-            
-            # 尝试获取DXGI模块
-            try:
-                dxgi = ctypes.windll.dxgi
-            except AttributeError:
-                dxgi = None
-            
+            # DXGI结构体与模块句柄使用模块级定义（见文件头部），
+            # 此前每次调用都在函数内重建三个ctypes.Structure子类，
+            # 类型创建成本远高于本函数实际用到的任何查询
             # 获取GPU信息
-            gpus = GPUtil.getGPUs()
+            gpus = self._get_gpus_cached()
             if gpus:
                 gpu = gpus[0]
                 gpu_load = gpu.load
@@ -2381,56 +3057,79 @@ class SystemInfoWorker(QThread):
                 gpu_memory_total = gpu.memoryTotal
                 memory_utilization = gpu_memory_used / gpu_memory_total if gpu_memory_total > 0 else 0
                 
-                # 基于GPU型号、负载和内存使用的综合估算
+                # 基于GPU型号、负载和内存使用的综合估算：
+                # 厂商阶梯走预展开的256档表（负载≤0.2时表值为0，落到末尾return 0）
+                gpu_name = gpu.name.lower()
+                idx = int(gpu_load * 255)
+                idx = 255 if idx > 255 else (0 if idx < 0 else idx)
                 # NVIDIA GPU特殊处理
-                if 'nvidia' in gpu.name.lower() or 'rtx' in gpu.name.lower() or 'gtx' in gpu.name.lower():
+                if 'nvidia' in gpu_name or 'rtx' in gpu_name or 'gtx' in gpu_name:
                     # 考虑内存使用对性能的影响
                     memory_factor = 1.0
                     if memory_utilization > 0.9:
                         memory_factor = 0.85
                     elif memory_utilization > 0.75:
                         memory_factor = 0.95
-                    
-                    # 更精确的NVIDIA GPU FPS估算
-                    if gpu_load > 0.95:
-                        return (165 + (gpu_load - 0.95) * 300) * memory_factor
-                    elif gpu_load > 0.85:
-                        return (144 + (gpu_load - 0.85) * 210) * memory_factor
-                    elif gpu_load > 0.75:
-                        return (120 + (gpu_load - 0.75) * 240) * memory_factor
-                    elif gpu_load > 0.6:
-                        return (90 + (gpu_load - 0.6) * 50) * memory_factor
-                    elif gpu_load > 0.4:
-                        return (60 + (gpu_load - 0.4) * 75) * memory_factor
-                    elif gpu_load > 0.2:
-                        return (30 + (gpu_load - 0.2) * 150) * memory_factor
+                    base_fps = _NV_DIRECT_FPS_LUT[idx]
+                    if base_fps:
+                        return base_fps * memory_factor
                 # AMD GPU特殊处理
-                elif 'amd' in gpu.name.lower() or 'radeon' in gpu.name.lower():
+                elif 'amd' in gpu_name or 'radeon' in gpu_name:
                     # 考虑内存使用对性能的影响
                     memory_factor = 1.0
                     if memory_utilization > 0.9:
                         memory_factor = 0.8
                     elif memory_utilization > 0.75:
                         memory_factor = 0.9
-                    
-                    # 更精确的AMD GPU FPS估算
-                    if gpu_load > 0.95:
-                        return (155 + (gpu_load - 0.95) * 280) * memory_factor
-                    elif gpu_load > 0.85:
-                        return (130 + (gpu_load - 0.85) * 200) * memory_factor
-                    elif gpu_load > 0.75:
-                        return (110 + (gpu_load - 0.75) * 200) * memory_factor
-                    elif gpu_load > 0.6:
-                        return (85 + (gpu_load - 0.6) * 41.67) * memory_factor
-                    elif gpu_load > 0.4:
-                        return (55 + (gpu_load - 0.4) * 75) * memory_factor
-                    elif gpu_load > 0.2:
-                        return (25 + (gpu_load - 0.2) * 150) * memory_factor
+                    base_fps = _AMD_DIRECT_FPS_LUT[idx]
+                    if base_fps:
+                        return base_fps * memory_factor
             
             return 0
         except Exception:
             raise
     
+    def _rtss_close_mapping(self):
+        """解除RTSS共享内存映射并关闭句柄（重验/异常/线程停止时调用）"""
+        try:
+            kernel32 = ctypes.windll.kernel32
+            if self._rtss_pmem:
+                kernel32.UnmapViewOfFile(self._rtss_pmem)
+            if self._rtss_hmap:
+                kernel32.CloseHandle(self._rtss_hmap)
+        except Exception:
+            pass
+        self._rtss_pmem = None
+        self._rtss_hmap = None
+
+    def _rtss_view(self):
+        """返回已映射的RTSS共享内存基址，未安装/未运行时为None。
+        映射跨轮询保持打开（OpenFileMappingW+MapViewOfFile是每次轮询的
+        主要syscall开销）；每5秒重开一次确认RTSS仍在运行，避免RTSS退出后
+        读到我们自己保活的陈旧内存。"""
+        now = time.monotonic()
+        if self._rtss_pmem and now - self._rtss_verify_ts < 5.0:
+            return self._rtss_pmem
+        self._rtss_close_mapping()
+        kernel32 = ctypes.windll.kernel32
+        FILE_MAP_READ = 0x0004
+        for mapping_name in ("RTSSSharedMemoryV2", "RTSSSharedMemoryV3"):
+            try:
+                hmap = kernel32.OpenFileMappingW(FILE_MAP_READ, False, mapping_name)
+            except Exception:
+                hmap = None
+            if not hmap:
+                continue
+            pmem = kernel32.MapViewOfFile(hmap, FILE_MAP_READ, 0, 0, 0)
+            if not pmem:
+                kernel32.CloseHandle(hmap)
+                continue
+            self._rtss_hmap = hmap
+            self._rtss_pmem = pmem
+            self._rtss_verify_ts = now
+            return pmem
+        return None
+
     def _get_fps_using_rtss_shared_memory(self):
         """尝试通过RTSS共享内存读取当前前台进程的FPS（若安装了RTSS/Afterburner）。
         - 优先匹配前台窗口PID，其次匹配名称，避免误读其他进程
@@ -2438,67 +3137,60 @@ class SystemInfoWorker(QThread):
         - RTSS未运行或未安装时返回0
         """
         try:
-            import ctypes
-            user32 = ctypes.windll.user32
-            kernel32 = ctypes.windll.kernel32
-            FILE_MAP_READ = 0x0004
-            class RTSS_SHARED_MEMORY_HEADER(ctypes.Structure):
-                _fields_ = [
-                    ("dwSignature", ctypes.c_uint32),
-                    ("dwVersion", ctypes.c_uint32),
-                    ("dwAppEntrySize", ctypes.c_uint32),
-                    ("dwAppCount", ctypes.c_uint32),
-                    ("dwOSDEntrySize", ctypes.c_uint32),
-                ]
-            class RTSS_SHARED_MEMORY_APP(ctypes.Structure):
-                _fields_ = [
-                    ("dwProcessId", ctypes.c_uint32),
-                    ("szName", ctypes.c_char * 260),
-                    ("dwFlags", ctypes.c_uint32),
-                    ("dwActive", ctypes.c_uint32),
-                    ("fltFramerate", ctypes.c_float),
-                    ("fltMinFramerate", ctypes.c_float),
-                    ("fltMaxFramerate", ctypes.c_float),
-                    ("fltFrameTime", ctypes.c_float),
-                ]
-            # 获取前台窗口PID和名称
+            pmem = self._rtss_view()
+            if not pmem:
+                return 0
+            # 前台窗口PID和名称直接取融合快照（0.3秒内免重复syscall）
             try:
-                hwnd = user32.GetForegroundWindow()
-                pid = ctypes.c_ulong()
-                user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
-                fg_pid = int(pid.value)
+                fg = self._snapshot_foreground()
+                fg_pid = fg.pid
+                fg_name = fg.name or ""
             except Exception:
                 fg_pid = 0
-            try:
-                fg_name = (self._get_foreground_process_name() or "").lower()
-            except Exception:
                 fg_name = ""
             best_fps = 0.0
             pid_match_fps = 0.0
             name_match_fps = 0.0
-            for mapping_name in ("RTSSSharedMemoryV2", "RTSSSharedMemoryV3"):
-                try:
-                    hMap = kernel32.OpenFileMappingW(FILE_MAP_READ, False, mapping_name)
-                except Exception:
-                    hMap = None
-                if not hMap:
-                    continue
-                pMem = kernel32.MapViewOfFile(hMap, FILE_MAP_READ, 0, 0, 0)
-                if not pMem:
-                    kernel32.CloseHandle(hMap)
-                    continue
-                try:
-                    header = RTSS_SHARED_MEMORY_HEADER.from_address(pMem)
-                    app_count = int(getattr(header, 'dwAppCount', 0))
-                    app_size = int(getattr(header, 'dwAppEntrySize', ctypes.sizeof(RTSS_SHARED_MEMORY_APP)))
-                    base = pMem + ctypes.sizeof(RTSS_SHARED_MEMORY_HEADER)
-                    for i in range(min(app_count, 64)):
-                        addr = base + i * app_size
-                        app = RTSS_SHARED_MEMORY_APP.from_address(addr)
+            try:
+                header = RTSS_SHARED_MEMORY_HEADER.from_address(pmem)
+                app_count = int(header.dwAppCount)
+                app_size = int(header.dwAppEntrySize) or _RTSS_APP_SIZE
+                base = pmem + _RTSS_HDR_SIZE
+                app_count = min(app_count, 64)
+                np_dtype = _rtss_np_dtype(app_size) if app_count else None
+                if np_dtype is not None:
+                    # 向量化路径：把映射区按结构化dtype整体重解释，
+                    # PID匹配和帧率/帧时间换算一次完成，仅对有帧率的
+                    # 少数条目回退到逐个取名比较
+                    buf = (ctypes.c_char * (app_count * app_size)).from_address(base)
+                    arr = np.frombuffer(buf, dtype=np_dtype, count=app_count)
+                    fps_col = arr['fps']
+                    ft_col = arr['ft']
+                    fps_vec = np.where(
+                        fps_col > 0, fps_col,
+                        np.where(ft_col > 0, 1000.0 / np.where(ft_col > 0, ft_col, 1.0), 0.0))
+                    active = fps_vec > 0
+                    if active.any():
+                        best_fps = float(fps_vec.max())
+                        if fg_pid:
+                            pid_hits = fps_vec[active & (arr['pid'] == fg_pid)]
+                            if pid_hits.size:
+                                pid_match_fps = float(pid_hits.max())
+                        if fg_name and pid_match_fps <= 0:
+                            for i in np.flatnonzero(active):
+                                try:
+                                    app_name = bytes(arr['name'][i]).split(b'\x00', 1)[0].decode(errors='ignore').lower()
+                                except Exception:
+                                    continue
+                                if app_name and (fg_name == app_name or fg_name in app_name or app_name in fg_name):
+                                    name_match_fps = max(name_match_fps, float(fps_vec[i]))
+                else:
+                    for i in range(app_count):
+                        app = RTSS_SHARED_MEMORY_APP.from_address(base + i * app_size)
                         # 优先使用帧率；无则使用帧时间推算
-                        fps_val = float(getattr(app, 'fltFramerate', 0.0))
+                        fps_val = app.fltFramerate
                         if fps_val <= 0:
-                            ft = float(getattr(app, 'fltFrameTime', 0.0))
+                            ft = app.fltFrameTime
                             if ft > 0:
                                 fps_val = 1000.0 / ft
                         if fps_val <= 0:
@@ -2507,7 +3199,7 @@ class SystemInfoWorker(QThread):
                             app_name = app.szName.decode(errors='ignore').lower()
                         except Exception:
                             app_name = ""
-                        app_pid = int(getattr(app, 'dwProcessId', 0))
+                        app_pid = int(app.dwProcessId)
                         # PID优先匹配
                         if fg_pid and app_pid and fg_pid == app_pid:
                             pid_match_fps = max(pid_match_fps, fps_val)
@@ -2516,12 +3208,10 @@ class SystemInfoWorker(QThread):
                             name_match_fps = max(name_match_fps, fps_val)
                         # 总体最佳（兜底）
                         best_fps = max(best_fps, fps_val)
-                finally:
-                    kernel32.UnmapViewOfFile(pMem)
-                    kernel32.CloseHandle(hMap)
-                # 若已有PID/名称匹配值则优先返回
-                if pid_match_fps > 0 or name_match_fps > 0:
-                    break
+            except Exception:
+                # 读取异常视为映射失效，解除后下次轮询重建
+                self._rtss_close_mapping()
+                raise
             final = 0.0
             if pid_match_fps > 0:
                 final = pid_match_fps
@@ -2532,23 +3222,22 @@ class SystemInfoWorker(QThread):
             if final > 0:
                 return int(final)
         except Exception as e:
-            logger.debug(f"RTSS共享内存FPS读取失败: {e}")
+            logger.debug("RTSS共享内存FPS读取失败: %s", e)
         return 0
     
     def _get_fps_using_gpu_load_temp_and_memory(self):
         """优化的GPU负载和温度FPS估算方法，使用缓存和更高效的计算"""
         try:
-            # 首先检查缓存的GPU信息
-            if hasattr(self, '_cached_gpu_load') and hasattr(self, '_cached_gpu_temp'):
+            # 首先检查缓存的GPU信息（温度默认45°C，恒为真值；保底GPUtil路径仅防御性保留）
+            if self._cached_gpu_temp:
                 # 使用缓存值快速估算
                 gpu_load = self._cached_gpu_load / 100.0  # 转换为0-1范围
                 gpu_temp = self._cached_gpu_temp
                 
                 # 尝试获取内存使用率，但只在有缓存时使用
                 memory_utilization = 0
-                if hasattr(self, '_cached_gpu_memory_used') and hasattr(self, '_cached_gpu_memory_total'):
-                    if self._cached_gpu_memory_total > 0:
-                        memory_utilization = self._cached_gpu_memory_used / self._cached_gpu_memory_total
+                if self._cached_gpu_memory_total > 0:
+                    memory_utilization = self._cached_gpu_memory_used / self._cached_gpu_memory_total
                 
                 # 使用简化的性能指标计算
                 # 降低计算复杂度，移除min操作
@@ -2570,28 +3259,14 @@ class SystemInfoWorker(QThread):
                 # 简化的最终性能计算
                 adjusted_performance = performance_index * temp_factor * memory_factor
                 
-                # 大幅简化FPS映射表，减少比较次数
-                # 使用分段线性映射，减少if-elif分支数量
-                if adjusted_performance < 0.1:
-                    return 10
-                elif adjusted_performance < 0.25:
-                    return 30
-                elif adjusted_performance < 0.4:
-                    return 50
-                elif adjusted_performance < 0.6:
-                    # 60-90 FPS范围的线性映射
-                    return int(60 + (adjusted_performance - 0.4) * 150)
-                elif adjusted_performance < 0.8:
-                    # 90-144 FPS范围的线性映射
-                    return int(90 + (adjusted_performance - 0.6) * 270)
-                else:
-                    # 144+ FPS范围的线性映射，但有上限
-                    return min(240, int(144 + (adjusted_performance - 0.8) * 480))
+                # 预展开的256档映射表：一次索引取代逐级分支比较
+                idx = int(adjusted_performance * 255)
+                return _PERF_FPS_LUT[255 if idx > 255 else (0 if idx < 0 else idx)]
             
             # 如果没有缓存，使用轻量级的直接查询作为后备
             try:
                 # 使用局部变量以提高访问速度
-                gpus = GPUtil.getGPUs()
+                gpus = self._get_gpus_cached()
                 if gpus:
                     gpu = gpus[0]
                     gpu_load = gpu.load
@@ -2607,33 +3282,15 @@ class SystemInfoWorker(QThread):
     def _get_basic_fps_estimate(self):
         """基础FPS估算方法（作为最后的后备方案）"""
         try:
-            gpus = GPUtil.getGPUs()
+            gpus = self._get_gpus_cached()
             if gpus:
                 gpu = gpus[0]
                 gpu_load = gpu.load
                 
-                # 简单的负载到FPS映射，但增加了更细致的区间
-                if gpu_load > 0.95:
-                    return 120
-                elif gpu_load > 0.9:
-                    return 110
-                elif gpu_load > 0.8:
-                    return 100
-                elif gpu_load > 0.7:
-                    return 90
-                elif gpu_load > 0.6:
-                    return 80
-                elif gpu_load > 0.5:
-                    return 60
-                elif gpu_load > 0.4:
-                    return 50
-                elif gpu_load > 0.3:
-                    return 45
-                elif gpu_load > 0.2:
-                    return 35
-                elif gpu_load > 0.1:
-                    return 30
-            
+                # 负载到FPS映射走预展开的256档表
+                idx = int(gpu_load * 255)
+                return _BASIC_FPS_LUT[255 if idx > 255 else (0 if idx < 0 else idx)]
+
             return 0
         except Exception:
             return 0
@@ -2656,7 +3313,42 @@ class FloatingBall(QWidget):
         self.up_speed = 0  # 上传速度（字节/秒）
         self.is_dragging = False
         self.drag_position = QPoint()
-        
+
+        # 静态绘制层缓存（背景图+灰色底环预合成，仅失效时重建）
+        self._static_layer = None
+
+        # 绘制对象缓存：QFont/QPen在重绘间复用，避免每帧重新构造
+        self._font_arial_10b = QFont("Arial", 10, QFont.Bold)
+        self._font_arial_12b = QFont("Arial", 12, QFont.Bold)
+        self._font_arial_13b = QFont("Arial", 13, QFont.Bold)
+        self._font_helv_10b = QFont("Helvetica", 10, QFont.Bold)
+        self._ring_pen = QPen(QColor(), 5, Qt.SolidLine)
+        self._ring_pen.setCapStyle(Qt.RoundCap)  # 圆润的端点样式
+        self._ring_pen_rgba = None
+        self._arrow_pen = QPen(QColor(0, 191, 255))  # 浅蓝色天青蓝箭头
+        self._text_pen = QPen()  # 颜色随数据变化，对象本身复用
+
+        # 托盘图标缓存：按显示值（整数温度或FPS）缓存渲染结果，避免每秒重绘16x16图标
+        self._tray_icon_cache = {}
+        self._run_key = None
+        self._tray_font = QFont("Arial", 8, QFont.Bold)
+        self._tray_pen = QPen()  # 颜色随数值档位变化，对象复用
+        self._tray_fm = QFontMetrics(self._tray_font)
+        self._tray_text_pos = {}
+        self._last_tooltip = None
+
+        # 进度圆弧路径缓存：同一量化比例复用QPainterPath，单次strokePath替代两次drawArc
+        self._arc_rect = None
+        self._arc_path_cache = (None, None)
+
+        # 发光/亮点渐变复用：几何与外侧透明停止点不变，每帧只更新内侧颜色
+        self._glow_gradient = None
+        self._glow_rect = None
+        self._glow_brush = None
+        self._glow_brush_rgb = None
+        self._highlight_gradient = None
+        self._highlight_brush = None
+
         # 缓存清理相关变量
         self.is_cleaning_cache = False
         self.cache_cleaning_progress = 0
@@ -2728,18 +3420,50 @@ class FloatingBall(QWidget):
         self.setFixedSize(self.window_width, self.window_height)
         self.setWindowFlags(Qt.WindowStaysOnTopHint | Qt.FramelessWindowHint)
         self.setAttribute(Qt.WA_TranslucentBackground)
+
+        # 窗口尺寸固定，圆环几何在此一次算好，绘制热路径零几何运算
+        center_x = self.window_width // 2
+        radius = 22
+        y1 = 64
+        self._ring_center_x = center_x
+        self._ring_y1 = y1
+        self._ring_radius = radius
+        self._arc_rect = QRectF(center_x - radius, y1, 2 * radius, 2 * radius)
+        self._highlight_point = QPoint(center_x, y1)
+        # 文本区域：宽版（3位FPS）与标准版
+        self._ring_text_rect_wide = QRect(center_x - 25, y1 + radius - 8, 50, 16)
+        self._ring_text_rect = QRect(center_x - 20, y1 + radius - 8, 40, 16)
+        # 发光渐变与包围盒（内侧颜色在_draw_ring_glow按档位更新）
+        glow_radius = radius + 4
+        self._glow_gradient = QRadialGradient(center_x, y1 + radius, glow_radius)
+        self._glow_gradient.setColorAt(1, QColor(0, 0, 0, 0))
+        self._glow_rect = QRect(center_x - glow_radius, y1 - 4, glow_radius * 2, glow_radius * 2)
         
         # 加载背景图片
         self.load_background_image()
         
         # 计算窗口位置（右侧中间）
-        screen = QApplication.desktop().screenGeometry()
+        screen = self._refresh_screen_geometry()
         x = screen.width() - self.window_width
         y = (screen.height() - self.window_height) // 2
         self.move(x, y)
+
+    def _refresh_screen_geometry(self):
+        """缓存主屏几何信息，并在分辨率变化时自动刷新（避免每次拖拽释放都查询屏幕）"""
+        primary = QApplication.primaryScreen()
+        self._screen_geom = primary.geometry()
+        try:
+            primary.geometryChanged.connect(self._on_screen_geometry_changed)
+        except Exception:
+            pass
+        return self._screen_geom
+
+    def _on_screen_geometry_changed(self, geometry):
+        """主屏分辨率/排列变化时更新缓存"""
+        self._screen_geom = geometry
         
     def load_background_image(self):
-        self.bg_image = None
+        self.bg_pixmap = None
         try:
             # 尝试多种可能的资源路径
             image_names = ["xiaohaoxuanfuchuang.png", "图标.png", "图标2.png"]
@@ -2758,14 +3482,19 @@ class FloatingBall(QWidget):
             
             if found_path:
                 logger.info(f"找到背景图片: {found_path}")
-                self.bg_image = QImage(found_path)
-                if not self.bg_image.isNull():
-                    self.bg_image = self.bg_image.scaled(self.window_width, self.window_height)
+                bg_image = QImage(found_path)
+                if not bg_image.isNull():
+                    # 缩放后立即转为QPixmap，后续绘制走更快的像素图合成路径
+                    self.bg_pixmap = QPixmap.fromImage(
+                        bg_image.scaled(self.window_width, self.window_height,
+                                        Qt.IgnoreAspectRatio, Qt.SmoothTransformation))
             else:
                 logger.warning("未找到背景图片，将使用默认绘制")
         except Exception as e:
             logger.error(f"加载背景图片失败: {e}")
-            self.bg_image = None
+            self.bg_pixmap = None
+        # 背景变化后静态层需要重建
+        self._static_layer = None
     
     def start_system_info_thread(self):
         # 创建工作线程（SystemInfoWorker已继承QThread）
@@ -2775,6 +3504,15 @@ class FloatingBall(QWidget):
         try:
             self.worker.sleep_interval = float(self.settings.get("performance_sleep_interval", 0.05))
             self.worker.signal_interval = float(self.settings.get("signal_interval", 0.1))
+            # 轮询周期可选配置覆盖（秒）
+            self.worker.gpu_interval = float(self.settings.get("gpu_interval", self.worker.gpu_interval))
+            self.worker.gpu_interval_idle = float(self.settings.get("gpu_interval_idle", self.worker.gpu_interval_idle))
+            self.worker.net_interval = float(self.settings.get("net_interval", self.worker.net_interval))
+            self.worker.net_interval_idle = float(self.settings.get("net_interval_idle", self.worker.net_interval_idle))
+            self.worker.game_interval = float(self.settings.get("game_interval", self.worker.game_interval))
+            self.worker.game_interval_idle = float(self.settings.get("game_interval_idle", self.worker.game_interval_idle))
+            self.worker.fps_interval_gaming = float(self.settings.get("fps_interval_gaming", self.worker.fps_interval_gaming))
+            self.worker.fps_interval_idle = float(self.settings.get("fps_interval_idle", self.worker.fps_interval_idle))
         except Exception:
             self.worker.sleep_interval = 0.05
             self.worker.signal_interval = 0.1
@@ -2786,7 +3524,14 @@ class FloatingBall(QWidget):
         # 启动线程
         self.worker.start()
         
-    def update_system_info(self, cpu_usage, gpu_temp, gpu_load, down_speed, up_speed, is_gaming, fps):
+    def update_system_info(self, snap):
+        cpu_usage = snap.cpu_usage
+        gpu_temp = snap.gpu_temp
+        gpu_load = snap.gpu_load
+        down_speed = snap.down_speed
+        up_speed = snap.up_speed
+        is_gaming = snap.is_gaming
+        fps = snap.fps
         self.prev_cpu_usage = self.cpu_usage
         self.prev_gpu_load = self.gpu_load
         self.cpu_usage = cpu_usage
@@ -2828,7 +3573,20 @@ class FloatingBall(QWidget):
             if hasattr(self, 'overlay_hud') and self.overlay_hud is not None:
                 try:
                     self.overlay_hud.show()
-                    self.overlay_hud.update_metrics(self.cpu_usage, self.cpu_temp, self.gpu_load, self.gpu_temp, self.fps, self.mem_usage)
+                    # HUD显示值未变时只跟随游戏窗口重定位，跳过整窗重绘
+                    hud_state = (
+                        round(self.cpu_usage),
+                        int(self.cpu_temp) if isinstance(self.cpu_temp, (int, float)) else None,
+                        round(self.gpu_load),
+                        int(self.gpu_temp),
+                        self.fps,
+                        round(self.mem_usage),
+                    )
+                    if hud_state != getattr(self, '_last_hud_state', None):
+                        self._last_hud_state = hud_state
+                        self.overlay_hud.update_metrics(self.cpu_usage, self.cpu_temp, self.gpu_load, self.gpu_temp, self.fps, self.mem_usage)
+                    else:
+                        self.overlay_hud.reposition_to_foreground()
                 except Exception:
                     pass
         else:
@@ -2838,41 +3596,94 @@ class FloatingBall(QWidget):
                 except Exception:
                     pass
             
-        self.update()  # 触发重绘
-        self.update_tray_icon()  # 更新任务栏显示
+        # 仅当取整后的可见值发生变化时才触发重绘/托盘刷新
+        cpu_temp_disp = int(self.cpu_temp) if isinstance(self.cpu_temp, (int, float)) else None
+        paint_state = (
+            int(self.gpu_temp),
+            round(self.cpu_usage, 1),
+            round(self.gpu_load, 1),
+            self.fps,
+            self.is_gaming,
+            self.is_cleaning_cache,
+            self.cache_cleaning_progress,
+        )
+        if paint_state != getattr(self, '_last_paint_state', None):
+            self._last_paint_state = paint_state
+            # 窗口隐藏（仅托盘模式）时跳过重绘请求；显示时Qt会自然补一次paint
+            if self.isVisible():
+                self.update()  # 触发重绘
+        tray_state = (
+            int(self.gpu_temp),
+            cpu_temp_disp,
+            int(self.cpu_usage),
+            int(self.gpu_load),
+            self.fps,
+            self.is_gaming,
+            self.format_speed(self.down_speed),
+            self.format_speed(self.up_speed),
+        )
+        if tray_state != getattr(self, '_last_tray_state', None):
+            self._last_tray_state = tray_state
+            self.update_tray_icon()  # 更新任务栏显示
     
+    def shutdown_worker(self):
+        """停止后台监控线程（应用退出时调用，保证线程优雅收尾）"""
+        try:
+            if hasattr(self, 'worker') and self.worker is not None and self.worker.isRunning():
+                self.worker.stop()
+        except Exception as e:
+            logger.warning(f"停止监控线程时出错: {e}")
+        self._close_run_key()
+
     def handle_error(self, error_message):
         print(f"发生错误: {error_message}")
         
     def paintEvent(self, event):
+        if not self.isVisible():
+            return
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
-        
-        # 绘制背景图片
-        if self.bg_image and not self.bg_image.isNull():
-            painter.drawImage(QRect(0, 0, self.window_width, self.window_height), self.bg_image)
-        
-        # 绘制温度圆环
+
+        # 静态层（背景图+灰色底环）预合成后每帧直接blit，避免重复缩放绘制
+        if self._static_layer is None:
+            self._build_static_layer()
+        painter.drawPixmap(0, 0, self._static_layer)
+
+        # 绘制温度圆环（动态部分）
         self.draw_temperature_ring(painter)
-        
+
         # 绘制CPU和GPU信息
         self.draw_system_info(painter)
-    
-    def draw_temperature_ring(self, painter):
-        # 圆环参数
+
+    def _build_static_layer(self):
+        """将不随数据变化的图层（背景图与灰色底环）预合成进QPixmap缓存"""
+        pixmap = QPixmap(self.window_width, self.window_height)
+        pixmap.fill(Qt.transparent)
+        p = QPainter(pixmap)
+        p.setRenderHint(QPainter.Antialiasing)
+
+        # 背景图片
+        if self.bg_pixmap and not self.bg_pixmap.isNull():
+            p.drawPixmap(0, 0, self.bg_pixmap)
+
+        # 背景圆环（灰色，用于显示未填充部分）
         center_x = self.window_width // 2
         radius = 22
         x1 = center_x - radius
         y1 = 64
-        x2 = center_x + radius
-        y2 = y1 + 2 * radius
-        
-        # 绘制背景圆环（灰色，用于显示未填充部分）
         background_pen = QPen(QColor(50, 50, 50, 100), 4, Qt.SolidLine)
-        painter.setPen(background_pen)
-        painter.drawArc(QRect(x1, y1, x2 - x1, y2 - y1),
-                        360 * 16, 360 * 16)  # 绘制整个圆
-        
+        p.setPen(background_pen)
+        p.drawArc(QRect(x1, y1, 2 * radius, 2 * radius),
+                  360 * 16, 360 * 16)  # 绘制整个圆
+        p.end()
+        self._static_layer = pixmap
+
+    def draw_temperature_ring(self, painter):
+        # 圆环几何已在init_ui预计算
+        center_x = self._ring_center_x
+        radius = self._ring_radius
+        y1 = self._ring_y1
+
         # 判断是显示缓存清理进度、FPS还是温度（支持设置开关）
         show_fps_enabled = bool(self.settings.get("show_fps", True))
         fps_only_in_game = bool(self.settings.get("fps_only_in_game", True))
@@ -2885,19 +3696,7 @@ class FloatingBall(QWidget):
             
             # 绘制发光效果
             if ratio > 0:
-                # 创建发光效果的渐变
-                glow_radius = radius + 4
-                glow_rect = QRect(center_x - glow_radius, y1 - 4, glow_radius * 2, glow_radius * 2)
-                glow_gradient = QRadialGradient(center_x, y1 + radius, glow_radius)
-                
-                # 设置发光颜色
-                glow_gradient.setColorAt(0, QColor(cache_color.red(), cache_color.green(), cache_color.blue(), 60))
-                glow_gradient.setColorAt(1, QColor(0, 0, 0, 0))
-                
-                # 绘制发光效果
-                painter.setPen(Qt.NoPen)
-                painter.setBrush(QBrush(glow_gradient))
-                painter.drawEllipse(glow_rect)
+                self._draw_ring_glow(painter, cache_color)
             
             # 设置圆环颜色
             color = cache_color
@@ -2918,19 +3717,7 @@ class FloatingBall(QWidget):
                 fps_color = _color_with_alpha_hex(low_hex, 200)
             
             # 绘制发光效果
-            # 创建发光效果的渐变
-            glow_radius = radius + 4
-            glow_rect = QRect(center_x - glow_radius, y1 - 4, glow_radius * 2, glow_radius * 2)
-            glow_gradient = QRadialGradient(center_x, y1 + radius, glow_radius)
-            
-            # 设置发光颜色
-            glow_gradient.setColorAt(0, QColor(fps_color.red(), fps_color.green(), fps_color.blue(), 60))
-            glow_gradient.setColorAt(1, QColor(0, 0, 0, 0))
-            
-            # 绘制发光效果
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(QBrush(glow_gradient))
-            painter.drawEllipse(glow_rect)
+            self._draw_ring_glow(painter, fps_color)
             
             # 设置圆环颜色
             color = fps_color
@@ -2940,96 +3727,90 @@ class FloatingBall(QWidget):
             max_temp = 100
             ratio = min(self.gpu_temp / max_temp, 1.0)  # 限制在1.0以内
             
-            # 绘制发光效果
+            # 绘制发光效果（颜色随温度变化）
             if ratio > 0:
-                # 创建发光效果的渐变
-                glow_radius = radius + 4
-                glow_rect = QRect(center_x - glow_radius, y1 - 4, glow_radius * 2, glow_radius * 2)
-                glow_gradient = QRadialGradient(center_x, y1 + radius, glow_radius)
-                
-                # 根据温度设置发光颜色
-                glow_color = self.get_gradient_color(ratio)
-                glow_gradient.setColorAt(0, QColor(glow_color.red(), glow_color.green(), glow_color.blue(), 60))
-                glow_gradient.setColorAt(1, QColor(0, 0, 0, 0))
-                
-                # 绘制发光效果
-                painter.setPen(Qt.NoPen)
-                painter.setBrush(QBrush(glow_gradient))
-                painter.drawEllipse(glow_rect)
+                self._draw_ring_glow(painter, self.get_gradient_color(ratio))
             
             # 设置圆环颜色
             color = self.get_gradient_color(ratio)
             current_ratio = ratio
         
-        # 设置笔的宽度和样式
-        pen = QPen(color, 5, Qt.SolidLine)
-        pen.setCapStyle(Qt.RoundCap)  # 圆润的端点样式
-        painter.setPen(pen)
+        # 设置笔的宽度和样式（复用缓存的画笔；颜色按rgba打包值比较，未变时跳过QPen变更）
+        rgba = color.rgba()
+        if rgba != self._ring_pen_rgba:
+            self._ring_pen.setColor(color)
+            self._ring_pen_rgba = rgba
+        painter.setPen(self._ring_pen)
         
-        # 直接根据比例绘制进度圆环
+        # 直接根据比例绘制进度圆环（路径缓存：比例未变时复用上次的QPainterPath）
         if current_ratio > 0:
-            # 计算要绘制的角度范围（从底部向两边同时绘制）
-            total_extent = 360  # 完整圆环
-            temp_extent = current_ratio * total_extent
-            
-            # 计算左右两侧要绘制的角度
-            half_temp_extent = temp_extent / 2
-            
-            # 绘制左侧圆环（从底部向左绘制）
-            left_start_angle = 270
-            left_span_angle = -half_temp_extent  # 负角度表示逆时针绘制
-            painter.drawArc(QRect(x1, y1, x2 - x1, y2 - y1),
-                            int(left_start_angle * 16), int(left_span_angle * 16))
-            
-            # 绘制右侧圆环（从底部向右绘制）
-            right_start_angle = 270
-            right_span_angle = half_temp_extent  # 正角度表示顺时针绘制
-            painter.drawArc(QRect(x1, y1, x2 - x1, y2 - y1),
-                            int(right_start_angle * 16), int(right_span_angle * 16))
-        
-        # 绘制一个亮点以增加立体感
+            ratio_key = round(current_ratio, 2)
+            cached_key, arc_path = self._arc_path_cache
+            if cached_key != ratio_key or arc_path is None:
+                # 从底部(270°)向左右两侧各绘制一半角度
+                half_extent = ratio_key * 180.0
+                arc_path = QPainterPath()
+                arc_path.arcMoveTo(self._arc_rect, 270)
+                arc_path.arcTo(self._arc_rect, 270, -half_extent)
+                arc_path.arcMoveTo(self._arc_rect, 270)
+                arc_path.arcTo(self._arc_rect, 270, half_extent)
+                self._arc_path_cache = (ratio_key, arc_path)
+            painter.strokePath(arc_path, self._ring_pen)
+        
+        # 绘制一个亮点以增加立体感（渐变与画刷完全静态，只构建一次）
         if current_ratio > 0:
-            # 计算亮点位置（在圆环的最上方）
-            highlight_x = center_x
-            highlight_y = y1
-            
-            # 创建渐变亮点
-            highlight_gradient = QRadialGradient(highlight_x, highlight_y, 5)
-            highlight_gradient.setColorAt(0, QColor(255, 255, 255, 200))
-            highlight_gradient.setColorAt(1, QColor(255, 255, 255, 0))
+            # 亮点位置（在圆环的最上方，几何固定）
+            if self._highlight_brush is None:
+                self._highlight_gradient = QRadialGradient(self._highlight_point.x(), self._highlight_point.y(), 5)
+                self._highlight_gradient.setColorAt(0, QColor(255, 255, 255, 200))
+                self._highlight_gradient.setColorAt(1, QColor(255, 255, 255, 0))
+                self._highlight_brush = QBrush(self._highlight_gradient)
             
             # 绘制亮点
             painter.setPen(Qt.NoPen)
-            painter.setBrush(QBrush(highlight_gradient))
-            painter.drawEllipse(QPoint(highlight_x, highlight_y), 3, 3)
+            painter.setBrush(self._highlight_brush)
+            painter.drawEllipse(self._highlight_point, 3, 3)
             
         # 绘制文本（进度、FPS或温度）
         fps_text_hex = str(self.settings.get("fps_text_color", "#FFFFFF"))
-        painter.setPen(QPen(QColor(fps_text_hex)))
-        
+        self._text_pen.setColor(QColor(fps_text_hex))
+        painter.setPen(self._text_pen)
+
         if should_show_fps:
             # FPS显示模式 - 根据数字位数自动调整字体大小
             fps_str = f"{self.fps}fps"
             # 判断FPS是否为3位数或更多
             if self.fps >= 100:
                 # 3位数FPS，使用较小字体并扩大显示区域
-                painter.setFont(QFont("Arial", 10, QFont.Bold))
-                text_rect = QRect(center_x - 25, y1 + radius - 8, 50, 16)
+                painter.setFont(self._font_arial_10b)
+                text_rect = self._ring_text_rect_wide
             else:
                 # 1-2位数FPS，保持原有样式
-                painter.setFont(QFont("Arial", 12, QFont.Bold))
-                text_rect = QRect(center_x - 20, y1 + radius - 8, 40, 16)
+                painter.setFont(self._font_arial_12b)
+                text_rect = self._ring_text_rect
             painter.drawText(text_rect, Qt.AlignCenter, fps_str)
         else:
             # 温度或清理进度显示 - 保持原有样式
-            painter.setFont(QFont("Arial", 12, QFont.Bold))
-            text_rect = QRect(center_x - 20, y1 + radius - 8, 40, 16)
+            painter.setFont(self._font_arial_12b)
+            text_rect = self._ring_text_rect
             
             if self.is_cleaning_cache:
                 painter.drawText(text_rect, Qt.AlignCenter, f"{self.cache_cleaning_progress}%")
             else:
                 painter.drawText(text_rect, Qt.AlignCenter, f"{int(self.gpu_temp)}°")
     
+    def _draw_ring_glow(self, painter, color):
+        """绘制圆环外侧的发光效果（几何在init_ui预计算，仅更新内侧颜色）"""
+        # QBrush会拷贝渐变，仅在颜色变化时重建画刷（同色帧零构造）
+        rgb = (color.red(), color.green(), color.blue())
+        if rgb != self._glow_brush_rgb:
+            self._glow_gradient.setColorAt(0, QColor(rgb[0], rgb[1], rgb[2], 60))
+            self._glow_brush = QBrush(self._glow_gradient)
+            self._glow_brush_rgb = rgb
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._glow_brush)
+        painter.drawEllipse(self._glow_rect)
+
     def draw_system_info(self, painter):
         # 判断是显示缓存清理进度、FPS还是温度（支持设置开关）
         show_fps_enabled = bool(self.settings.get("show_fps", True))
@@ -3059,8 +3840,9 @@ class FloatingBall(QWidget):
         if show_in_ball:
             # 使用可配置的信息文字颜色（默认金色）
             hud_hex = str(self.settings.get("hud_text_color", "#FFD700"))
-            painter.setPen(QPen(QColor(hud_hex)))
-            painter.setFont(QFont("Arial", 13, QFont.Bold))
+            self._text_pen.setColor(QColor(hud_hex))
+            painter.setPen(self._text_pen)
+            painter.setFont(self._font_arial_13b)
             top_y = 8
             line_h = 18
             fps_text = f"FPS {self.fps}" if self.fps > 0 else "FPS --"
@@ -3084,7 +3866,7 @@ class FloatingBall(QWidget):
         
         # 测量文本宽度以计算位置
         font_metrics = painter.fontMetrics()
-        painter.setFont(QFont("Helvetica", 10, QFont.Bold))
+        painter.setFont(self._font_helv_10b)
         arrow_width = font_metrics.width(cpu_arrow)
         percentage_width = font_metrics.width(cpu_percentage_text)
         total_width = arrow_width + percentage_width
@@ -3093,12 +3875,13 @@ class FloatingBall(QWidget):
         start_x = (self.window_width - total_width) // 2
         
         # 绘制浅蓝色天青蓝箭头
-        painter.setPen(QPen(QColor(0, 191, 255)))  # 设置浅蓝色天青蓝
+        painter.setPen(self._arrow_pen)  # 浅蓝色天青蓝
         painter.drawText(QRect(start_x, 130, arrow_width, 20),
                         Qt.AlignCenter, cpu_arrow)
         
         # 绘制CPU使用率百分比（保持原来的颜色）
-        painter.setPen(QPen(cpu_color))
+        self._text_pen.setColor(cpu_color)
+        painter.setPen(self._text_pen)
         painter.drawText(QRect(start_x + arrow_width, 130, percentage_width, 20),
                         Qt.AlignCenter, cpu_percentage_text)
         
@@ -3108,7 +3891,7 @@ class FloatingBall(QWidget):
         gpu_percentage_text = f"{self.gpu_load:.1f}%"
         
         # 测量文本宽度以计算位置
-        painter.setFont(QFont("Arial", 10, QFont.Bold))
+        painter.setFont(self._font_arial_10b)
         arrow_width = font_metrics.width(gpu_arrow)
         percentage_width = font_metrics.width(gpu_percentage_text)
         total_width = arrow_width + percentage_width
@@ -3117,70 +3900,88 @@ class FloatingBall(QWidget):
         start_x = (self.window_width - total_width) // 2
         
         # 绘制浅蓝色天青蓝箭头
-        painter.setPen(QPen(QColor(0, 191, 255)))  # 设置浅蓝色天青蓝
+        painter.setPen(self._arrow_pen)  # 浅蓝色天青蓝
         painter.drawText(QRect(start_x, 165, arrow_width, 20),
                         Qt.AlignCenter, gpu_arrow)
         
         # 绘制GPU使用率百分比（保持原来的颜色）
-        painter.setPen(QPen(gpu_color))
+        self._text_pen.setColor(gpu_color)
+        painter.setPen(self._text_pen)
         painter.drawText(QRect(start_x + arrow_width, 165, percentage_width, 20),
                         Qt.AlignCenter, gpu_percentage_text)
     
+    # 颜色查找表：ratio/usage量化为整数档位后预计算QColor，
+    # 绘制热路径上零浮点运算（首次访问时惰性构建）
+    _GRADIENT_LUT = None
+    _USAGE_COLOR_LUT = None
+
     def get_gradient_color(self, ratio):
-        # 改进的颜色渐变算法：从浅绿色 -> 蓝色 -> 黄色 -> 红色 -> 深红色
-        # 使用更自然的HSL颜色空间转换
-        if ratio <= 0.2:
-            # 绿色到蓝色 (120 到 220)
-            hue = 120 + (ratio / 0.2) * 100
-        elif ratio <= 0.4:
-            # 蓝色到青色 (220 到 180)
-            hue = 220 - ((ratio - 0.2) / 0.2) * 40
-        elif ratio <= 0.6:
-            # 青色到绿色 (180 到 120)
-            hue = 180 - ((ratio - 0.4) / 0.2) * 60
-        elif ratio <= 0.8:
-            # 绿色到黄色 (120 到 60)
-            hue = 120 - ((ratio - 0.6) / 0.2) * 60
-        else:
-            # 黄色到红色到深红色 (60 到 0 到 340)
-            if ratio <= 0.9:
-                # 黄色到红色 (60 到 0)
-                hue = 60 - ((ratio - 0.8) / 0.1) * 60
-            else:
-                # 红色到深红色 (0 到 340)
-                hue = 0 - ((ratio - 0.9) / 0.1) * 20
-        saturation = 100  # 最大饱和度
-        lightness = 40 + ratio * 20  # 从40%到60%亮度
-        
-        # 将HSL转换为RGB
+        lut = FloatingBall._GRADIENT_LUT
+        if lut is None:
+            if np is not None:
+                try:
+                    lut = self._build_gradient_lut_numpy()
+                except Exception:
+                    lut = None
+            if lut is None:
+                lut = [self._compute_gradient_color(i / 100.0) for i in range(101)]
+            FloatingBall._GRADIENT_LUT = lut
+        return lut[min(100, max(0, int(ratio * 100)))]
+
+    @staticmethod
+    def _build_gradient_lut_numpy():
+        """用NumPy一次性向量化构建渐变查找表（与_compute_gradient_color逐档等价）"""
+        ratios = np.arange(101) / 100.0
+        # 分段hue，与标量版本的分支一一对应
+        hue = np.select(
+            [ratios <= 0.2, ratios <= 0.4, ratios <= 0.6, ratios <= 0.8, ratios <= 0.9],
+            [120 + (ratios / 0.2) * 100,
+             220 - ((ratios - 0.2) / 0.2) * 40,
+             180 - ((ratios - 0.4) / 0.2) * 60,
+             120 - ((ratios - 0.6) / 0.2) * 60,
+             60 - ((ratios - 0.8) / 0.1) * 60],
+            default=0 - ((ratios - 0.9) / 0.1) * 20)
+        s = 1.0  # 饱和度恒为100%
+        l = (40 + ratios * 20) / 100.0
         h = hue / 360.0
-        s = saturation / 100.0
-        l = lightness / 100.0
-        
-        def hue_to_rgb(p, q, t):
-            if t < 0: t += 1
-            if t > 1: t -= 1
-            if t < 1/6: return p + (q - p) * 6 * t
-            if t < 1/2: return q
-            if t < 2/3: return p + (q - p) * (2/3 - t) * 6
-            return p
-        
-        if s == 0:
-            r = g = b = int(l * 255)  # 灰度
-        else:
-            q = l * (1 + s) if l < 0.5 else l + s - l * s
-            p = 2 * l - q
-            r = int(hue_to_rgb(p, q, h + 1/3) * 255)
-            g = int(hue_to_rgb(p, q, h) * 255)
-            b = int(hue_to_rgb(p, q, h - 1/3) * 255)
+        q = np.where(l < 0.5, l * (1 + s), l + s - l * s)
+        p = 2 * l - q
+
+        def hue_to_rgb(t):
+            t = np.mod(t, 1.0)
+            return np.where(t < 1/6, p + (q - p) * 6 * t,
+                   np.where(t < 1/2, q,
+                   np.where(t < 2/3, p + (q - p) * (2/3 - t) * 6, p)))
+
+        r = (hue_to_rgb(h + 1/3) * 255).astype(int)
+        g = (hue_to_rgb(h) * 255).astype(int)
+        b = (hue_to_rgb(h - 1/3) * 255).astype(int)
+        alpha = 200 + np.minimum(ratios * 55, 55).astype(int)
+        return [QColor(int(r[i]), int(g[i]), int(b[i]), int(alpha[i])) for i in range(101)]
+
+    @staticmethod
+    def _compute_gradient_color(ratio):
+        # 改进的颜色渐变算法：从浅绿色 -> 蓝色 -> 黄色 -> 红色 -> 深红色
+        # 色相走查找表，HSL->RGB交给C实现的colorsys（仅建表时各调用一次）
+        hue = _HUE_LUT[min(100, max(0, int(round(ratio * 100))))]
+        lightness = (40 + ratio * 20) / 100.0  # 从40%到60%亮度，饱和度恒为100%
+        r, g, b = colorsys.hls_to_rgb(hue / 360.0, lightness, 1.0)
         
         # 增加alpha通道以提供更好的透明度效果
         # 在低温时略微透明，高温时更不透明
         alpha = 200 + int(min(ratio * 55, 55))  # 从200到255的alpha值
         
-        return QColor(r, g, b, alpha)
+        return QColor(int(r * 255), int(g * 255), int(b * 255), alpha)
     
     def get_usage_color(self, usage):
+        lut = FloatingBall._USAGE_COLOR_LUT
+        if lut is None:
+            lut = tuple(self._compute_usage_color(i) for i in range(101))
+            FloatingBall._USAGE_COLOR_LUT = lut
+        return lut[min(100, max(0, int(usage)))]
+
+    @staticmethod
+    def _compute_usage_color(usage):
         # 根据使用率返回颜色：绿色 -> 黄色 -> 红色
         if usage <= 40:
             return QColor(12, 222, 41)  # 绿色
@@ -3207,8 +4008,8 @@ class FloatingBall(QWidget):
             
     def snap_to_edge(self):
         # 吸附到显示器边缘的功能
-        # 获取屏幕几何信息
-        screen = QApplication.desktop().screenGeometry()
+        # 获取屏幕几何信息（使用缓存，分辨率变化时由信号刷新）
+        screen = self._screen_geom
         screen_width = screen.width()
         screen_height = screen.height()
         
@@ -3309,8 +4110,17 @@ class FloatingBall(QWidget):
                 self.cache_cleaning_timer.stop()
                 self.cache_cleaning_timer = None
         
-        self.update()  # 触发重绘
+        # 清理进度只影响圆环区域，局部重绘避免100ms级的全窗口刷新
+        self.update(self._ring_update_region())
     
+    def _ring_update_region(self):
+        """圆环及其发光/中心文本覆盖的局部区域（供清理进度的局部重绘使用）"""
+        center_x = self.window_width // 2
+        radius = 22
+        y1 = 64
+        glow = radius + 6
+        return QRect(center_x - glow, y1 - 8, glow * 2, 2 * radius + 20)
+
     def _clean_system_working_set(self):
         """清理系统工作集"""
         try:
@@ -3749,15 +4559,28 @@ class FloatingBall(QWidget):
         
         menu.exec_(position)
         
+    def _get_run_key(self):
+        """获取HKCU\...\Run键句柄（懒打开并缓存，避免每次切换重复开关键）"""
+        if self._run_key is None:
+            self._run_key = winreg.OpenKey(winreg.HKEY_CURRENT_USER,
+                                           r'SOFTWARE\Microsoft\Windows\CurrentVersion\Run',
+                                           0, winreg.KEY_READ | winreg.KEY_SET_VALUE)
+        return self._run_key
+
+    def _close_run_key(self):
+        """关闭缓存的注册表键句柄"""
+        if self._run_key is not None:
+            try:
+                winreg.CloseKey(self._run_key)
+            except OSError:
+                pass
+            self._run_key = None
+
     def check_startup(self):
         """检查程序是否已设置开机自启动"""
         try:
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
-                                r'SOFTWARE\Microsoft\Windows\CurrentVersion\Run',
-                                0, winreg.KEY_READ)
             # 尝试获取键值
-            value, _ = winreg.QueryValueEx(key, "小浩悬浮球")
-            winreg.CloseKey(key)
+            value, _ = winreg.QueryValueEx(self._get_run_key(), "小浩悬浮球")
             logger.debug("检查开机自启动: 已设置")
             return True
         except OSError:
@@ -3767,9 +4590,7 @@ class FloatingBall(QWidget):
     def set_startup(self, enable):
         """设置或取消开机自启动"""
         try:
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
-                                r'SOFTWARE\Microsoft\Windows\CurrentVersion\Run',
-                                0, winreg.KEY_SET_VALUE)
+            key = self._get_run_key()
             
             if enable:
                 # 获取当前程序的路径 - 适配PyInstaller打包后的情况
@@ -3792,8 +4613,6 @@ class FloatingBall(QWidget):
                 except OSError:
                     # 如果键不存在，忽略错误
                     pass
-            
-            winreg.CloseKey(key)
         except Exception as e:
             print(f"设置开机自启动时出错: {e}")
     
@@ -4100,6 +4919,8 @@ class FloatingBall(QWidget):
             global CUSTOM_NON_GAME_PROCESSES, CUSTOM_NON_GAME_TITLE_KEYWORDS
             CUSTOM_NON_GAME_PROCESSES = set(self.settings.get("custom_non_game_processes", []))
             CUSTOM_NON_GAME_TITLE_KEYWORDS = set(self.settings.get("custom_non_game_titles", []))
+            # 自定义名单变化后重建合并集合与标题匹配正则
+            _rebuild_custom_filter_caches()
             
             # 更新HUD跟随配置
             if hasattr(self, 'overlay_hud') and self.overlay_hud is not None:
@@ -4110,7 +4931,8 @@ class FloatingBall(QWidget):
                 except Exception:
                     pass
             
-            # 刷新托盘图标状态
+            # 刷新托盘图标状态（颜色设置可能变化，作废图标缓存）
+            self._tray_icon_cache.clear()
             self.update_tray_icon()
         except Exception as e:
             print(f"应用配置失败: {e}")
@@ -4135,16 +4957,29 @@ class FloatingBall(QWidget):
             print(f"保存配置失败: {e}")
         
     def format_speed(self, bytes_per_sec):
-        """格式化网络速度显示"""
-        # 小于1KB/s
+        """格式化网络速度显示（按显示精度分桶后做有界缓存，空闲时长期命中0值）"""
+        # 先按最终显示精度取整，使浮点抖动落入同一缓存键
         if bytes_per_sec < 1024:
-            return f"{bytes_per_sec:.0f} B/s"
-        # 小于1MB/s
+            key = round(bytes_per_sec)
         elif bytes_per_sec < 1024 * 1024:
-            return f"{bytes_per_sec / 1024:.1f} KB/s"
+            key = round(bytes_per_sec / 1024 * 10) + (1 << 30)
+        else:
+            key = round(bytes_per_sec / (1024 * 1024) * 10) + (1 << 31)
+        return self._format_speed_cached(key)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _format_speed_cached(key):
+        """按分桶键格式化速度字符串"""
+        # 小于1KB/s
+        if key < (1 << 30):
+            return f"{key:.0f} B/s"
+        # 小于1MB/s
+        elif key < (1 << 31):
+            return f"{(key - (1 << 30)) / 10:.1f} KB/s"
         # 小于1GB/s
         else:
-            return f"{bytes_per_sec / (1024 * 1024):.1f} MB/s"
+            return f"{(key - (1 << 31)) / 10:.1f} MB/s"
     
     def update_tray_icon(self):
         """更新任务栏显示"""
@@ -4160,21 +4995,35 @@ class FloatingBall(QWidget):
         except Exception:
             pass
         
+        # 判断是显示温度还是FPS（支持设置开关）
+        show_fps_enabled = bool(self.settings.get("show_fps", True))
+        fps_only_in_game = bool(self.settings.get("fps_only_in_game", True))
+        should_show_fps = show_fps_enabled and self.fps > 0 and (not fps_only_in_game or self.is_gaming)
+
+        # 图标按显示值缓存：同一整数温度/FPS直接复用已渲染的QIcon
+        icon_key = ('fps', self.fps) if should_show_fps else ('temp', int(self.gpu_temp))
+        icon = self._tray_icon_cache.get(icon_key)
+        if icon is None:
+            icon = self._render_tray_icon(should_show_fps)
+            if len(self._tray_icon_cache) > 256:
+                self._tray_icon_cache.clear()
+            self._tray_icon_cache[icon_key] = icon
+        self.tray_icon.setIcon(icon)
+
+        self._update_tray_tooltip(should_show_fps)
+
+    def _render_tray_icon(self, should_show_fps):
+        """渲染托盘图标（仅在缓存未命中时调用）"""
         icon_size = 16
         pixmap = QPixmap(icon_size, icon_size)
         pixmap.fill(Qt.transparent)  # 设置透明背景
-        
+
         painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
-        
-        # 设置字体
-        font = QFont("Arial", 8, QFont.Bold)
-        painter.setFont(font)
-        
-        # 判断是显示温度还是FPS（支持设置开关）
-        show_fps_enabled = bool(self.settings.get("show_fps", True))
-        fps_only_in_game = bool(self.settings.get("fps_only_in_game", True))
-        should_show_fps = show_fps_enabled and self.fps > 0 and (not fps_only_in_game or self.is_gaming)
+
+        # 设置字体（复用缓存的字体对象）
+        painter.setFont(self._tray_font)
+
         if should_show_fps:
             # FPS显示模式
             # 根据用户设置的颜色选择不同的颜色
@@ -4188,56 +5037,66 @@ class FloatingBall(QWidget):
                 fps_color = _color_with_alpha_hex(mid_hex, 200)
             else:
                 fps_color = _color_with_alpha_hex(low_hex, 200)
-            painter.setPen(QPen(fps_color))
+            self._tray_pen.setColor(fps_color)
+            painter.setPen(self._tray_pen)
             
             # 绘制FPS文本（只显示数字，避免太长）
             fps_text = f"{self.fps}"
-            text_rect = painter.fontMetrics().boundingRect(fps_text)
-            
-            # 居中绘制文本
-            x = (icon_size - text_rect.width()) // 2
-            y = (icon_size + text_rect.height()) // 2
+            x, y = self._tray_text_xy(fps_text, icon_size)
             painter.drawText(x, y, fps_text)
         else:
             # 温度显示模式
             # 设置文本颜色（根据温度变化）
             temp_color = self.get_gradient_color(min(self.gpu_temp / 100, 1.0))
-            painter.setPen(QPen(temp_color))
+            self._tray_pen.setColor(temp_color)
+            painter.setPen(self._tray_pen)
             
             # 绘制温度文本
             temp_text = f"{int(self.gpu_temp)}°"
-            text_rect = painter.fontMetrics().boundingRect(temp_text)
-            
-            # 居中绘制文本
-            x = (icon_size - text_rect.width()) // 2
-            y = (icon_size + text_rect.height()) // 2
+            x, y = self._tray_text_xy(temp_text, icon_size)
             painter.drawText(x, y, temp_text)
         
         painter.end()
-        
-        # 设置托盘图标
-        self.tray_icon.setIcon(QIcon(pixmap))
-        
+
+        return QIcon(pixmap)
+
+    def _tray_text_xy(self, text, icon_size):
+        """计算托盘文本的居中坐标；字体固定，按文本内容缓存度量结果"""
+        pos = self._tray_text_pos.get(text)
+        if pos is None:
+            rect = self._tray_fm.boundingRect(text)
+            pos = ((icon_size - rect.width()) // 2,
+                   (icon_size + rect.height()) // 2)
+            if len(self._tray_text_pos) > 512:
+                self._tray_text_pos.clear()
+            self._tray_text_pos[text] = pos
+        return pos
+
+    def _update_tray_tooltip(self, should_show_fps):
+        """更新托盘提示文本，内容未变化时跳过setToolTip调用"""
         # 设置托盘提示，增加网络速度显示
         formatted_down_speed = self.format_speed(self.down_speed)
         formatted_up_speed = self.format_speed(self.up_speed)
-        
+
         # 根据游戏状态调整提示文本
         if should_show_fps:
             cpu_temp_display = f"{int(self.cpu_temp)}°C" if isinstance(self.cpu_temp, (int, float)) else "--"
             gpu_temp_display = f"{int(self.gpu_temp)}°C" if self.gpu_temp > 0 else "--"
-            self.tray_icon.setToolTip(f"当前游戏FPS: {self.fps}\n" \
-                                    f"CPU使用率: {int(self.cpu_usage)}%  CPU温度: {cpu_temp_display}\n" \
-                                    f"GPU使用率: {int(self.gpu_load)}%  GPU温度: {gpu_temp_display}\n" \
-                                    f"下载速度: {formatted_down_speed}\n" \
-                                    f"上传速度: {formatted_up_speed}")
+            tooltip = (f"当前游戏FPS: {self.fps}\n"
+                       f"CPU使用率: {int(self.cpu_usage)}%  CPU温度: {cpu_temp_display}\n"
+                       f"GPU使用率: {int(self.gpu_load)}%  GPU温度: {gpu_temp_display}\n"
+                       f"下载速度: {formatted_down_speed}\n"
+                       f"上传速度: {formatted_up_speed}")
         else:
             cpu_temp_display = f"{int(self.cpu_temp)}°C" if isinstance(self.cpu_temp, (int, float)) else "--"
-            self.tray_icon.setToolTip(f"GPU温度: {int(self.gpu_temp)}°C\n" \
-                                    f"CPU使用率: {int(self.cpu_usage)}%  CPU温度: {cpu_temp_display}\n" \
-                                    f"GPU使用率: {int(self.gpu_load)}%\n" \
-                                    f"下载速度: {formatted_down_speed}\n" \
-                                    f"上传速度: {formatted_up_speed}")
+            tooltip = (f"GPU温度: {int(self.gpu_temp)}°C\n"
+                       f"CPU使用率: {int(self.cpu_usage)}%  CPU温度: {cpu_temp_display}\n"
+                       f"GPU使用率: {int(self.gpu_load)}%\n"
+                       f"下载速度: {formatted_down_speed}\n"
+                       f"上传速度: {formatted_up_speed}")
+        if tooltip != self._last_tooltip:
+            self._last_tooltip = tooltip
+            self.tray_icon.setToolTip(tooltip)
         
 class GameOverlayHUD(QWidget):
     def __init__(self, settings=None):
@@ -4879,6 +5738,12 @@ if __name__ == "__main__":
         logger.info("开始创建FloatingBall实例...")
         floating_ball = FloatingBall()
         logger.info("FloatingBall实例创建成功")
+
+        # 退出时停止监控线程，避免托盘"退出"直接终止导致线程悬挂
+        try:
+            app.aboutToQuit.connect(floating_ball.shutdown_worker)
+        except Exception:
+            pass
         
         logger.info("开始显示悬浮球窗口...")
         floating_ball.show()